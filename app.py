@@ -291,6 +291,7 @@ if 'dados' not in st.session_state or st.session_state.dados is None or len(st.s
 else:
     from modules.data_loader import filter_last_n_days, GRUPOS_ANIMAIS
     from modules import statistics as stats
+    from modules import significancia
     import pandas as pd
     
     df = st.session_state.dados
@@ -317,6 +318,35 @@ else:
     
     st.divider()
     
+    # Alertas gravados pelas regras a cada inserção no Processador
+    from modules.database import load_alertas
+    from modules import alertas
+    
+    st.subheader("🚨 Alertas Recentes")
+    alertas_recentes = load_alertas(limite=10)
+    if len(alertas_recentes) > 0:
+        for _, alerta in alertas_recentes.iterrows():
+            st.markdown(f"**{alerta['data'].strftime('%d/%m/%Y')} {alerta['horario']}** · {alerta['descricao']}")
+    else:
+        st.info("Nenhum alerta disparado ainda. As regras são avaliadas a cada inserção no ✨ Processador.")
+    
+    with st.expander("📜 Regras de alerta"):
+        st.dataframe(
+            alertas.get_tabela_regras().rename(columns={
+                'regra': 'Regra',
+                'tipo': 'Tipo',
+                'condicao': 'Condição',
+                'limite': 'Limite',
+                'valor': 'Número',
+                'loteria': 'Loteria',
+                'modo': 'Prêmios'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    st.divider()
+    
     # Top Rankings
     st.subheader("🏆 Rankings dos Últimos 30 Dias")
     
@@ -326,9 +356,17 @@ else:
         st.markdown("#### 🎯 Top 5 Grupos")
         grupos_freq = stats.get_grupo_frequency(df_30d, top_n=5)
         if len(grupos_freq) > 0:
+            resumo = significancia.get_resumo_significancia(
+                significancia.get_significancia(df_30d, tipos=['grupo'], por_loteria=False)
+            )
+            if len(resumo) > 0:
+                teste = resumo.iloc[0]
+                st.caption(f"{teste['selo']} (p = {teste['p_valor']:.3f})")
+            n_grupos = int(df_30d['grupo'].between(1, 25).sum())
+            z_grupos = significancia.get_z_score(grupos_freq['frequencia'], n_grupos, 25)
             for i, row in grupos_freq.iterrows():
                 emoji = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"][min(i, 4)]
-                st.markdown(f"{emoji} **{row['grupo']:02d}** - {row['animal']} ({row['frequencia']}x)")
+                st.markdown(f"{emoji} **{row['grupo']:02d}** - {row['animal']} ({row['frequencia']}x) {significancia.get_selo_z(z_grupos[i], n_grupos, 25, comparacoes=25)}")
         else:
             st.info("Sem dados")
     
@@ -336,9 +374,10 @@ else:
         st.markdown("#### 💯 Top 5 Centenas")
         centenas_freq = stats.get_centena_frequency(df_30d, top_n=5)
         if len(centenas_freq) > 0:
+            z_centenas = significancia.get_z_score(centenas_freq['frequencia'], len(df_30d), 1000)
             for i, row in centenas_freq.iterrows():
                 emoji = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"][min(i, 4)]
-                st.markdown(f"{emoji} **{row['centena_fmt']}** ({row['frequencia']}x)")
+                st.markdown(f"{emoji} **{row['centena_fmt']}** ({row['frequencia']}x) {significancia.get_selo_z(z_centenas[i], len(df_30d), 1000, comparacoes=1000)}")
         else:
             st.info("Sem dados")
     
@@ -346,12 +385,15 @@ else:
         st.markdown("#### 🎰 Top 5 Milhares")
         milhares_freq = stats.get_milhar_frequency(df_30d, top_n=5)
         if len(milhares_freq) > 0:
+            z_milhares = significancia.get_z_score(milhares_freq['frequencia'], len(df_30d), 10000)
             for i, row in milhares_freq.iterrows():
                 emoji = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"][min(i, 4)]
-                st.markdown(f"{emoji} **{row['milhar_fmt']}** ({row['frequencia']}x)")
+                st.markdown(f"{emoji} **{row['milhar_fmt']}** ({row['frequencia']}x) {significancia.get_selo_z(z_milhares[i], len(df_30d), 10000, comparacoes=10000)}")
         else:
             st.info("Sem dados")
     
+    st.caption("🔥/❄️ = frequência muito acima/abaixo do esperado se todos os números fossem igualmente prováveis, já descontada a escolha do top 5 entre todos os números (Bonferroni). Sem selo quando a amostra é pequena demais, como nas centenas e milhares de 30 dias.")
+    
     st.divider()
     
     # Gráficos
@@ -0,0 +1,144 @@
+"""
+Módulo de agrupamentos de grupos - linhas, colunas, quadrantes e conjuntos personalizados
+Cada esquema é uma tabela de 26 posições (índice = grupo) com a classe do grupo
+"""
+import numpy as np
+import pandas as pd
+
+from modules.data_loader import GRUPOS_ANIMAIS
+
+def criar_esquema(nome: str, conjuntos: dict) -> dict:
+    """
+    Cria um esquema de agrupamento a partir de conjuntos de grupos.
+    Grupos fora de todos os conjuntos ficam sem classe e não entram na contagem.
+
+    Args:
+        nome: Nome exibido do esquema
+        conjuntos: Dict {rótulo: lista de grupos (1-25)}
+
+    Returns:
+        Dict com 'nome', 'rotulos', 'mapa' (26 posições, -1 = sem classe) e
+        'tamanhos' (quantidade de grupos em cada classe)
+
+    Raises:
+        ValueError: Se houver grupo inválido ou presente em mais de um conjunto
+    """
+    mapa = np.full(26, -1, dtype=np.int64)
+
+    for classe, (rotulo, grupos) in enumerate(conjuntos.items()):
+        for grupo in grupos:
+            if not 1 <= grupo <= 25:
+                raise ValueError(f"Grupo inválido em '{rotulo}': {grupo}")
+            if mapa[grupo] >= 0:
+                raise ValueError(f"Grupo {grupo:02d} aparece em mais de um conjunto")
+            mapa[grupo] = classe
+
+    rotulos = list(conjuntos.keys())
+    tamanhos = np.bincount(mapa[mapa >= 0], minlength=len(rotulos))
+    return {'nome': nome, 'rotulos': rotulos, 'mapa': mapa, 'tamanhos': tamanhos}
+
+# Posição de cada grupo na grade 5x5 (linha e coluna 0-4)
+_LINHA_GRADE = (np.arange(25) // 5)
+_COLUNA_GRADE = (np.arange(25) % 5)
+
+def _quadrante(linha: int, coluna: int) -> str:
+    """Quadrante da grade 5x5; a linha e a coluna do meio formam o centro"""
+    if linha == 2 or coluna == 2:
+        return 'Centro'
+    vertical = 'Superior' if linha < 2 else 'Inferior'
+    horizontal = 'esquerdo' if coluna < 2 else 'direito'
+    return f"{vertical} {horizontal}"
+
+# Esquemas fixos (conjuntos personalizados são passados direto como dicts de criar_esquema)
+ESQUEMAS = {
+    'linhas': criar_esquema('Linhas', {
+        f"Linha {i + 1} ({i * 5 + 1:02d}-{i * 5 + 5:02d})": list(range(i * 5 + 1, i * 5 + 6))
+        for i in range(5)
+    }),
+    'colunas': criar_esquema('Colunas', {
+        f"Coluna {j + 1}": [g + 1 for g in range(25) if _COLUNA_GRADE[g] == j]
+        for j in range(5)
+    }),
+    'quadrantes': criar_esquema('Quadrantes', {
+        rotulo: [g + 1 for g in range(25) if _quadrante(_LINHA_GRADE[g], _COLUNA_GRADE[g]) == rotulo]
+        for rotulo in ['Superior esquerdo', 'Superior direito', 'Centro', 'Inferior esquerdo', 'Inferior direito']
+    }),
+}
+
+def get_grupos_classe(esquema: dict, classe: int) -> list:
+    """Grupos (1-25) que pertencem à classe"""
+    return np.flatnonzero(esquema['mapa'] == classe).tolist()
+
+def get_descricao_classe(esquema: dict, classe: int) -> str:
+    """Ex: 'Linha 1 (01-05): Avestruz, Águia, Burro, Borboleta, Cachorro'"""
+    grupos = get_grupos_classe(esquema, classe)
+    return f"{esquema['rotulos'][classe]}: " + ", ".join(GRUPOS_ANIMAIS[g] for g in grupos)
+
+def contar_esquema(grupos, esquema: dict) -> np.ndarray:
+    """Frequência de cada classe do esquema com um único np.bincount"""
+    grupos = np.asarray(grupos, dtype=np.int64)
+    grupos = grupos[(grupos >= 1) & (grupos <= 25)]
+    classes = esquema['mapa'][grupos]
+    return np.bincount(classes[classes >= 0], minlength=len(esquema['rotulos']))
+
+def get_frequencia_esquemas(df: pd.DataFrame, esquemas: list = None, janelas: list = None) -> pd.DataFrame:
+    """
+    Frequência das classes de vários esquemas em várias janelas de uma só vez.
+
+    As janelas são os últimos N dias com resultados. Primeiro é montada a matriz
+    (dias x 25 grupos) com um bincount e a soma acumulada dá a contagem de cada
+    janela; depois todos os esquemas saem de um único produto de matrizes com a
+    matriz de pertinência (25 grupos x classes de todos os esquemas).
+
+    Args:
+        df: DataFrame (normalmente de uma loteria)
+        esquemas: Chaves de ESQUEMAS ou dicts de criar_esquema (padrão: todos de ESQUEMAS)
+        janelas: Quantidades de dias (padrão: [5])
+
+    Returns:
+        DataFrame com esquema, classe, rotulo, grupos, janela, frequencia,
+        percentual e esperado (% se todos os grupos fossem igualmente prováveis)
+    """
+    if df is None or len(df) == 0:
+        return pd.DataFrame()
+
+    esquemas = [ESQUEMAS[e] if isinstance(e, str) else e for e in (esquemas or list(ESQUEMAS))]
+    janelas = sorted(set(janelas or [5]))
+
+    # Contagem por (dia, grupo), do dia mais recente para o mais antigo
+    dias = pd.to_datetime(df['data']).to_numpy().astype('datetime64[D]').astype(np.int64)
+    grupos = df['grupo'].to_numpy(dtype=np.int64)
+    validos = (grupos >= 1) & (grupos <= 25)
+    dias_unicos, posicao = np.unique(-dias[validos], return_inverse=True)
+    contagem = np.bincount(posicao * 25 + grupos[validos] - 1, minlength=len(dias_unicos) * 25)
+    acumulado = np.vstack([np.zeros(25, dtype=np.int64), np.cumsum(contagem.reshape(-1, 25), axis=0)])
+    por_janela = acumulado[np.minimum(janelas, len(dias_unicos))]  # (janelas x 25)
+
+    # Matriz de pertinência de todos os esquemas lado a lado
+    n_classes = [len(e['rotulos']) for e in esquemas]
+    deslocamento = np.concatenate(([0], np.cumsum(n_classes)[:-1]))
+    pertinencia = np.zeros((25, sum(n_classes)), dtype=np.int64)
+    for esquema, inicio in zip(esquemas, deslocamento):
+        mapa = esquema['mapa'][1:]
+        com_classe = np.flatnonzero(mapa >= 0)
+        pertinencia[com_classe, inicio + mapa[com_classe]] = 1
+
+    frequencias = por_janela @ pertinencia  # (janelas x classes)
+    totais = por_janela.sum(axis=1)
+
+    partes = []
+    for esquema, inicio, n in zip(esquemas, deslocamento, n_classes):
+        for j, janela in enumerate(janelas):
+            freq = frequencias[j, inicio:inicio + n]
+            partes.append(pd.DataFrame({
+                'esquema': esquema['nome'],
+                'classe': np.arange(n),
+                'rotulo': esquema['rotulos'],
+                'grupos': [', '.join(f"{g:02d}" for g in get_grupos_classe(esquema, c)) for c in range(n)],
+                'janela': janela,
+                'frequencia': freq,
+                'percentual': (freq / max(totais[j], 1) * 100).round(1),
+                'esperado': (esquema['tamanhos'] / 25 * 100).round(1),
+            }))
+
+    return pd.concat(partes, ignore_index=True)
@@ -0,0 +1,281 @@
+"""
+Módulo de alertas - regras declaradas como dados e avaliadas a cada inserção
+Os contadores de cada loteria (repetições no dia e última aparição) são atualizados em O(valores)
+e todas as regras de um mesmo tipo são avaliadas de uma vez, sem reprocessar o histórico
+"""
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import MODOS_PREMIO, get_codigos_grupo, selecionar_premios
+from modules.data_loader import encode_dias, GRUPO_ANIMAL
+
+# Tipo de número -> (quantidade de valores possíveis, nome exibido)
+TIPOS_ALERTA = {
+    'grupo': (25, 'Grupo'),
+    'pedra': (10, 'Pedra'),
+    'dezena': (100, 'Dezena'),
+}
+
+# Condição -> rótulo e texto do alerta ({numero}, {metrica}, {loteria})
+CONDICOES = {
+    'repeticoes_dia': {
+        'rotulo': 'Repetições no dia',
+        'texto': "{numero} saiu {metrica}x hoje em {loteria}",
+    },
+    'ausencia_dias': {
+        'rotulo': 'Dias sem sair',
+        'texto': "{numero} está há {metrica} dias sem sair em {loteria}",
+    },
+}
+
+# Regras padrão. loteria None = todas; valor None = qualquer número do tipo.
+# Um alerta dispara quando a métrica atinge o limite (não a cada inserção em que continua acima dele).
+REGRAS_PADRAO = [
+    {'id': 'grupo_3x_dia', 'tipo': 'grupo', 'condicao': 'repeticoes_dia', 'limite': 3, 'valor': None, 'loteria': None, 'modo': 'todos'},
+    {'id': 'grupo_cabeca_2x_dia', 'tipo': 'grupo', 'condicao': 'repeticoes_dia', 'limite': 2, 'valor': None, 'loteria': None, 'modo': 'cabeca'},
+    {'id': 'grupo_ausente_10_dias', 'tipo': 'grupo', 'condicao': 'ausencia_dias', 'limite': 10, 'valor': None, 'loteria': None, 'modo': 'todos'},
+    {'id': 'pedra_ausente_5_dias', 'tipo': 'pedra', 'condicao': 'ausencia_dias', 'limite': 5, 'valor': None, 'loteria': None, 'modo': 'todos'},
+    {'id': 'pedra_7_ausente_5_dias_nacional', 'tipo': 'pedra', 'condicao': 'ausencia_dias', 'limite': 5, 'valor': 7, 'loteria': 'Nacional', 'modo': 'cabeca'},
+    {'id': 'dezena_3x_dia', 'tipo': 'dezena', 'condicao': 'repeticoes_dia', 'limite': 3, 'valor': None, 'loteria': None, 'modo': 'todos'},
+]
+
+def _valores_por_tipo(df: pd.DataFrame) -> dict:
+    """Códigos 0..K-1 de cada tipo (grupo 1-25 vira 0-24; inválidos viram -1)"""
+    milhares = df['milhar'].to_numpy(dtype=np.int64) % 10000
+    return {
+        'grupo': get_codigos_grupo(df),
+        'pedra': milhares // 1000,
+        'dezena': milhares % 100,
+    }
+
+def validar_regras(regras: list) -> list:
+    """
+    Confere as regras e completa os campos opcionais.
+
+    Raises:
+        ValueError: Regra com tipo, condição, modo, limite ou valor inválido, ou id repetido
+    """
+    validas, ids = [], set()
+    for regra in regras:
+        regra = {'valor': None, 'loteria': None, 'modo': 'todos', **regra}
+        if regra.get('id') in ids or not regra.get('id'):
+            raise ValueError(f"Regra sem id ou com id repetido: {regra.get('id')!r}")
+        if regra.get('tipo') not in TIPOS_ALERTA:
+            raise ValueError(f"Tipo inválido na regra '{regra['id']}': {regra.get('tipo')!r}")
+        if regra.get('condicao') not in CONDICOES:
+            raise ValueError(f"Condição inválida na regra '{regra['id']}': {regra.get('condicao')!r}")
+        if regra['modo'] not in MODOS_PREMIO:
+            raise ValueError(f"Modo inválido na regra '{regra['id']}': {regra['modo']!r}")
+        if not isinstance(regra.get('limite'), int) or regra['limite'] < 1:
+            raise ValueError(f"Limite inválido na regra '{regra['id']}': {regra.get('limite')!r}")
+
+        k, _ = TIPOS_ALERTA[regra['tipo']]
+        primeiro = 1 if regra['tipo'] == 'grupo' else 0
+        if regra['valor'] is not None and not primeiro <= regra['valor'] < k + primeiro:
+            raise ValueError(f"Valor fora da faixa na regra '{regra['id']}': {regra['valor']!r}")
+
+        ids.add(regra['id'])
+        validas.append(regra)
+    return validas
+
+def compilar_regras(regras: list) -> dict:
+    """
+    Agrupa as regras por (modo, tipo, condição) em arrays, para que cada grupo
+    seja avaliado com uma única comparação vetorizada.
+
+    Returns:
+        Dict {(modo, tipo, condicao): {'regras', 'loterias', 'todas', 'limites', 'casa_valor'}}
+        onde casa_valor é a matriz (regras x números) dos números que cada regra observa
+    """
+    compiladas = {}
+    for regra in validar_regras(regras):
+        chave = (regra['modo'], regra['tipo'], regra['condicao'])
+        grupo = compiladas.setdefault(chave, {'regras': [], 'loterias': [], 'valores': [], 'limites': []})
+        valor = regra['valor']
+        if valor is not None and regra['tipo'] == 'grupo':
+            valor -= 1
+        grupo['regras'].append(regra)
+        grupo['loterias'].append(regra['loteria'])
+        grupo['valores'].append(-1 if valor is None else valor)
+        grupo['limites'].append(regra['limite'])
+
+    for (_, tipo, _), grupo in compiladas.items():
+        k, _ = TIPOS_ALERTA[tipo]
+        valores = np.array(grupo.pop('valores'), dtype=np.int64)[:, None]
+        grupo['loterias'] = np.array(grupo['loterias'], dtype=object)
+        grupo['todas'] = grupo['loterias'] == None  # noqa: E711 (comparação elemento a elemento)
+        grupo['limites'] = np.array(grupo['limites'], dtype=np.int64)[:, None]
+        grupo['casa_valor'] = (valores == -1) | (valores == np.arange(k))
+    return compiladas
+
+def _contadores_vazios() -> dict:
+    """Contadores de uma loteria/modo ainda sem resultados"""
+    return {
+        'dia': None,
+        'n_dias': 0,
+        'hoje': {tipo: np.zeros(k, dtype=np.int32) for tipo, (k, _) in TIPOS_ALERTA.items()},
+        'ultimo': {tipo: np.full(k, -1, dtype=np.int32) for tipo, (k, _) in TIPOS_ALERTA.items()},
+    }
+
+def _copiar(contadores: dict) -> dict:
+    """Cópia dos contadores (para comparar antes e depois da inserção)"""
+    return {
+        'dia': contadores['dia'],
+        'n_dias': contadores['n_dias'],
+        'hoje': {tipo: valores.copy() for tipo, valores in contadores['hoje'].items()},
+        'ultimo': {tipo: valores.copy() for tipo, valores in contadores['ultimo'].items()},
+    }
+
+def _aplicar(contadores: dict, df_lot: pd.DataFrame):
+    """
+    Avança os contadores com registros de uma loteria, dia a dia (O(valores) por dia).
+    O dia atual é o índice n_dias - 1 entre os dias com resultados da loteria.
+    """
+    dias = encode_dias(df_lot['data'])
+    valores = _valores_por_tipo(df_lot)
+    for dia in np.unique(dias):
+        linhas = dias == dia
+        if dia != contadores['dia']:
+            contadores['dia'] = int(dia)
+            contadores['n_dias'] += 1
+            for hoje in contadores['hoje'].values():
+                hoje[:] = 0
+        atual = contadores['n_dias'] - 1
+        for tipo, (k, _) in TIPOS_ALERTA.items():
+            do_dia = valores[tipo][linhas]
+            do_dia = do_dia[do_dia >= 0]
+            contadores['hoje'][tipo] += np.bincount(do_dia, minlength=k).astype(np.int32)
+            contadores['ultimo'][tipo][do_dia] = atual
+
+def _construir(df_lot: pd.DataFrame) -> dict:
+    """Contadores depois de todo o histórico de uma loteria (np.maximum.at, sem laço por dia)"""
+    contadores = _contadores_vazios()
+    dias, posicao = np.unique(encode_dias(df_lot['data']), return_inverse=True)
+    contadores['dia'] = int(dias[-1])
+    contadores['n_dias'] = len(dias)
+    hoje = posicao == len(dias) - 1
+    for tipo, valores in _valores_por_tipo(df_lot).items():
+        k, _ = TIPOS_ALERTA[tipo]
+        validos = valores >= 0
+        np.maximum.at(contadores['ultimo'][tipo], valores[validos], posicao[validos].astype(np.int32))
+        contadores['hoje'][tipo] = np.bincount(valores[validos & hoje], minlength=k).astype(np.int32)
+    return contadores
+
+def _metricas(contadores: dict, tipo: str, condicao: str, dia: int = None) -> np.ndarray:
+    """
+    Métrica de cada número para a condição.
+
+    repeticoes_dia: vezes que saiu no dia `dia` (0 se os contadores estão em outro dia).
+    ausencia_dias: dias completos com resultados desde a última aparição (0 se saiu hoje).
+    """
+    if condicao == 'repeticoes_dia':
+        if dia is not None and contadores['dia'] != dia:
+            return np.zeros_like(contadores['hoje'][tipo])
+        return contadores['hoje'][tipo]
+    atual = contadores['n_dias'] - 1
+    ultimo = contadores['ultimo'][tipo]
+    return np.where(ultimo == atual, 0, atual - 1 - ultimo).clip(min=0)
+
+def build_alertas(df: pd.DataFrame, regras: list = None) -> dict:
+    """
+    Constrói os contadores das regras a partir do histórico (sem disparar alertas).
+
+    Returns:
+        Dict {'regras' (compiladas), 'loterias': {loteria: {modo: contadores}},
+        'disparados' (DataFrame dos alertas da última inserção)}
+    """
+    indice = {
+        'regras': compilar_regras(REGRAS_PADRAO if regras is None else regras),
+        'loterias': {},
+        'disparados': pd.DataFrame(),
+    }
+    for modo in MODOS_PREMIO:
+        df_sel = selecionar_premios(df, modo)
+        if len(df_sel) == 0:
+            continue
+        for loteria, df_lot in df_sel.groupby('loteria', sort=False):
+            indice['loterias'].setdefault(loteria, {})[modo] = _construir(df_lot)
+    return indice
+
+def _avaliar(regras: dict, loteria: str, modo: str, antes: dict, depois: dict) -> list:
+    """
+    Regras que passaram a valer com a inserção: métrica >= limite depois e < limite antes.
+    Cada grupo (modo, tipo, condição) vira uma comparação regras x números.
+    """
+    disparados = []
+    for (modo_regra, tipo, condicao), grupo in regras.items():
+        if modo_regra != modo:
+            continue
+        da_loteria = grupo['todas'] | (grupo['loterias'] == loteria)
+        if not da_loteria.any():
+            continue
+
+        metrica = _metricas(depois, tipo, condicao)
+        anterior = _metricas(antes, tipo, condicao, dia=depois['dia'])
+        limites = grupo['limites']
+        dispara = da_loteria[:, None] & grupo['casa_valor'] & (metrica >= limites) & (anterior < limites)
+
+        for r, numero in zip(*np.nonzero(dispara)):
+            disparados.append((grupo['regras'][r], int(numero), int(metrica[numero])))
+    return disparados
+
+def _formatar_numero(tipo: str, numero: int) -> str:
+    """Código 0..K-1 -> texto exibido ('Grupo 07 (Carneiro)', 'Pedra 7', 'Dezena 05')"""
+    if tipo == 'grupo':
+        return f"Grupo {numero + 1:02d} ({GRUPO_ANIMAL[numero + 1]})"
+    if tipo == 'dezena':
+        return f"Dezena {numero:02d}"
+    return f"{TIPOS_ALERTA[tipo][1]} {numero}"
+
+def atualizar_alertas(indice: dict, df_novos: pd.DataFrame) -> dict | None:
+    """
+    Aplica os registros recém-inseridos aos contadores e avalia as regras.
+
+    Os alertas disparados ficam em indice['disparados'] (data, loteria, horario,
+    regra, tipo, valor, metrica, descricao). Resultados retroativos retornam None
+    para que os contadores sejam reconstruídos, sem disparar alertas.
+    """
+    disparados = []
+    for modo in MODOS_PREMIO:
+        df_sel = selecionar_premios(df_novos, modo)
+        if len(df_sel) == 0:
+            continue
+        for loteria, df_lot in df_sel.groupby('loteria', sort=False):
+            contadores = indice['loterias'].setdefault(loteria, {}).setdefault(modo, _contadores_vazios())
+            if contadores['dia'] is not None and encode_dias(df_lot['data']).min() < contadores['dia']:
+                return None
+
+            antes = _copiar(contadores)
+            _aplicar(contadores, df_lot)
+            ultima = df_lot.sort_values(['data', 'horario']).iloc[-1]
+            for regra, numero, metrica in _avaliar(indice['regras'], loteria, modo, antes, contadores):
+                disparados.append({
+                    'data': ultima['data'],
+                    'loteria': loteria,
+                    'horario': ultima['horario'],
+                    'regra': regra['id'],
+                    'tipo': regra['tipo'],
+                    'valor': numero + 1 if regra['tipo'] == 'grupo' else numero,
+                    'metrica': metrica,
+                    'descricao': CONDICOES[regra['condicao']]['texto'].format(
+                        numero=_formatar_numero(regra['tipo'], numero), metrica=metrica, loteria=loteria
+                    ),
+                })
+
+    indice['disparados'] = pd.DataFrame(disparados)
+    return indice
+
+def get_tabela_regras(regras: list = None) -> pd.DataFrame:
+    """Regras (padrão: REGRAS_PADRAO) para exibição"""
+    linhas = []
+    for regra in validar_regras(REGRAS_PADRAO if regras is None else regras):
+        linhas.append({
+            'regra': regra['id'],
+            'tipo': TIPOS_ALERTA[regra['tipo']][1],
+            'condicao': CONDICOES[regra['condicao']]['rotulo'],
+            'limite': regra['limite'],
+            'valor': 'Qualquer' if regra['valor'] is None else str(regra['valor']),
+            'loteria': regra['loteria'] or 'Todas',
+            'modo': MODOS_PREMIO[regra['modo']],
+        })
+    return pd.DataFrame(linhas)
@@ -0,0 +1,189 @@
+"""
+Módulo de apostas - conferência vetorizada de apostas contra os resultados e cálculo do retorno
+Todas as apostas são conferidas em todos os sorteios de uma vez (broadcasting com numpy)
+"""
+import re
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import get_chaves_sorteios
+from modules.data_loader import get_grupo_da_milhar
+
+# Prêmios por sorteio (colunas da matriz de resultados)
+PREMIOS_POR_SORTEIO = 5
+
+# Tipo de aposta -> valores possíveis, números por aposta e dígitos na exibição
+TIPOS_APOSTA = {
+    'grupo': {'nome': 'Grupo', 'valores': 25, 'numeros': 1, 'digitos': 2},
+    'dezena': {'nome': 'Dezena', 'valores': 100, 'numeros': 1, 'digitos': 2},
+    'centena': {'nome': 'Centena', 'valores': 1000, 'numeros': 1, 'digitos': 3},
+    'milhar': {'nome': 'Milhar', 'valores': 10000, 'numeros': 1, 'digitos': 4},
+    'duque_grupo': {'nome': 'Duque de grupo', 'valores': 25, 'numeros': 2, 'digitos': 2},
+    'terno_grupo': {'nome': 'Terno de grupo', 'valores': 25, 'numeros': 3, 'digitos': 2},
+}
+
+# Onde a aposta vale: só no 1° prêmio ou do 1° ao 5° (o valor é dividido entre os 5 prêmios)
+ALCANCES = {
+    'cabeca': '1° prêmio (cabeça)',
+    'cercado': '1° ao 5° prêmio',
+}
+
+# Cotações padrão (quantas vezes o valor apostado) - variam de banca para banca
+MULTIPLICADORES = {
+    'grupo': 18,
+    'dezena': 60,
+    'centena': 600,
+    'milhar': 4000,
+    'duque_grupo': 16,
+    'terno_grupo': 150,
+}
+
+def get_matriz_resultados(df: pd.DataFrame) -> tuple:
+    """
+    Monta a matriz de resultados (sorteios x 5 prêmios) com a milhar de cada prêmio.
+    Registros legados (premio=0) não têm posição e ficam de fora.
+
+    Returns:
+        (DataFrame com a chave de cada sorteio, matriz int64 de milhares com -1 onde não há prêmio)
+    """
+    if df is None or len(df) == 0 or 'premio' not in df.columns:
+        return pd.DataFrame(), np.empty((0, PREMIOS_POR_SORTEIO), dtype=np.int64)
+
+    sorteio, chaves = get_chaves_sorteios(df)
+    premios = df['premio'].to_numpy(dtype=np.int64)
+    validos = (premios >= 1) & (premios <= PREMIOS_POR_SORTEIO)
+
+    milhares = np.full((len(chaves), PREMIOS_POR_SORTEIO), -1, dtype=np.int64)
+    milhares[sorteio[validos], premios[validos] - 1] = df['milhar'].to_numpy(dtype=np.int64)[validos] % 10000
+    return chaves, milhares
+
+def get_valores_resultado(milhares: np.ndarray, tipo: str) -> np.ndarray:
+    """Converte a matriz de milhares no valor conferido pelo tipo de aposta (grupos em 1-25)"""
+    ausentes = milhares < 0
+    if tipo in ('grupo', 'duque_grupo', 'terno_grupo'):
+        valores = get_grupo_da_milhar(milhares)
+    else:
+        valores = milhares % TIPOS_APOSTA[tipo]['valores']
+    return np.where(ausentes, -1, valores)
+
+def parse_apostas(texto: str, tipo: str) -> np.ndarray:
+    """
+    Lê as apostas digitadas: uma por linha ou separadas por ';'. Duques e ternos
+    têm os grupos separados por espaço, vírgula ou '-' (ex.: '01-05; 07 12 20').
+    Para os demais tipos, cada número é uma aposta.
+
+    Returns:
+        Matriz int64 (apostas x números por aposta)
+
+    Raises:
+        ValueError: Se algum número estiver fora da faixa do tipo ou a aposta estiver incompleta
+    """
+    config = TIPOS_APOSTA[tipo]
+    n, minimo = config['numeros'], 1 if config['valores'] == 25 else 0
+    maximo = 25 if config['valores'] == 25 else config['valores'] - 1
+
+    if n == 1:
+        partes = [[numero] for numero in re.findall(r'\d+', texto)]
+    else:
+        partes = [re.findall(r'\d+', trecho) for trecho in re.split(r'[;\n]', texto)]
+        partes = [p for p in partes if p]
+
+    apostas = []
+    for numeros in partes:
+        valores = [int(v) for v in numeros]
+        if len(valores) != n or len(set(valores)) != n:
+            raise ValueError(f"{config['nome']} precisa de {n} números distintos: {' '.join(numeros)}")
+        fora = [v for v in valores if not minimo <= v <= maximo]
+        if fora:
+            raise ValueError(f"Número inválido para {config['nome'].lower()}: {fora[0]}")
+        apostas.append(valores)
+
+    return np.array(apostas, dtype=np.int64).reshape(-1, n)
+
+def avaliar_apostas(apostas: np.ndarray, milhares: np.ndarray, tipo: str, alcance: str = 'cabeca',
+                    valor: float = 1.0, multiplicadores: dict = None) -> dict:
+    """
+    Confere todas as apostas em todos os sorteios de uma vez.
+
+    Os valores apostados são deduplicados e cada sorteio vira uma linha de
+    contagens só desses valores (um bincount); o acerto de cada aposta em cada
+    sorteio é um gather nessa matriz, sem laços por aposta ou por sorteio.
+    Duques e ternos de grupo acertam quando todos os grupos saem do 1° ao 5°.
+
+    Args:
+        apostas: Matriz (apostas x números por aposta) - grupos em 1-25
+        milhares: Matriz de resultados (sorteios x 5 prêmios) de get_matriz_resultados
+        tipo: Chave de TIPOS_APOSTA
+        alcance: Chave de ALCANCES (duques e ternos valem sempre do 1° ao 5°)
+        valor: Valor apostado por aposta em cada sorteio
+        multiplicadores: Cotações que substituem as de MULTIPLICADORES
+
+    Returns:
+        Dict com 'acertos' (apostas x sorteios: prêmios acertados, ou 1 para
+        duque/terno completo), 'retorno' (apostas x sorteios: valor recebido)
+        e 'custo' (valor apostado em cada sorteio)
+    """
+    config = TIPOS_APOSTA[tipo]
+    apostas = np.asarray(apostas, dtype=np.int64).reshape(-1, config['numeros'])
+    multiplicador = {**MULTIPLICADORES, **(multiplicadores or {})}[tipo]
+    combinada = config['numeros'] > 1
+    if combinada:
+        alcance = 'cercado'
+
+    if len(apostas) == 0:
+        vazio = np.zeros((0, len(milhares)), dtype=np.int64)
+        return {'acertos': vazio, 'retorno': vazio.astype(float), 'custo': float(valor)}
+
+    valores = get_valores_resultado(milhares, tipo)
+    if alcance == 'cabeca':
+        valores = valores[:, :1]
+    n_sorteios = len(valores)
+
+    # Contagem (sorteios x valores apostados distintos)
+    unicos, posicao_aposta = np.unique(apostas, return_inverse=True)
+    posicao_aposta = posicao_aposta.reshape(apostas.shape)
+    posicao = np.minimum(np.searchsorted(unicos, valores), len(unicos) - 1)
+    confere = (valores >= 0) & (unicos[posicao] == valores)
+    linha = np.broadcast_to(np.arange(n_sorteios)[:, None], valores.shape)
+    contagens = np.bincount(
+        linha[confere] * len(unicos) + posicao[confere], minlength=n_sorteios * len(unicos)
+    ).reshape(n_sorteios, len(unicos))
+
+    por_numero = contagens[:, posicao_aposta]  # (sorteios x apostas x números)
+    if combinada:
+        acertos = (por_numero > 0).all(axis=2).astype(np.int64)
+        premio = multiplicador * valor
+    else:
+        acertos = por_numero[:, :, 0]
+        premio = multiplicador * valor / (PREMIOS_POR_SORTEIO if alcance == 'cercado' else 1)
+
+    acertos = acertos.T
+    return {'acertos': acertos, 'retorno': acertos * premio, 'custo': float(valor)}
+
+def formatar_aposta(numeros, tipo: str) -> str:
+    """Texto da aposta (ex.: '07', '1234', '01-05-12')"""
+    digitos = TIPOS_APOSTA[tipo]['digitos']
+    return '-'.join(f"{int(v):0{digitos}d}" for v in numeros)
+
+def resumir_apostas(apostas: np.ndarray, avaliacao: dict, tipo: str) -> pd.DataFrame:
+    """
+    Resultado de cada aposta no período conferido.
+
+    Returns:
+        DataFrame com aposta, sorteios, sorteios_premiados, retorno, custo, lucro e
+        roi (% sobre o custo), ordenado pelo lucro
+    """
+    apostas = np.asarray(apostas, dtype=np.int64).reshape(len(avaliacao['acertos']), -1)
+    n_sorteios = avaliacao['acertos'].shape[1]
+    custo = avaliacao['custo'] * n_sorteios
+
+    result = pd.DataFrame({
+        'aposta': [formatar_aposta(linha, tipo) for linha in apostas.tolist()],
+        'sorteios': n_sorteios,
+        'sorteios_premiados': (avaliacao['acertos'] > 0).sum(axis=1),
+        'retorno': avaliacao['retorno'].sum(axis=1),
+        'custo': custo,
+    })
+    result['lucro'] = result['retorno'] - result['custo']
+    result['roi'] = result['lucro'] / custo * 100 if custo > 0 else 0.0
+    return result.sort_values('lucro', ascending=False, kind='stable').reset_index(drop=True)
@@ -0,0 +1,166 @@
+"""
+Módulo de atrasos - sorteios desde a última aparição de cada número
+Grupos (25), dezenas (100), centenas (1.000) e milhares (10.000) por loteria
+"""
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import get_chaves_sorteios, selecionar_premios
+
+# Tipo de número -> (quantidade de valores possíveis, dígitos para exibição)
+TIPOS_ATRASO = {
+    'grupo': (25, 2),
+    'dezena': (100, 2),
+    'centena': (1000, 3),
+    'milhar': (10000, 4),
+}
+
+def _valores_por_tipo(df: pd.DataFrame) -> dict:
+    """Códigos 0..K-1 de cada tipo (grupo 1-25 vira 0-24; inválidos viram -1)"""
+    grupos = df['grupo'].to_numpy(dtype=np.int64)
+    milhares = df['milhar'].to_numpy(dtype=np.int64) % 10000
+    return {
+        'grupo': np.where((grupos >= 1) & (grupos <= 25), grupos - 1, -1),
+        'dezena': milhares % 100,
+        'centena': milhares % 1000,
+        'milhar': milhares,
+    }
+
+def _estado_vazio() -> dict:
+    """Estado de uma loteria ainda sem sorteios"""
+    return {
+        'n_sorteios': 0,
+        'ultimo': None,
+        'posicao': {tipo: np.full(k, -1, dtype=np.int32) for tipo, (k, _) in TIPOS_ATRASO.items()},
+        'data': {tipo: np.full(k, -1, dtype=np.int32) for tipo, (k, _) in TIPOS_ATRASO.items()},
+    }
+
+def _registrar(estado: dict, df_lot: pd.DataFrame, posicoes: np.ndarray):
+    """Grava posição e data da última aparição de cada valor (np.maximum.at, sem laço por linha)"""
+    dias = df_lot['data'].to_numpy().astype('datetime64[D]').astype(np.int32)
+    for tipo, valores in _valores_por_tipo(df_lot).items():
+        validos = valores >= 0
+        np.maximum.at(estado['posicao'][tipo], valores[validos], posicoes[validos])
+        np.maximum.at(estado['data'][tipo], valores[validos], dias[validos])
+
+def build_atrasos(df: pd.DataFrame, modo: str = 'todos') -> dict:
+    """
+    Constrói o índice de atrasos de cada loteria em arrays densos.
+    A posição de um sorteio é sua ordem (data, horário) dentro da loteria.
+    
+    Returns:
+        Dict {'modo', 'loterias': {loteria: {'n_sorteios', 'ultimo', 'posicao', 'data'}}}
+        onde posicao/data[tipo] guardam, para cada número, o último sorteio e a data
+        (dias desde 1970) em que apareceu, ou -1 se nunca saiu
+    """
+    indice = {'modo': modo, 'loterias': {}}
+    df_sel = selecionar_premios(df, modo)
+    
+    if len(df_sel) == 0:
+        return indice
+    
+    ids, chaves = get_chaves_sorteios(df_sel)
+    loteria_ids, nomes = pd.factorize(chaves['loteria'])
+    inicio_loteria = np.searchsorted(loteria_ids, np.arange(len(nomes)))
+    
+    for codigo, loteria in enumerate(nomes):
+        linhas = np.flatnonzero(loteria_ids[ids] == codigo)
+        posicoes = (ids[linhas] - inicio_loteria[codigo]).astype(np.int32)
+        fim = np.searchsorted(loteria_ids, codigo, side='right')
+        
+        estado = _estado_vazio()
+        estado['n_sorteios'] = int(fim - inicio_loteria[codigo])
+        estado['ultimo'] = (chaves['data'].iloc[fim - 1], chaves['horario'].iloc[fim - 1])
+        _registrar(estado, df_sel.iloc[linhas], posicoes)
+        indice['loterias'][loteria] = estado
+    
+    return indice
+
+def atualizar_atrasos(indice: dict, df_novos: pd.DataFrame) -> dict | None:
+    """
+    Aplica registros recém-inseridos ao índice de atrasos em O(registros novos).
+    
+    Prêmios que completam o último sorteio já contado ocupam a mesma posição.
+    Resultados retroativos (anteriores ao último sorteio) retornam None para
+    que o índice seja reconstruído.
+    """
+    df_sel = selecionar_premios(df_novos, indice['modo'])
+    if len(df_sel) == 0:
+        return indice
+    
+    ids, chaves = get_chaves_sorteios(df_sel)
+    loterias_chave = chaves['loteria'].to_numpy()
+    
+    for loteria in pd.unique(loterias_chave):
+        sorteios = np.flatnonzero(loterias_chave == loteria)
+        estado = indice['loterias'].get(loteria)
+        if estado is None:
+            estado = _estado_vazio()
+        
+        primeiro = (chaves['data'].iloc[sorteios[0]], chaves['horario'].iloc[sorteios[0]])
+        mesmo_ultimo = estado['ultimo'] is not None and primeiro == estado['ultimo']
+        if estado['ultimo'] is not None and primeiro < estado['ultimo']:
+            return None
+        
+        # Posição de cada novo sorteio, continuando a numeração da loteria
+        base = estado['n_sorteios'] - 1 if mesmo_ultimo else estado['n_sorteios']
+        posicao_sorteio = np.full(len(chaves), -1, dtype=np.int32)
+        posicao_sorteio[sorteios] = base + np.arange(len(sorteios), dtype=np.int32)
+        
+        linhas = np.flatnonzero(np.isin(ids, sorteios))
+        _registrar(estado, df_sel.iloc[linhas], posicao_sorteio[ids[linhas]])
+        
+        estado['n_sorteios'] = int(base + len(sorteios))
+        estado['ultimo'] = (chaves['data'].iloc[sorteios[-1]], chaves['horario'].iloc[sorteios[-1]])
+        indice['loterias'][loteria] = estado
+    
+    return indice
+
+def get_atraso(indice: dict, loteria: str, tipo: str, numero: int) -> int | None:
+    """
+    Atraso (sorteios desde a última aparição) de um número, em O(1).
+    Retorna None se o número nunca saiu na loteria.
+    """
+    estado = indice['loterias'].get(loteria)
+    if estado is None:
+        return None
+    
+    codigo = numero - 1 if tipo == 'grupo' else numero
+    posicao = estado['posicao'][tipo][codigo]
+    if posicao < 0:
+        return None
+    return int(estado['n_sorteios'] - 1 - posicao)
+
+def get_maiores_atrasos(indice: dict, loteria: str, tipo: str, top_n: int = 10) -> pd.DataFrame:
+    """
+    Ranking de "maior atraso" de uma loteria para o tipo informado.
+    Números que nunca saíram aparecem primeiro, com atraso igual ao total de sorteios.
+    """
+    estado = indice['loterias'].get(loteria)
+    if estado is None:
+        return pd.DataFrame()
+    
+    _, digitos = TIPOS_ATRASO[tipo]
+    posicao = estado['posicao'][tipo]
+    atrasos = estado['n_sorteios'] - 1 - posicao.astype(np.int64)
+    atrasos[posicao < 0] = estado['n_sorteios']
+    
+    candidatos = np.argsort(-atrasos, kind='stable')[:top_n]
+    
+    numeros = candidatos + 1 if tipo == 'grupo' else candidatos
+    datas = estado['data'][tipo][candidatos]
+    ultima_data = np.where(datas >= 0, datas.astype('datetime64[D]'), np.datetime64('NaT', 'D'))
+    
+    result = pd.DataFrame({
+        tipo: numeros,
+        'atraso': atrasos[candidatos],
+        'ultima_data': pd.to_datetime(ultima_data),
+    })
+    result['nunca_saiu'] = datas < 0
+    result[f'{tipo}_fmt'] = [f"{n:0{digitos}d}" for n in numeros.tolist()]
+    
+    if tipo == 'grupo':
+        from modules.data_loader import GRUPOS_ANIMAIS
+        result['animal'] = result['grupo'].map(GRUPOS_ANIMAIS)
+    
+    return result
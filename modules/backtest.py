@@ -0,0 +1,321 @@
+"""
+Módulo de backtest - replay do histórico dia a dia para estratégias de fechamento
+Cada dia monta a janela dos últimos N dias, escolhe os palpites e confere nos sorteios do dia seguinte
+"""
+import os
+from math import comb
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.apostas import avaliar_apostas, get_matriz_resultados
+from modules.combinatorics import get_codigos_grupo
+from modules.data_loader import encode_dias, encode_data_horario
+
+# Quantidade de valores por tipo de palpite
+TIPOS_PALPITE = {'grupo': 25, 'pedra': 10}
+
+# Como a janela considera os prêmios: todos, só o 1° (e legados) ou a regra do ciclo
+# (dias 1 e 2 com todos os prêmios, dias 3 em diante só o 1°)
+MODOS_JANELA = {
+    'todos': 'Todos os prêmios',
+    'cabeca': '1° prêmio',
+    'regra': 'Regra do ciclo (dias 1-2 todos, 3-5 só 1°)',
+}
+
+def _score_fechamento(freq: np.ndarray, rep: np.ndarray, params: dict) -> np.ndarray:
+    """Mesmo critério de get_fechamento_grupos: frequência + peso x repetições"""
+    return freq + params.get('peso_rep', 2) * rep
+
+def _score_frequencia(freq: np.ndarray, rep: np.ndarray, params: dict) -> np.ndarray:
+    """Só a frequência na janela"""
+    return freq.astype(float)
+
+def _score_atrasados(freq: np.ndarray, rep: np.ndarray, params: dict) -> np.ndarray:
+    """Os que menos saíram na janela"""
+    return -freq.astype(float)
+
+# Estratégias disponíveis: tipo do palpite, função de score e parâmetros padrão
+ESTRATEGIAS = {
+    'fechamento': {
+        'nome': 'Fechamento (freq + 2×repetições)', 'tipo': 'grupo', 'score': _score_fechamento,
+        'params': {'janela': 5, 'top_n': 5, 'premios': 'regra', 'peso_rep': 2},
+    },
+    'frequencia': {
+        'nome': 'Grupos mais frequentes', 'tipo': 'grupo', 'score': _score_frequencia,
+        'params': {'janela': 5, 'top_n': 5, 'premios': 'regra'},
+    },
+    'atrasados': {
+        'nome': 'Grupos menos frequentes', 'tipo': 'grupo', 'score': _score_atrasados,
+        'params': {'janela': 5, 'top_n': 5, 'premios': 'regra'},
+    },
+    'pedras': {
+        'nome': 'Pedras mais frequentes (milhar)', 'tipo': 'pedra', 'score': _score_frequencia,
+        'params': {'janela': 5, 'top_n': 3, 'premios': 'regra'},
+    },
+}
+
+def _acumular(valores: np.ndarray, indice_dia: np.ndarray, n_dias: int, k: int) -> dict:
+    """
+    Histogramas acumulados por dia de uma sequência de resultados em ordem cronológica.
+    'rep' conta repetições dentro do dia; 'cruz' conta a repetição entre o último
+    resultado de um dia e o primeiro do dia seguinte (atribuída ao dia seguinte).
+    """
+    def acumulado(linhas, vals):
+        contagem = np.bincount(linhas * k + vals, minlength=n_dias * k).reshape(n_dias, k)
+        return np.vstack([np.zeros((1, k), dtype=np.int64), np.cumsum(contagem, axis=0)])
+
+    validos = valores >= 0
+    igual = (valores[1:] == valores[:-1]) & validos[1:]
+    mesmo_dia = indice_dia[1:] == indice_dia[:-1]
+
+    return {
+        'freq': acumulado(indice_dia[validos], valores[validos]),
+        'rep': acumulado(indice_dia[1:][igual & mesmo_dia], valores[1:][igual & mesmo_dia]),
+        'cruz': acumulado(indice_dia[1:][igual & ~mesmo_dia], valores[1:][igual & ~mesmo_dia]),
+    }
+
+def preparar_loteria(df_lot: pd.DataFrame) -> dict:
+    """
+    Pré-processa uma loteria para o replay: histogramas acumulados por dia
+    (todos os prêmios e só 1° prêmio) e os alvos de cada sorteio.
+
+    Returns:
+        Dict com 'dias' (datetime64[D]), 'hist' {(tipo, 'todos'|'cabeca'): acumulados},
+        'sorteio_dia', 'cabeca' {tipo: valor do 1° prêmio ou -1},
+        'presenca' {tipo: matriz bool sorteios x valores} e 'milhares'
+        (matriz de resultados sorteios x 5 prêmios, para o retorno das apostas)
+    """
+    premios = df_lot['premio'].to_numpy(dtype=np.int64) if 'premio' in df_lot.columns else np.zeros(len(df_lot), dtype=np.int64)
+    tempos = encode_data_horario(df_lot['data'], df_lot['horario'])
+    ordem = np.lexsort((premios, tempos))
+    df_lot = df_lot.iloc[ordem]
+    premios, tempos = premios[ordem], tempos[ordem]
+
+    dias, indice_dia = np.unique(encode_dias(df_lot['data']), return_inverse=True)
+    n_dias = len(dias)
+    valores = {
+        'grupo': get_codigos_grupo(df_lot),
+        'pedra': (df_lot['milhar'].to_numpy(dtype=np.int64) % 10000) // 1000,
+    }
+    cabeca = premios <= 1
+
+    hist = {}
+    for tipo, k in TIPOS_PALPITE.items():
+        hist[(tipo, 'todos')] = _acumular(valores[tipo], indice_dia, n_dias, k)
+        hist[(tipo, 'cabeca')] = _acumular(valores[tipo][cabeca], indice_dia[cabeca], n_dias, k)
+
+        # Na regra do ciclo, a emenda entre o dia 3 (só 1°) e o dia 2 (todos) junta o
+        # último 1° prêmio de um dia com o primeiro resultado do dia seguinte
+        ultimo_cabeca = np.full(n_dias, -1, dtype=np.int64)
+        ultimo_cabeca[indice_dia[cabeca]] = valores[tipo][cabeca]
+        primeiro_dia = np.full(n_dias, -1, dtype=np.int64)
+        primeiro_dia[indice_dia[::-1]] = valores[tipo][::-1]
+        emenda = (primeiro_dia[1:] >= 0) & (primeiro_dia[1:] == ultimo_cabeca[:-1])
+        misto = np.zeros((n_dias, k), dtype=np.int64)
+        misto[np.nonzero(emenda)[0] + 1, primeiro_dia[1:][emenda]] = 1
+        hist[(tipo, 'misto')] = {'cruz': np.vstack([np.zeros((1, k), dtype=np.int64), np.cumsum(misto, axis=0)])}
+
+    # Sorteios (data + horário) em ordem cronológica
+    _, primeiro, sorteio = np.unique(tempos, return_index=True, return_inverse=True)
+    n_sorteios = len(primeiro)
+    alvos_cabeca, presenca = {}, {}
+    for tipo, k in TIPOS_PALPITE.items():
+        alvo = np.full(n_sorteios, -1, dtype=np.int64)
+        primeiro_premio = (premios == 1) & (valores[tipo] >= 0)
+        alvo[sorteio[primeiro_premio]] = valores[tipo][primeiro_premio]
+        alvos_cabeca[tipo] = alvo
+
+        matriz = np.zeros((n_sorteios, k), dtype=bool)
+        validos = valores[tipo] >= 0
+        matriz[sorteio[validos], valores[tipo][validos]] = True
+        presenca[tipo] = matriz
+
+    return {
+        'dias': dias.astype('datetime64[D]'),
+        'hist': hist,
+        'sorteio_dia': indice_dia[primeiro],
+        'cabeca': alvos_cabeca,
+        'presenca': presenca,
+        'milhares': get_matriz_resultados(df_lot)[1],
+    }
+
+def _somar_janela(hist: dict, tipo: str, chave: str, janela: int, premios: str, n_dias: int) -> np.ndarray:
+    """
+    Soma de uma estatística na janela que termina em cada dia (todos os dias de uma vez),
+    a partir das diferenças dos acumulados. 'cruz' exclui o dia mais antigo da janela.
+    """
+    fim = np.arange(1, n_dias + 1)
+    inicio = np.maximum(fim - janela, 0) + (1 if chave == 'cruz' else 0)
+    inicio = np.minimum(inicio, fim)
+
+    if premios in ('todos', 'cabeca'):
+        acumulado = hist[(tipo, premios)][chave]
+        return acumulado[fim] - acumulado[inicio]
+
+    # Regra do ciclo: 2 dias mais recentes com todos os prêmios, o resto só 1°
+    corte = np.maximum(fim - 2, inicio)
+    todos = hist[(tipo, 'todos')][chave]
+    cabeca = hist[(tipo, 'cabeca')][chave]
+    if chave != 'cruz':
+        return (todos[fim] - todos[corte]) + (cabeca[corte] - cabeca[inicio])
+
+    # Repetição entre dias: a emenda do dia 2 usa a contagem mista
+    emenda = np.maximum(fim - 1, inicio)
+    misto = hist[(tipo, 'misto')]['cruz']
+    return (todos[fim] - todos[emenda]) + (misto[emenda] - misto[corte]) + (cabeca[corte] - cabeca[inicio])
+
+def _esperado_qualquer_premio(presenca: np.ndarray, top_n: int) -> np.ndarray:
+    """Chance de palpites aleatórios (top_n de K) acertarem algum valor de cada sorteio"""
+    k = presenca.shape[1]
+    distintos = presenca.sum(axis=1)
+    erro = np.array([comb(k - m, top_n) / comb(k, top_n) for m in range(k + 1)])
+    return 1 - erro[distintos]
+
+def executar_backtest(preparado: dict, estrategia: str, params: dict = None, corte=None) -> dict:
+    """
+    Faz o replay de uma estratégia em uma loteria já preparada.
+
+    Os scores de todos os dias saem de uma vez das janelas móveis; os palpites
+    são os top_n de cada dia e são conferidos nos sorteios do dia seguinte com
+    dados: acerto na cabeça (1° prêmio) e em qualquer prêmio do 1° ao 5°.
+
+    Para palpites de grupo, o retorno apostando 1 em cada grupo na cabeça sai
+    do avaliador de apostas: os 25 grupos são conferidos em todos os sorteios
+    e os palpites de cada dia selecionam as linhas.
+
+    Args:
+        preparado: Resultado de preparar_loteria()
+        estrategia: Chave de ESTRATEGIAS
+        params: Parâmetros que substituem os padrões da estratégia
+        corte: Data (opcional) que separa o período de treino (sorteios antes dela)
+               do período de teste (a partir dela), resumidos separadamente
+
+    Returns:
+        Dict com 'resumo' (dias, sorteios, taxas, esperado ao acaso e roi_cabeca),
+        'diario' (DataFrame por dia conferido) e, com corte, 'treino' e 'teste'
+    """
+    config = ESTRATEGIAS[estrategia]
+    params = {**config['params'], **(params or {})}
+    tipo, janela, top_n = config['tipo'], int(params['janela']), int(params['top_n'])
+    k = TIPOS_PALPITE[tipo]
+    n_dias = len(preparado['dias'])
+
+    hist = preparado['hist']
+    freq = _somar_janela(hist, tipo, 'freq', janela, params['premios'], n_dias)
+    rep = (_somar_janela(hist, tipo, 'rep', janela, params['premios'], n_dias)
+           + _somar_janela(hist, tipo, 'cruz', janela, params['premios'], n_dias))
+    scores = config['score'](freq, rep, params)
+
+    # Palpites: top_n de cada dia (empate: menor valor primeiro)
+    palpites = np.argsort(-scores, axis=1, kind='stable')[:, :top_n]
+    escolhidos = np.zeros((n_dias, k), dtype=bool)
+    np.put_along_axis(escolhidos, palpites, True, axis=1)
+
+    # Sorteios conferidos: dia seguinte a uma janela completa
+    dia_palpite = preparado['sorteio_dia'] - 1
+    conferidos = dia_palpite >= janela - 1
+    dia_palpite = dia_palpite[conferidos]
+    alvo = preparado['cabeca'][tipo][conferidos]
+    presenca = preparado['presenca'][tipo][conferidos]
+
+    tem_cabeca = alvo >= 0
+    acerto_cabeca = tem_cabeca & escolhidos[dia_palpite, np.maximum(alvo, 0)]
+    acerto_qualquer = (presenca & escolhidos[dia_palpite]).any(axis=1)
+    esperado_qualquer = _esperado_qualquer_premio(presenca, top_n)
+
+    retorno = None
+    if tipo == 'grupo':
+        todos_grupos = np.arange(1, k + 1)[:, None]
+        por_grupo = avaliar_apostas(todos_grupos, preparado['milhares'][conferidos], 'grupo', 'cabeca')['retorno']
+        retorno = (por_grupo.T * escolhidos[dia_palpite]).sum(axis=1)
+
+    data_sorteio = preparado['dias'][dia_palpite + 1]
+    diario = pd.DataFrame({
+        'data': data_sorteio,
+        'sorteios': 1,
+        'sorteios_cabeca': tem_cabeca.astype(int),
+        'acertos_cabeca': acerto_cabeca.astype(int),
+        'acertos_qualquer': acerto_qualquer.astype(int),
+    }).groupby('data', as_index=False).sum()
+
+    def resumir(mascara: np.ndarray) -> dict:
+        n_sorteios, n_cabeca = int(mascara.sum()), int((tem_cabeca & mascara).sum())
+        resumo = {
+            'dias': len(np.unique(data_sorteio[mascara])),
+            'sorteios': n_sorteios,
+            'taxa_cabeca': acerto_cabeca[mascara].sum() / n_cabeca * 100 if n_cabeca else np.nan,
+            'esperado_cabeca': top_n / k * 100,
+            'taxa_qualquer': acerto_qualquer[mascara].mean() * 100 if n_sorteios else np.nan,
+            'esperado_qualquer': esperado_qualquer[mascara].mean() * 100 if n_sorteios else np.nan,
+        }
+        resumo['lift_cabeca'] = resumo['taxa_cabeca'] / resumo['esperado_cabeca']
+        custo = top_n * n_cabeca
+        resumo['roi_cabeca'] = (retorno[mascara].sum() - custo) / custo * 100 if retorno is not None and custo else np.nan
+        return resumo
+
+    resultado = {'resumo': resumir(np.ones(len(alvo), dtype=bool)), 'diario': diario}
+    if corte is not None:
+        teste = data_sorteio >= np.datetime64(corte, 'D')
+        resultado['treino'] = resumir(~teste)
+        resultado['teste'] = resumir(teste)
+
+    return resultado
+
+def _tarefa_backtest(preparado: dict, estrategia: str, params: dict) -> dict:
+    """Unidade de trabalho do pool de processos"""
+    return executar_backtest(preparado, estrategia, params)
+
+def executar_backtests(df: pd.DataFrame, configuracoes: list, loterias: list = None,
+                       n_processos: int = None) -> tuple:
+    """
+    Executa várias estratégias em várias loterias em paralelo.
+
+    Cada loteria é preparada uma vez; as combinações (loteria, configuração)
+    são distribuídas em um pool de processos.
+
+    Args:
+        df: DataFrame com todos os dados
+        configuracoes: Lista de (chave da estratégia, params) - params pode ser None
+        loterias: Loterias a testar (padrão: todas)
+        n_processos: Processos do pool (padrão: núcleos da máquina; 1 = sem pool)
+
+    Returns:
+        (DataFrame de resumo com uma linha por loteria e configuração,
+         dict {(loteria, índice da configuração): DataFrame diário})
+    """
+    if df is None or len(df) == 0:
+        return pd.DataFrame(), {}
+
+    loterias = loterias or df['loteria'].unique().tolist()
+    preparados = {
+        loteria: preparar_loteria(df_lot)
+        for loteria, df_lot in df[df['loteria'].isin(loterias)].groupby('loteria', sort=False)
+    }
+    tarefas = [
+        (loteria, i, estrategia, params)
+        for loteria in preparados
+        for i, (estrategia, params) in enumerate(configuracoes)
+    ]
+
+    argumentos = ([preparados[t[0]] for t in tarefas], [t[2] for t in tarefas], [t[3] for t in tarefas])
+    n_processos = n_processos or os.cpu_count() or 1
+    if n_processos > 1 and len(tarefas) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_processos, len(tarefas))) as pool:
+            resultados = list(pool.map(_tarefa_backtest, *argumentos))
+    else:
+        resultados = [_tarefa_backtest(*args) for args in zip(*argumentos)]
+
+    linhas, diarios = [], {}
+    for (loteria, i, estrategia, params), resultado in zip(tarefas, resultados):
+        params_efetivos = {**ESTRATEGIAS[estrategia]['params'], **(params or {})}
+        linhas.append({
+            'loteria': loteria,
+            'configuracao': i,
+            'estrategia': ESTRATEGIAS[estrategia]['nome'],
+            'params': ', '.join(f"{chave}={valor}" for chave, valor in params_efetivos.items()),
+            **resultado['resumo'],
+        })
+        diarios[(loteria, i)] = resultado['diario']
+
+    return pd.DataFrame(linhas), diarios
@@ -0,0 +1,248 @@
+"""
+Módulo de busca no histórico - índice invertido de milhares, centenas e dezenas
+"""
+import numpy as np
+import pandas as pd
+from itertools import permutations
+
+from modules.data_loader import encode_data_horario
+
+# Terminações indexadas: quantidade de dígitos finais da milhar -> nome
+TERMINACOES = {1: 'unidade', 2: 'dezena', 3: 'centena', 4: 'milhar'}
+
+# Modos de busca
+MODOS_BUSCA = {
+    'exata': 'Milhar exata',
+    'terminacao': 'Terminação (…45)',
+    'invertida': 'Invertida (permutações)',
+}
+
+def build_indice_busca(df: pd.DataFrame) -> dict:
+    """
+    Constrói o índice invertido número -> linhas do histórico.
+
+    Os registros são ordenados do mais recente para o mais antigo (data, horário,
+    prêmio), de modo que o deslocamento de uma linha também é sua ordem cronológica.
+    Para cada terminação (1 a 4 dígitos) um argsort estável agrupa as linhas por
+    valor e um searchsorted marca o início de cada valor, como em uma matriz CSR.
+
+    Returns:
+        Dict com 'registros' (DataFrame ordenado) e, por número de dígitos,
+        (ordem, limites) onde as linhas do valor v são ordem[limites[v]:limites[v + 1]]
+    """
+    colunas = ['data', 'loteria', 'horario', 'premio', 'grupo', 'centena', 'milhar']
+    if df is None or len(df) == 0:
+        return {'registros': pd.DataFrame(columns=colunas)}
+
+    registros = df[[c for c in colunas if c in df.columns]].copy()
+    if 'premio' not in registros.columns:
+        registros['premio'] = 0
+
+    tempos = encode_data_horario(registros['data'], registros['horario'])
+    ordem_cronologica = np.lexsort((registros['premio'].to_numpy(), -tempos))
+    registros = registros.iloc[ordem_cronologica].reset_index(drop=True)
+    registros['data'] = pd.to_datetime(registros['data'])
+
+    milhares = registros['milhar'].to_numpy(dtype=np.int64) % 10000
+    indice = {'registros': registros}
+
+    for digitos in TERMINACOES:
+        valores = milhares % (10 ** digitos)
+        ordem = np.argsort(valores, kind='stable')
+        limites = np.searchsorted(valores[ordem], np.arange(10 ** digitos + 1))
+        indice[digitos] = (ordem, limites)
+
+    indice['bitmaps'] = _build_bitmaps(registros, milhares)
+
+    return indice
+
+def _linhas_terminacao(indice: dict, numero: str) -> np.ndarray:
+    """Deslocamentos das linhas cuja milhar termina com `numero` (1-4 dígitos)"""
+    ordem, limites = indice[len(numero)]
+    valor = int(numero)
+    return ordem[limites[valor]:limites[valor + 1]]
+
+def buscar_linhas(indice: dict, numero: str, modo: str = 'terminacao') -> np.ndarray:
+    """
+    Retorna os deslocamentos (em ordem cronológica, mais recente primeiro) das
+    linhas que casam com a busca.
+
+    Args:
+        indice: Índice construído por build_indice_busca
+        numero: Dígitos buscados (1 a 4)
+        modo: 'exata' (milhar igual, completada com zeros à esquerda),
+              'terminacao' (milhar termina com os dígitos) ou
+              'invertida' (qualquer permutação dos dígitos como terminação)
+    """
+    numero = numero.strip()
+    if not numero.isdigit() or not 1 <= len(numero) <= 4 or len(indice['registros']) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    if modo == 'exata':
+        return _linhas_terminacao(indice, numero.zfill(4))
+
+    if modo == 'invertida':
+        variacoes = sorted({''.join(p) for p in permutations(numero)})
+        partes = [_linhas_terminacao(indice, v) for v in variacoes]
+        return np.sort(np.concatenate(partes))
+
+    return _linhas_terminacao(indice, numero)
+
+def buscar_numero(indice: dict, numero: str, modo: str = 'terminacao',
+                  loteria: str = None, limite: int = 50) -> pd.DataFrame:
+    """
+    Busca um número no histórico e retorna as aparições mais recentes.
+
+    Returns:
+        DataFrame com data, loteria, horário, prêmio, grupo, centena e milhar
+    """
+    linhas = buscar_linhas(indice, numero, modo)
+    registros = indice['registros']
+
+    if loteria is not None and len(linhas) > 0:
+        linhas = linhas[registros['loteria'].to_numpy()[linhas] == loteria]
+
+    return registros.iloc[linhas[:limite]].reset_index(drop=True)
+
+def get_ultima_aparicao(indice: dict, numero: str, modo: str = 'terminacao', loteria: str = None) -> dict | None:
+    """Retorna o registro mais recente que casa com a busca, ou None se nunca saiu"""
+    resultado = buscar_numero(indice, numero, modo, loteria, limite=1)
+    if len(resultado) == 0:
+        return None
+    return resultado.iloc[0].to_dict()
+
+def contar_aparicoes(indice: dict, numero: str, modo: str = 'terminacao', loteria: str = None) -> int:
+    """Quantidade total de aparições que casam com a busca"""
+    linhas = buscar_linhas(indice, numero, modo)
+    if loteria is not None and len(linhas) > 0:
+        return int((indice['registros']['loteria'].to_numpy()[linhas] == loteria).sum())
+    return len(linhas)
+
+# ========================
+# BUSCA POR PADRÃO (BITMAPS)
+# ========================
+
+def _empacotar(mascara: np.ndarray) -> np.ndarray:
+    """Empacota um array bool em palavras uint64 (1 bit por linha)"""
+    bits = np.packbits(mascara)
+    bits = np.pad(bits, (0, (-len(bits)) % 8))
+    return bits.view(np.uint64)
+
+def _build_bitmaps(registros: pd.DataFrame, milhares: np.ndarray) -> dict:
+    """
+    Constrói, para cada loteria, os 40 bitsets posição x dígito da milhar.
+    bits[p, d] tem o bit i ligado quando a i-ésima milhar da loteria tem o dígito d
+    na posição p (0 = milhar, 3 = unidade).
+
+    Returns:
+        Dict {loteria: (deslocamentos das linhas em registros, bits uint64 [4, 10, palavras])}
+    """
+    digitos = (milhares[:, None] // np.array([1000, 100, 10, 1])) % 10
+    loterias = registros['loteria'].to_numpy()
+    bitmaps = {}
+
+    for loteria in pd.unique(loterias):
+        linhas = np.flatnonzero(loterias == loteria)
+        digitos_lot = digitos[linhas]
+        bits = np.stack([
+            np.stack([_empacotar(digitos_lot[:, posicao] == d) for d in range(10)])
+            for posicao in range(4)
+        ])
+        bitmaps[loteria] = (linhas, bits)
+
+    return bitmaps
+
+def parse_padrao(padrao: str) -> list:
+    """
+    Interpreta um padrão de milhar em 4 conjuntos de dígitos permitidos.
+
+    Sintaxe: dígito fixo (7), coringa (? ou *), conjunto ([147]) ou faixa ([1-3]).
+    Padrões com menos de 4 posições são alinhados à direita (ex: '?4?' vale para
+    a centena). Ex: '7?4?', '[12]??5', '?[0-4]'.
+
+    Returns:
+        Lista com 4 itens: None (qualquer dígito) ou lista de dígitos permitidos
+
+    Raises:
+        ValueError: Se o padrão for inválido
+    """
+    posicoes = []
+    texto = padrao.strip().replace(' ', '')
+    i = 0
+
+    while i < len(texto):
+        caractere = texto[i]
+        if caractere in '?*':
+            posicoes.append(None)
+        elif caractere.isdigit():
+            posicoes.append([int(caractere)])
+        elif caractere == '[':
+            fim = texto.find(']', i)
+            if fim < 0:
+                raise ValueError(f"Colchete não fechado em '{padrao}'")
+            conteudo = texto[i + 1:fim]
+            permitidos = set()
+            j = 0
+            while j < len(conteudo):
+                if j + 2 < len(conteudo) and conteudo[j + 1] == '-':
+                    inicio_faixa, fim_faixa = conteudo[j], conteudo[j + 2]
+                    if not (inicio_faixa.isdigit() and fim_faixa.isdigit()):
+                        raise ValueError(f"Faixa inválida em '{padrao}'")
+                    permitidos.update(range(int(inicio_faixa), int(fim_faixa) + 1))
+                    j += 3
+                elif conteudo[j].isdigit():
+                    permitidos.add(int(conteudo[j]))
+                    j += 1
+                else:
+                    raise ValueError(f"Caractere inválido '{conteudo[j]}' em '{padrao}'")
+            if not permitidos:
+                raise ValueError(f"Conjunto vazio em '{padrao}'")
+            posicoes.append(sorted(permitidos))
+            i = fim
+        else:
+            raise ValueError(f"Caractere inválido '{caractere}' em '{padrao}'")
+        i += 1
+
+    if not 1 <= len(posicoes) <= 4:
+        raise ValueError("O padrão deve ter de 1 a 4 posições")
+
+    return [None] * (4 - len(posicoes)) + posicoes
+
+def buscar_padrao(indice: dict, padrao: str, loteria: str, desde=None, limite: int = 200) -> pd.DataFrame:
+    """
+    Retorna as milhares de uma loteria que casam com o padrão (ex: '7?4?').
+
+    Cada posição vira um OR dos bitsets dos dígitos permitidos e as posições são
+    combinadas com AND, palavra a palavra (64 milhares por operação).
+
+    Args:
+        indice: Índice construído por build_indice_busca
+        padrao: Padrão no formato de parse_padrao
+        loteria: Loteria pesquisada
+        desde: Data mínima (opcional) para restringir o período
+        limite: Quantidade máxima de linhas retornadas (mais recentes primeiro)
+
+    Raises:
+        ValueError: Se o padrão for inválido
+    """
+    posicoes = parse_padrao(padrao)
+    registros = indice['registros']
+
+    if loteria not in indice.get('bitmaps', {}):
+        return registros.iloc[0:0]
+
+    linhas, bits = indice['bitmaps'][loteria]
+    resultado = np.full(bits.shape[2], np.iinfo(np.uint64).max, dtype=np.uint64)
+
+    for posicao, permitidos in enumerate(posicoes):
+        if permitidos is not None:
+            resultado &= np.bitwise_or.reduce(bits[posicao, permitidos], axis=0)
+
+    casados = np.flatnonzero(np.unpackbits(resultado.view(np.uint8))[:len(linhas)])
+    casados = linhas[casados]
+
+    if desde is not None and len(casados) > 0:
+        datas = registros['data'].to_numpy()[casados]
+        casados = casados[datas >= np.datetime64(pd.Timestamp(desde))]
+
+    return registros.iloc[casados[:limite]].reset_index(drop=True)
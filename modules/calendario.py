@@ -0,0 +1,174 @@
+"""
+Módulo de sazonalidade - contagens de grupos e pedras por dia da semana, semana do ano e mês
+"""
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import get_codigos_grupo, selecionar_premios
+from modules.data_loader import encode_dias
+
+# Dimensão do calendário -> rótulos de cada posição
+DIMENSOES = {
+    'dia_semana': ['Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb', 'Dom'],
+    'semana': [f"S{s:02d}" for s in range(1, 54)],
+    'mes': ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez'],
+}
+
+# Tipo de contagem -> rótulos das colunas (pedra = primeiro dígito da milhar)
+TIPOS_CALENDARIO = {
+    'grupo': [f"{g:02d}" for g in range(1, 26)],
+    'pedra': [str(d) for d in range(10)],
+}
+
+def get_posicoes_calendario(dias: np.ndarray) -> dict:
+    """
+    Posição de cada dia (inteiro desde 1970-01-01) em cada dimensão do calendário.
+    A semana do ano conta blocos de 7 dias a partir de 1° de janeiro (1-53).
+    """
+    dias = np.asarray(dias, dtype=np.int64)
+    datas = dias.astype('datetime64[D]')
+    inicio_ano = datas.astype('datetime64[Y]').astype('datetime64[D]').astype(np.int64)
+    return {
+        'dia_semana': (dias + 3) % 7,  # 01/01/1970 foi uma quinta-feira
+        'semana': (dias - inicio_ano) // 7,
+        'mes': datas.astype('datetime64[M]').astype(np.int64) % 12,
+    }
+
+def _contar(df: pd.DataFrame) -> dict:
+    """
+    Contagens de um DataFrame de uma loteria em todas as dimensões.
+
+    As contagens por linha saem de um bincount sobre (dia, valor); as dimensões
+    do calendário são calculadas só para os dias distintos e acumuladas com np.add.at.
+    """
+    dias = encode_dias(df['data'])
+    dias_unicos, posicao = np.unique(dias, return_inverse=True)
+    valores = {
+        'grupo': get_codigos_grupo(df),
+        'pedra': (df['milhar'].to_numpy(dtype=np.int64) % 10000) // 1000,
+    }
+
+    por_dia = {}
+    for tipo, rotulos in TIPOS_CALENDARIO.items():
+        n = len(rotulos)
+        validos = valores[tipo] >= 0
+        contagem = np.bincount(posicao[validos] * n + valores[tipo][validos], minlength=len(dias_unicos) * n)
+        por_dia[tipo] = contagem.reshape(len(dias_unicos), n)
+
+    posicoes = get_posicoes_calendario(dias_unicos)
+    contagens = {'dias': dias_unicos}
+    for dimensao, rotulos in DIMENSOES.items():
+        contagens[dimensao] = {'n_dias': np.bincount(posicoes[dimensao], minlength=len(rotulos))}
+        for tipo, rotulos_tipo in TIPOS_CALENDARIO.items():
+            tabela = np.zeros((len(rotulos), len(rotulos_tipo)), dtype=np.int64)
+            np.add.at(tabela, posicoes[dimensao], por_dia[tipo])
+            contagens[dimensao][tipo] = tabela
+
+    return contagens
+
+def build_calendario(df: pd.DataFrame, modo: str = 'todos') -> dict:
+    """
+    Constrói as contagens de sazonalidade de cada loteria no histórico completo.
+
+    Returns:
+        Dict {'modo', 'loterias': {loteria: {'dias', dimensao: {'n_dias', 'grupo', 'pedra'}}}}
+        onde 'n_dias' conta os dias com resultados em cada posição da dimensão
+    """
+    indice = {'modo': modo, 'loterias': {}}
+    df_sel = selecionar_premios(df, modo)
+
+    if len(df_sel) == 0:
+        return indice
+
+    for loteria, df_lot in df_sel.groupby('loteria', sort=False):
+        indice['loterias'][loteria] = _contar(df_lot)
+
+    return indice
+
+def atualizar_calendario(indice: dict, df_novos: pd.DataFrame) -> dict:
+    """
+    Soma os registros recém-inseridos às contagens. Dias que já tinham
+    resultados não são contados de novo em 'n_dias'.
+    """
+    df_sel = selecionar_premios(df_novos, indice['modo'])
+
+    for loteria, df_lot in df_sel.groupby('loteria', sort=False):
+        novos = _contar(df_lot)
+        atual = indice['loterias'].get(loteria)
+
+        if atual is None:
+            indice['loterias'][loteria] = novos
+            continue
+
+        dias_repetidos = np.isin(novos['dias'], atual['dias'])
+        posicoes = get_posicoes_calendario(novos['dias'][dias_repetidos])
+
+        for dimensao, rotulos in DIMENSOES.items():
+            atual[dimensao]['n_dias'] += novos[dimensao]['n_dias'] - np.bincount(posicoes[dimensao], minlength=len(rotulos))
+            for tipo in TIPOS_CALENDARIO:
+                atual[dimensao][tipo] += novos[dimensao][tipo]
+        atual['dias'] = np.union1d(atual['dias'], novos['dias'])
+
+    return indice
+
+def get_sazonalidade(indice: dict, loteria: str, dimensao: str = 'dia_semana',
+                     tipo: str = 'grupo', percentual: bool = True) -> pd.DataFrame:
+    """
+    Tabela dimensão x grupo (ou pedra).
+
+    Args:
+        percentual: Se True, cada linha é normalizada para % dos resultados da linha
+
+    Returns:
+        DataFrame com as posições da dimensão nas linhas (só as que têm resultados)
+    """
+    if loteria not in indice['loterias']:
+        return pd.DataFrame()
+
+    tabela = indice['loterias'][loteria][dimensao][tipo]
+    result = pd.DataFrame(tabela, index=DIMENSOES[dimensao], columns=TIPOS_CALENDARIO[tipo])
+    result = result[tabela.sum(axis=1) > 0]
+
+    if percentual:
+        result = (result.div(result.sum(axis=1), axis=0) * 100).round(1)
+
+    return result
+
+def get_dias_por_posicao(indice: dict, loteria: str, dimensao: str = 'dia_semana') -> pd.Series:
+    """Quantidade de dias com resultados em cada posição da dimensão"""
+    if loteria not in indice['loterias']:
+        return pd.Series(dtype=np.int64)
+    return pd.Series(indice['loterias'][loteria][dimensao]['n_dias'], index=DIMENSOES[dimensao])
+
+def get_desvios(indice: dict, loteria: str, dimensao: str = 'dia_semana', tipo: str = 'grupo',
+                minimo_esperado: float = 5, top_n: int = 15) -> pd.DataFrame:
+    """
+    Combinações (posição do calendário, grupo/pedra) que mais se afastam do esperado.
+    O esperado é total_linha x total_coluna / total, como numa tabela de contingência.
+
+    Returns:
+        DataFrame com posicao, valor, frequencia, esperado e indice (frequência / esperado)
+    """
+    if loteria not in indice['loterias']:
+        return pd.DataFrame()
+
+    tabela = indice['loterias'][loteria][dimensao][tipo].astype(float)
+    total = tabela.sum()
+    if total == 0:
+        return pd.DataFrame()
+
+    esperado = np.outer(tabela.sum(axis=1), tabela.sum(axis=0)) / total
+    linhas, colunas = np.nonzero(esperado >= minimo_esperado)
+    if len(linhas) == 0:
+        return pd.DataFrame()
+
+    razao = tabela[linhas, colunas] / esperado[linhas, colunas]
+    ordem = np.argsort(-np.abs(np.log(np.maximum(razao, 1e-9))), kind='stable')[:top_n]
+
+    return pd.DataFrame({
+        'posicao': np.array(DIMENSOES[dimensao])[linhas[ordem]],
+        'valor': np.array(TIPOS_CALENDARIO[tipo])[colunas[ordem]],
+        'frequencia': tabela[linhas[ordem], colunas[ordem]].astype(np.int64),
+        'esperado': esperado[linhas[ordem], colunas[ordem]].round(1),
+        'indice': razao[ordem].round(2),
+    })
@@ -0,0 +1,183 @@
+"""
+Módulo de coincidências - mesmo grupo, centena ou milhar em loterias diferentes no mesmo dia
+Cada resultado vira uma chave int64 (dia, número, loteria); um único np.unique ordena e deduplica
+todas as loterias de uma vez e as coincidências são as chaves (dia, número) com mais de uma loteria
+"""
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import get_codigos_grupo, selecionar_premios
+from modules.data_loader import encode_dias, GRUPO_ANIMAL
+
+# Tipo de número -> (quantidade de valores possíveis, dígitos para exibição)
+TIPOS_COINCIDENCIA = {
+    'milhar': (10000, 4),
+    'centena': (1000, 3),
+    'grupo': (25, 2),
+}
+
+def _valores_por_tipo(df: pd.DataFrame) -> dict:
+    """Códigos 0..K-1 de cada tipo (grupo 1-25 vira 0-24; inválidos viram -1)"""
+    milhares = df['milhar'].to_numpy(dtype=np.int64) % 10000
+    return {
+        'milhar': milhares,
+        'centena': milhares % 1000,
+        'grupo': get_codigos_grupo(df),
+    }
+
+def build_coincidencias(df: pd.DataFrame, modo: str = 'todos') -> dict:
+    """
+    Encontra, em uma passada pelo histórico, todos os números que saíram em
+    duas ou mais loterias no mesmo dia.
+
+    A chave (dia * K + número) * L + loteria ordena os resultados por dia,
+    número e loteria; depois do np.unique, cada sequência de chaves com o
+    mesmo (dia, número) traz as loterias distintas em que ele saiu.
+
+    Returns:
+        Dict {'modo', 'loterias' (nomes; bit i da máscara = loteria i),
+        'dias' (dias com resultados, desde 1970), 'resultados' (matriz dias x
+        loterias com a quantidade de resultados), 'tipos': {tipo: {'dia',
+        'valor', 'mascara', 'n_loterias'}}} com uma posição por coincidência
+    """
+    indice = {'modo': modo, 'loterias': [], 'dias': np.zeros(0, dtype=np.int64),
+              'resultados': np.zeros((0, 0), dtype=np.int32), 'tipos': {}}
+    df_sel = selecionar_premios(df, modo)
+    if len(df_sel) == 0:
+        return indice
+
+    loteria_ids, nomes = pd.factorize(df_sel['loteria'])
+    n_loterias = len(nomes)
+    loteria_ids = loteria_ids.astype(np.int64)
+    dias = encode_dias(df_sel['data'])
+
+    dias_unicos, posicao = np.unique(dias, return_inverse=True)
+    indice['loterias'] = list(nomes)
+    indice['dias'] = dias_unicos
+    indice['resultados'] = np.bincount(
+        posicao * n_loterias + loteria_ids, minlength=len(dias_unicos) * n_loterias
+    ).reshape(len(dias_unicos), n_loterias).astype(np.int32)
+
+    for tipo, valores in _valores_por_tipo(df_sel).items():
+        k, _ = TIPOS_COINCIDENCIA[tipo]
+        validos = valores >= 0
+        chaves = np.unique((dias[validos] * k + valores[validos]) * n_loterias + loteria_ids[validos])
+        dia_numero, loteria = chaves // n_loterias, chaves % n_loterias
+
+        inicios = np.flatnonzero(np.concatenate(([True], dia_numero[1:] != dia_numero[:-1])))
+        quantidades = np.diff(np.append(inicios, len(chaves)))
+        mascaras = np.bitwise_or.reduceat(np.int64(1) << loteria, inicios) if len(chaves) else np.zeros(0, dtype=np.int64)
+        coincide = quantidades >= 2
+
+        indice['tipos'][tipo] = {
+            'dia': dia_numero[inicios[coincide]] // k,
+            'valor': dia_numero[inicios[coincide]] % k,
+            'mascara': mascaras[coincide],
+            'n_loterias': quantidades[coincide].astype(np.int32),
+        }
+
+    return indice
+
+def _bits_loterias(mascaras: np.ndarray, n_loterias: int) -> np.ndarray:
+    """Máscaras de loterias -> matriz bool (coincidências x loterias)"""
+    return ((mascaras[:, None] >> np.arange(n_loterias)) & 1).astype(bool)
+
+def _filtrar(indice: dict, tipo: str, desde=None, ate=None, loterias: list = None) -> tuple:
+    """Coincidências do período entre as loterias escolhidas (ao menos duas delas)"""
+    entrada = indice['tipos'].get(tipo)
+    if entrada is None:
+        return None, None
+
+    nomes = indice['loterias']
+    selecionadas = np.array([loterias is None or nome in loterias for nome in nomes], dtype=bool)
+    bits = _bits_loterias(entrada['mascara'], len(nomes)) & selecionadas
+
+    manter = bits.sum(axis=1) >= 2
+    if desde is not None:
+        manter &= entrada['dia'] >= encode_dias([desde])[0]
+    if ate is not None:
+        manter &= entrada['dia'] <= encode_dias([ate])[0]
+    return manter, bits
+
+def get_coincidencias(indice: dict, tipo: str = 'milhar', desde=None, ate=None,
+                      loterias: list = None) -> pd.DataFrame:
+    """
+    Tabela de coincidências de um período.
+
+    Args:
+        indice: Resultado de build_coincidencias
+        tipo: Chave de TIPOS_COINCIDENCIA
+        desde, ate: Limites do período (inclusive; padrão: todo o histórico)
+        loterias: Loterias consideradas (padrão: todas); só entram números
+                  que saíram em pelo menos duas delas
+
+    Returns:
+        DataFrame com data, numero, numero_fmt, animal (grupos), loterias
+        (nomes separados por vírgula) e n_loterias, do dia mais recente para
+        o mais antigo
+    """
+    manter, bits = _filtrar(indice, tipo, desde, ate, loterias)
+    if manter is None or not manter.any():
+        return pd.DataFrame()
+
+    entrada = indice['tipos'][tipo]
+    _, digitos = TIPOS_COINCIDENCIA[tipo]
+    numeros = entrada['valor'][manter] + (1 if tipo == 'grupo' else 0)
+    nomes = np.array(indice['loterias'], dtype=object)
+    bits = bits[manter]
+
+    result = pd.DataFrame({
+        'data': pd.to_datetime(entrada['dia'][manter].astype('datetime64[D]')),
+        'numero': numeros,
+        'numero_fmt': [f"{n:0{digitos}d}" for n in numeros.tolist()],
+        'loterias': [", ".join(nomes[linha]) for linha in bits],
+        'n_loterias': bits.sum(axis=1),
+    })
+    if tipo == 'grupo':
+        result.insert(3, 'animal', GRUPO_ANIMAL[numeros])
+
+    return result.sort_values(['data', 'n_loterias', 'numero'], ascending=[False, False, True], kind='stable').reset_index(drop=True)
+
+def get_resumo_pares(indice: dict, tipo: str = 'milhar', desde=None, ate=None,
+                     loterias: list = None) -> pd.DataFrame:
+    """
+    Coincidências de cada par de loterias no período, comparadas com o esperado
+    se os números fossem sorteados ao acaso.
+
+    O observado sai de um produto de matrizes (coincidências x loterias); no
+    esperado, um número aparece em n resultados de uma loteria no dia com
+    probabilidade 1 - (1 - 1/K)^n, e os dias entram todos de uma vez.
+
+    Returns:
+        DataFrame com loteria_a, loteria_b, coincidencias, esperado e lift
+    """
+    manter, bits = _filtrar(indice, tipo, desde, ate, loterias)
+    if manter is None:
+        return pd.DataFrame()
+
+    k, _ = TIPOS_COINCIDENCIA[tipo]
+    bits = bits[manter].astype(np.int64)
+    observado = bits.T @ bits
+
+    no_periodo = np.ones(len(indice['dias']), dtype=bool)
+    if desde is not None:
+        no_periodo &= indice['dias'] >= encode_dias([desde])[0]
+    if ate is not None:
+        no_periodo &= indice['dias'] <= encode_dias([ate])[0]
+    probabilidades = 1 - (1 - 1 / k) ** indice['resultados'][no_periodo]
+    esperado = k * probabilidades.T @ probabilidades
+
+    nomes = indice['loterias']
+    linhas = []
+    for a in range(len(nomes)):
+        for b in range(a + 1, len(nomes)):
+            if loterias is not None and (nomes[a] not in loterias or nomes[b] not in loterias):
+                continue
+            linhas.append({
+                'loteria_a': nomes[a],
+                'loteria_b': nomes[b],
+                'coincidencias': int(observado[a, b]),
+                'esperado': round(float(esperado[a, b]), 1),
+                'lift': round(observado[a, b] / esperado[a, b], 2) if esperado[a, b] > 0 else 0.0,
+            })
+    return pd.DataFrame(linhas)
@@ -0,0 +1,263 @@
+"""
+Módulo de combinatória do Jogo do Bicho - duques e ternos por sorteio
+"""
+import numpy as np
+import pandas as pd
+from itertools import combinations
+
+# Chave que identifica um sorteio (os prêmios de um mesmo horário)
+CHAVE_SORTEIO = ['loteria', 'data', 'horario']
+
+# Índices (0-24) de todos os duques e ternos de grupo, em ordem lexicográfica
+DUQUES_GRUPO = np.array(list(combinations(range(25), 2)), dtype=np.int64)   # 300 pares
+TERNOS_GRUPO = np.array(list(combinations(range(25), 3)), dtype=np.int64)   # 2.300 trincas
+
+# Prêmios considerados nas análises entre sorteios
+MODOS_PREMIO = {
+    'cabeca': '1° prêmio',
+    'todos': 'Todos os prêmios',
+}
+
+def selecionar_premios(df: pd.DataFrame, modo: str) -> pd.DataFrame:
+    """
+    Seleciona as linhas conforme o modo de prêmio, com a coluna data em datetime.
+    No modo 'cabeca' entram o 1° prêmio e os dados legados (premio=0), que
+    contam como cabeça, como na regra do ciclo.
+    """
+    if df is None or len(df) == 0:
+        return pd.DataFrame()
+
+    if modo == 'cabeca' and 'premio' in df.columns:
+        df = df[df['premio'] <= 1]
+
+    return df.assign(data=pd.to_datetime(df['data']))
+
+def get_chaves_sorteios(df: pd.DataFrame) -> tuple:
+    """
+    Identifica os sorteios (loteria, data, horário) do DataFrame.
+
+    Os ids seguem a ordem de (loteria, data, horário), ou seja, são cronológicos
+    dentro de cada loteria.
+
+    Returns:
+        (id do sorteio de cada linha, DataFrame com a chave de cada sorteio)
+    """
+    agrupado = df.groupby(CHAVE_SORTEIO, dropna=False)
+    ids = agrupado.ngroup().to_numpy()
+    chaves = agrupado.size().reset_index()[CHAVE_SORTEIO]
+    return ids, chaves
+
+def get_matriz_sorteios(df: pd.DataFrame, valores: np.ndarray, sorteio: np.ndarray = None) -> np.ndarray:
+    """
+    Monta a matriz (sorteios x prêmios) com os valores codificados de cada sorteio.
+
+    Cada linha é um sorteio (loteria, data, horário), na ordem de get_chaves_sorteios.
+    Os valores de cada linha são ordenados e deduplicados: repetições dentro do mesmo
+    sorteio viram -1, assim como as posições vazias. Os valores válidos ficam em
+    ordem crescente.
+
+    Args:
+        df: DataFrame com os resultados
+        valores: Array inteiro alinhado com as linhas de df (negativos = ausente)
+        sorteio: Ids de sorteio já calculados por get_chaves_sorteios (opcional)
+
+    Returns:
+        Matriz int64 (n_sorteios x largura) preenchida com -1 onde não há valor
+    """
+    if df is None or len(df) == 0:
+        return np.empty((0, 0), dtype=np.int64)
+
+    if sorteio is None:
+        sorteio, _ = get_chaves_sorteios(df)
+    ordem = np.argsort(sorteio, kind='stable')
+    sorteio = sorteio[ordem]
+    valores = np.asarray(valores, dtype=np.int64)[ordem]
+
+    # Posição de cada linha dentro do seu sorteio
+    n_sorteios = int(sorteio[-1]) + 1
+    tamanhos = np.bincount(sorteio, minlength=n_sorteios)
+    inicio = np.concatenate(([0], np.cumsum(tamanhos)[:-1]))
+    posicao = np.arange(len(sorteio)) - inicio[sorteio]
+
+    matriz = np.full((n_sorteios, int(tamanhos.max())), -1, dtype=np.int64)
+    matriz[sorteio, posicao] = valores
+
+    # Ordenar e descartar repetições dentro do sorteio
+    matriz.sort(axis=1)
+    repetidos = matriz[:, 1:] == matriz[:, :-1]
+    matriz[:, 1:][repetidos] = -1
+
+    return matriz
+
+def _codigos_combinacoes(matriz: np.ndarray, k: int, n_valores: int) -> np.ndarray:
+    """
+    Codifica todas as combinações de k valores distintos de cada sorteio em um
+    índice plano (a*n² + b*n + c para ternos), sem laços por sorteio.
+    """
+    if matriz.size == 0 or matriz.shape[1] < k:
+        return np.empty(0, dtype=np.int64)
+
+    posicoes = np.array(list(combinations(range(matriz.shape[1]), k)), dtype=np.int64)
+    valores = matriz[:, posicoes]  # (sorteios, combinações de posição, k)
+    validos = (valores >= 0).all(axis=2)
+
+    # Valores válidos já estão em ordem crescente, então o código é canônico
+    pesos = n_valores ** np.arange(k - 1, -1, -1, dtype=np.int64)
+    return valores[validos] @ pesos
+
+def contar_combinacoes(matriz: np.ndarray, k: int, n_valores: int) -> np.ndarray:
+    """
+    Conta todas as combinações de k valores distintos que saíram no mesmo sorteio
+    com um único np.bincount.
+
+    Returns:
+        Array de tamanho n_valores**k com a contagem de cada código
+    """
+    codigos = _codigos_combinacoes(matriz, k, n_valores)
+    return np.bincount(codigos, minlength=n_valores ** k)
+
+def contar_combinacoes_esparso(matriz: np.ndarray, k: int, n_valores: int) -> tuple:
+    """
+    Versão esparsa de contar_combinacoes: guarda apenas os códigos que ocorreram.
+    Usada quando o espaço de combinações é grande (ex.: 161.700 ternos de dezena).
+
+    Returns:
+        (codigos ordenados, contagens) como arrays int64
+    """
+    codigos = _codigos_combinacoes(matriz, k, n_valores)
+    codigos, contagens = np.unique(codigos, return_counts=True)
+    return codigos, contagens.astype(np.int64)
+
+def _ranking_combinacoes(combos: np.ndarray, contagens: np.ndarray, top_n: int) -> pd.DataFrame:
+    """Monta o ranking de duques/ternos de grupo a partir das contagens por combinação"""
+    from modules.data_loader import GRUPOS_ANIMAIS
+
+    presentes = contagens > 0
+    if not presentes.any():
+        return pd.DataFrame()
+
+    grupos = combos[presentes] + 1
+    freq = contagens[presentes]
+
+    ordem = np.lexsort((np.arange(len(freq)), -freq))[:top_n]
+    grupos = grupos[ordem]
+
+    result = pd.DataFrame(grupos, columns=[f'grupo_{i + 1}' for i in range(grupos.shape[1])])
+    result['frequencia'] = freq[ordem]
+    result['combinacao'] = ['-'.join(f"{g:02d}" for g in linha) for linha in grupos.tolist()]
+    result['animais'] = [' / '.join(GRUPOS_ANIMAIS[g] for g in linha) for linha in grupos.tolist()]
+    result['rank'] = range(1, len(result) + 1)
+
+    return result
+
+def get_codigos_grupo(df: pd.DataFrame) -> np.ndarray:
+    """Converte a coluna grupo (1-25) em códigos 0-24; grupos inválidos viram -1"""
+    grupos = df['grupo'].to_numpy(dtype=np.int64)
+    return np.where((grupos >= 1) & (grupos <= 25), grupos - 1, -1)
+
+def get_duques_grupos(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+    """
+    Ranking dos duques de grupo (300 pares) que saíram juntos no mesmo sorteio.
+    Aceita várias loterias: cada sorteio é identificado por (loteria, data, horário).
+    """
+    if df is None or len(df) == 0:
+        return pd.DataFrame()
+
+    matriz = get_matriz_sorteios(df, get_codigos_grupo(df))
+    contagens = contar_combinacoes(matriz, 2, 25)
+    contagens = contagens[DUQUES_GRUPO[:, 0] * 25 + DUQUES_GRUPO[:, 1]]
+
+    return _ranking_combinacoes(DUQUES_GRUPO, contagens, top_n)
+
+def get_ternos_grupos(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+    """
+    Ranking dos ternos de grupo (2.300 trincas) que saíram juntos no mesmo sorteio.
+    """
+    if df is None or len(df) == 0:
+        return pd.DataFrame()
+
+    matriz = get_matriz_sorteios(df, get_codigos_grupo(df))
+    contagens = contar_combinacoes(matriz, 3, 25)
+    contagens = contagens[TERNOS_GRUPO[:, 0] * 625 + TERNOS_GRUPO[:, 1] * 25 + TERNOS_GRUPO[:, 2]]
+
+    return _ranking_combinacoes(TERNOS_GRUPO, contagens, top_n)
+
+# ========================
+# ÍNDICE DE DEZENAS
+# ========================
+
+def build_indice_dezenas(df: pd.DataFrame) -> dict:
+    """
+    Constrói o índice esparso de duques e ternos de dezena (00-99) por loteria.
+    A dezena é formada pelos dois últimos dígitos da milhar.
+
+    Returns:
+        Dict {loteria: {'duques': (codigos, contagens), 'ternos': (codigos, contagens)}}
+        com os códigos ordenados, prontos para busca binária
+    """
+    indice = {}
+    if df is None or len(df) == 0:
+        return indice
+
+    for loteria, df_lot in df.groupby('loteria', sort=False):
+        dezenas = df_lot['milhar'].to_numpy(dtype=np.int64) % 100
+        matriz = get_matriz_sorteios(df_lot, dezenas)
+        indice[loteria] = {
+            'duques': contar_combinacoes_esparso(matriz, 2, 100),
+            'ternos': contar_combinacoes_esparso(matriz, 3, 100),
+        }
+
+    return indice
+
+def _ranking_dezenas(codigos: np.ndarray, contagens: np.ndarray, k: int, top_n: int) -> pd.DataFrame:
+    """Top-K de combinações de dezena a partir dos arrays esparsos"""
+    if len(codigos) == 0:
+        return pd.DataFrame()
+
+    # Seleção parcial dos K maiores, depois ordenação só deles
+    if top_n < len(contagens):
+        candidatos = np.argpartition(-contagens, top_n - 1)[:top_n]
+    else:
+        candidatos = np.arange(len(contagens))
+    candidatos = candidatos[np.lexsort((codigos[candidatos], -contagens[candidatos]))]
+
+    pesos = 100 ** np.arange(k - 1, -1, -1, dtype=np.int64)
+    dezenas = (codigos[candidatos, None] // pesos) % 100
+
+    result = pd.DataFrame(dezenas, columns=[f'dezena_{i + 1}' for i in range(k)])
+    result['frequencia'] = contagens[candidatos]
+    result['combinacao'] = ['-'.join(f"{d:02d}" for d in linha) for linha in dezenas.tolist()]
+    result['rank'] = range(1, len(result) + 1)
+
+    return result
+
+def get_top_duques_dezena(indice: dict, loteria: str, top_n: int = 10) -> pd.DataFrame:
+    """Retorna os duques de dezena mais frequentes de uma loteria"""
+    if loteria not in indice:
+        return pd.DataFrame()
+    codigos, contagens = indice[loteria]['duques']
+    return _ranking_dezenas(codigos, contagens, 2, top_n)
+
+def get_top_ternos_dezena(indice: dict, loteria: str, top_n: int = 10) -> pd.DataFrame:
+    """Retorna os ternos de dezena mais frequentes de uma loteria"""
+    if loteria not in indice:
+        return pd.DataFrame()
+    codigos, contagens = indice[loteria]['ternos']
+    return _ranking_dezenas(codigos, contagens, 3, top_n)
+
+def get_duques_com_dezena(indice: dict, loteria: str, dezena: int, top_n: int = 10) -> pd.DataFrame:
+    """
+    Retorna os duques de uma loteria que contêm a dezena informada,
+    ordenados por frequência. A coluna 'parceira' traz a outra dezena do par.
+    """
+    if loteria not in indice:
+        return pd.DataFrame()
+
+    codigos, contagens = indice[loteria]['duques']
+    primeira, segunda = codigos // 100, codigos % 100
+    mascara = (primeira == dezena) | (segunda == dezena)
+
+    result = _ranking_dezenas(codigos[mascara], contagens[mascara], 2, top_n)
+    if len(result) > 0:
+        result['parceira'] = np.where(result['dezena_1'] == dezena, result['dezena_2'], result['dezena_1'])
+    return result
@@ -1,6 +1,7 @@
 """
 Módulo de carregamento e validação de dados do Jogo do Bicho
 """
+import numpy as np
 import pandas as pd
 import streamlit as st
 from datetime import datetime, timedelta
@@ -29,6 +30,18 @@ REQUIRED_COLUMNS = ['data', 'loteria', 'horario', 'grupo', 'centena', 'milhar']
 # Loterias suportadas
 LOTERIAS = ['RJ', 'Nacional', 'Look GO', 'Federal', 'Capital']
 
+# Horários fixos de cada loteria
+HORARIOS_POR_LOTERIA = {
+    "Nacional": ["02:00", "08:00", "10:00", "12:00", "15:00", "17:00", "21:00", "23:00"],
+    "Look GO": ["07:00", "09:00", "11:00", "14:00", "16:00", "18:00", "21:00", "23:00"],
+    "Capital": ["10:00", "11:00", "13:00", "14:00", "16:00", "18:00", "20:00", "22:00"],
+    "RJ": ["09:00", "11:00", "14:00", "16:00", "18:00", "21:00"],  # Horários RJ
+    "Federal": ["19:00"],  # Federal tem horário único
+}
+
+# Horários usados quando a loteria não está em HORARIOS_POR_LOTERIA
+HORARIOS_PADRAO = ["11:00", "14:00", "18:00", "21:00"]
+
 # Mapeamento de grupos para animais
 GRUPOS_ANIMAIS = {
     1: 'Avestruz', 2: 'Águia', 3: 'Burro', 4: 'Borboleta', 5: 'Cachorro',
@@ -38,6 +51,60 @@ GRUPOS_ANIMAIS = {
     21: 'Touro', 22: 'Tigre', 23: 'Urso', 24: 'Veado', 25: 'Vaca'
 }
 
+# Emojis para cada animal
+EMOJIS = {
+    1: '🦢', 2: '🦅', 3: '🐴', 4: '🦋', 5: '🐕',
+    6: '🐐', 7: '🐏', 8: '🐫', 9: '🐍', 10: '🐰',
+    11: '🐎', 12: '🐘', 13: '🐓', 14: '🐱', 15: '🐊',
+    16: '🦁', 17: '🐵', 18: '🐷', 19: '🦚', 20: '🦃',
+    21: '🐂', 22: '🐅', 23: '🐻', 24: '🦌', 25: '🐄'
+}
+
+# Tabelas de consulta (gathers vetorizados com numpy)
+# Dezena (00-99) -> grupo: 01-04 = 1, 05-08 = 2, ..., 97-99 e 00 = 25
+DEZENA_GRUPO = np.array([25] + [(d - 1) // 4 + 1 for d in range(1, 100)], dtype=np.int64)
+
+# Dezena (00-99) -> texto com dois dígitos
+DEZENA_TEXTO = np.array([f"{d:02d}" for d in range(100)], dtype=object)
+
+# Grupo (índice 1-25; 0 = inválido) -> animal, emoji e as 4 dezenas
+GRUPO_ANIMAL = np.array(['Desconhecido'] + [GRUPOS_ANIMAIS[g] for g in range(1, 26)], dtype=object)
+GRUPO_EMOJI = np.array(['🐾'] + [EMOJIS[g] for g in range(1, 26)], dtype=object)
+GRUPO_DEZENAS = np.array([[-1] * 4] + [[(4 * g - 3 + i) % 100 for i in range(4)] for g in range(1, 26)], dtype=np.int64)
+
+# Dezenas de cada grupo (texto)
+DEZENAS = {g: list(DEZENA_TEXTO[GRUPO_DEZENAS[g]]) for g in range(1, 26)}
+
+def get_grupo_da_milhar(milhares) -> np.ndarray:
+    """Grupo (1-25) de cada milhar/centena/dezena, pelos dois últimos dígitos"""
+    return DEZENA_GRUPO[np.asarray(milhares, dtype=np.int64) % 100]
+
+def get_codigo_grupo(grupos) -> np.ndarray:
+    """Índice nas tabelas GRUPO_*: o próprio grupo se estiver entre 1 e 25, senão 0"""
+    grupos = np.asarray(grupos, dtype=np.int64)
+    return np.where((grupos >= 1) & (grupos <= 25), grupos, 0)
+
+def validar_grupos(grupos, milhares) -> np.ndarray:
+    """Máscara bool das linhas em que o grupo confere com a dezena da milhar"""
+    return np.asarray(grupos, dtype=np.int64) == get_grupo_da_milhar(milhares)
+
+def get_dezenas_por_grupo(df: pd.DataFrame) -> pd.Series:
+    """
+    Dezenas que saíram em cada grupo, na ordem das linhas do DataFrame.
+
+    Returns:
+        Series indexada pelos grupos 1-25 com as dezenas separadas por vírgula
+        ('' quando o grupo não saiu)
+    """
+    vazia = pd.Series('', index=pd.RangeIndex(1, 26))
+    if df is None or len(df) == 0:
+        return vazia
+
+    dezenas = DEZENA_TEXTO[df['milhar'].to_numpy(dtype=np.int64) % 100]
+    grupos = df['grupo'].to_numpy(dtype=np.int64)
+    juntas = pd.Series(dezenas).groupby(grupos, sort=False).agg(', '.join)
+    return juntas.reindex(vazia.index, fill_value='')
+
 # Cores fixas por dia - REGRA CRÍTICA E IMUTÁVEL
 # A cor indica EXCLUSIVAMENTE o dia, não representa frequência ou probabilidade
 DIA_CORES = {
@@ -201,44 +268,6 @@ def get_day_color(day_number: int) -> dict:
     """
     return DIA_CORES.get(day_number, {'cor': '#CCCCCC', 'nome': 'N/A', 'emoji': '⬜', 'text_color': '#000000'})
 
-def get_grupo_days(df: pd.DataFrame, loteria: str, grupo: int) -> list:
-    """
-    Retorna os números dos dias (1-5) em que um grupo específico apareceu.
-    Aplica a regra de prêmio: dias 1-2 todos, dias 3-5 só 1° prêmio.
-    Se o grupo apareceu múltiplas vezes no mesmo dia, retorna o dia repetido.
-    
-    Args:
-        df: DataFrame com todos os dados
-        loteria: Loteria para filtrar
-        grupo: Número do grupo (1-25)
-    
-    Returns:
-        Lista de números de dias (1-5), podendo ter repetições se apareceu várias vezes
-    """
-    # Usar filter com regra de prêmio
-    df_filtrado = filter_by_day_prize_rules(df, loteria)
-    
-    if len(df_filtrado) == 0:
-        return []
-    
-    # Filtrar pelo grupo
-    df_grupo = df_filtrado[df_filtrado['grupo'] == grupo]
-    
-    if len(df_grupo) == 0:
-        return []
-    
-    # Obter dias para cada aparição (incluindo repetições)
-    dias = []
-    for _, row in df_grupo.iterrows():
-        data = row['data']
-        if hasattr(data, 'date'):
-            data = data.date()
-        dia_num = get_day_number(df, loteria, data)
-        if dia_num > 0:
-            dias.append(dia_num)
-    
-    return sorted(dias)
-
 def validate_dataframe(df: pd.DataFrame) -> tuple[bool, str]:
     """
     Valida se o DataFrame tem as colunas obrigatórias
@@ -288,8 +317,13 @@ def process_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     else:
         df['horario'] = df['horario'].astype(str).str.strip()
     
+    # Grupo ausente ou inválido: deduzir da dezena da milhar
+    grupos = df['grupo'].to_numpy()
+    invalidos = (grupos < 1) | (grupos > 25)
+    df['grupo'] = np.where(invalidos, get_grupo_da_milhar(df['milhar']), grupos)
+    
     # Adicionar nome do animal
-    df['animal'] = df['grupo'].map(GRUPOS_ANIMAIS)
+    df['animal'] = GRUPO_ANIMAL[df['grupo'].to_numpy()]
     
     # Ordenar por data (mais recente primeiro)
     df = df.sort_values('data', ascending=False)
@@ -350,6 +384,76 @@ def filter_by_horario(df: pd.DataFrame, horarios: list) -> pd.DataFrame:
         return df
     return df[df['horario'].isin(horarios)]
 
+def encode_dias(datas) -> np.ndarray:
+    """
+    Codifica datas como dias inteiros desde 1970-01-01.
+    Colunas que ainda não são datetime têm só os valores distintos convertidos,
+    o que evita interpretar o texto de cada linha em históricos de vários anos.
+    """
+    datas = pd.Series(datas)
+    if pd.api.types.is_datetime64_any_dtype(datas):
+        return datas.to_numpy().astype('datetime64[D]').astype(np.int64)
+    
+    codigos, unicos = pd.factorize(datas.astype(str).str.slice(0, 10))
+    dias = pd.to_datetime(pd.Series(unicos), errors='coerce').to_numpy().astype('datetime64[D]').astype(np.int64)
+    return dias[codigos]
+
+def encode_data_horario(datas, horarios) -> np.ndarray:
+    """
+    Codifica (data, horário 'HH:MM') como minutos inteiros desde 1970-01-01.
+    Permite ordenar e comparar sorteios de loterias diferentes sem objetos datetime.
+    """
+    dias = encode_dias(datas)
+    horarios = pd.Series(horarios).astype(str)
+    horas = pd.to_numeric(horarios.str.slice(0, 2), errors='coerce').fillna(0).to_numpy(dtype=np.int64)
+    minutos = pd.to_numeric(horarios.str.slice(3, 5), errors='coerce').fillna(0).to_numpy(dtype=np.int64)
+    return dias * 1440 + horas * 60 + minutos
+
+def get_dataset_version(df: pd.DataFrame) -> tuple:
+    """
+    Retorna uma "versão" barata do dataset para invalidar índices em cache.
+    Muda sempre que registros são inseridos ou removidos.
+    """
+    if df is None or len(df) == 0:
+        return (0,)
+    
+    return (
+        len(df),
+        int(df['milhar'].sum()),
+        int(df['grupo'].sum()),
+        str(pd.to_datetime(df['data']).max())
+    )
+
+def _chaves_resultado(df: pd.DataFrame) -> pd.MultiIndex:
+    """Chave única de cada resultado na base: (dia, loteria, horário, milhar)"""
+    return pd.MultiIndex.from_arrays([
+        encode_dias(df['data']),
+        df['loteria'].astype(str).to_numpy(),
+        df['horario'].astype(str).to_numpy(),
+        df['milhar'].to_numpy(dtype=np.int64),
+    ])
+
+def get_registros_inseridos(df_add: pd.DataFrame, df_anterior: pd.DataFrame, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Linhas de df_add que de fato entraram na base: a chave não existia antes da
+    inserção e existe depois dela. Duplicados e linhas com erro ficam de fora.
+    
+    Args:
+        df_add: Registros enviados para save_data_to_database
+        df_anterior: DataFrame completo antes da inserção
+        df: DataFrame completo recarregado após a inserção
+    """
+    if df_add is None or len(df_add) == 0:
+        return pd.DataFrame()
+    if df is None or len(df) == 0:
+        return df_add.iloc[0:0]
+    
+    chaves = _chaves_resultado(df_add)
+    novos = chaves.isin(_chaves_resultado(df)) & ~chaves.duplicated()
+    if df_anterior is not None and len(df_anterior) > 0:
+        novos &= ~chaves.isin(_chaves_resultado(df_anterior))
+    return df_add[novos]
+
 def get_unique_loterias(df: pd.DataFrame) -> list:
     """
     Retorna loterias únicas no dataset
@@ -88,6 +88,21 @@ def _init_sqlite_tables(conn):
     ''')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_loteria ON resultados(loteria)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_data ON resultados(data)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS alertas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            data DATE NOT NULL,
+            loteria TEXT NOT NULL,
+            horario TEXT NOT NULL,
+            regra TEXT NOT NULL,
+            tipo TEXT NOT NULL,
+            valor INTEGER NOT NULL,
+            metrica INTEGER NOT NULL,
+            descricao TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(data, loteria, regra, valor)
+        )
+    ''')
     
     # Migração: adicionar coluna premio se não existir (para bases legadas)
     try:
@@ -437,6 +452,93 @@ def _delete_all_sqlite() -> int:
         print(f"[DB] Erro ao deletar SQLite: {e}")
         return 0
 
+# ========================
+# ALERTAS
+# ========================
+
+COLUNAS_ALERTAS = ['data', 'loteria', 'horario', 'regra', 'tipo', 'valor', 'metrica', 'descricao']
+
+def _registro_alerta(row) -> tuple:
+    """Linha de alerta -> valores na ordem de COLUNAS_ALERTAS (data em AAAA-MM-DD)"""
+    data = row['data']
+    data = data.strftime('%Y-%m-%d') if hasattr(data, 'strftime') else str(data)[:10]
+    return (data, row['loteria'], row['horario'], row['regra'], row['tipo'],
+            int(row['valor']), int(row['metrica']), row['descricao'])
+
+def insert_alertas(df: pd.DataFrame) -> int:
+    """
+    Grava alertas disparados (o mesmo alerta no mesmo dia é ignorado).
+    Retorna o número de alertas gravados.
+    """
+    if df is None or len(df) == 0:
+        return 0
+    
+    if _is_supabase_available():
+        try:
+            client = st.session_state._supabase_client
+            registros = [dict(zip(COLUNAS_ALERTAS, _registro_alerta(row))) for _, row in df.iterrows()]
+            result = client.table('alertas').upsert(
+                registros, on_conflict='data,loteria,regra,valor', ignore_duplicates=True
+            ).execute()
+            return len(result.data) if result.data else 0
+        except Exception as e:
+            print(f"[DB] Erro ao gravar alertas no Supabase: {e}")
+            return _insert_alertas_sqlite(df)
+    else:
+        return _insert_alertas_sqlite(df)
+
+def _insert_alertas_sqlite(df: pd.DataFrame) -> int:
+    try:
+        conn = _get_sqlite_connection()
+        _init_sqlite_tables(conn)
+        cursor = conn.cursor()
+        cursor.executemany(f'''
+            INSERT OR IGNORE INTO alertas ({', '.join(COLUNAS_ALERTAS)})
+            VALUES ({', '.join('?' * len(COLUNAS_ALERTAS))})
+        ''', [_registro_alerta(row) for _, row in df.iterrows()])
+        inseridos = cursor.rowcount
+        conn.commit()
+        conn.close()
+        print(f"[DB] SQLite: {inseridos} alertas gravados")
+        return inseridos
+    except Exception as e:
+        print(f"[DB] Erro ao gravar alertas SQLite: {e}")
+        return 0
+
+def load_alertas(limite: int = 50) -> pd.DataFrame:
+    """Carrega os alertas mais recentes"""
+    if _is_supabase_available():
+        try:
+            client = st.session_state._supabase_client
+            result = client.table('alertas').select('*').order('data', desc=True).order('id', desc=True).limit(limite).execute()
+            df = pd.DataFrame(result.data or [], columns=['id'] + COLUNAS_ALERTAS)
+            if len(df) > 0:
+                df['data'] = pd.to_datetime(df['data'])
+            return df[COLUNAS_ALERTAS]
+        except Exception as e:
+            print(f"[DB] Erro ao carregar alertas do Supabase: {e}")
+            return _load_alertas_sqlite(limite)
+    else:
+        return _load_alertas_sqlite(limite)
+
+def _load_alertas_sqlite(limite: int) -> pd.DataFrame:
+    try:
+        conn = _get_sqlite_connection()
+        _init_sqlite_tables(conn)
+        df = pd.read_sql_query(f'''
+            SELECT {', '.join(COLUNAS_ALERTAS)}
+            FROM alertas
+            ORDER BY data DESC, id DESC
+            LIMIT ?
+        ''', conn, params=(limite,))
+        conn.close()
+        if len(df) > 0:
+            df['data'] = pd.to_datetime(df['data'])
+        return df
+    except Exception as e:
+        print(f"[DB] Erro ao carregar alertas SQLite: {e}")
+        return pd.DataFrame(columns=COLUNAS_ALERTAS)
+
 # Inicializar ao importar
 try:
     init_database()
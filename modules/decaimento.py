@@ -0,0 +1,159 @@
+"""
+Módulo de decaimento - scores quentes/frios com peso exponencial por sorteio
+A cada sorteio todos os scores são multiplicados pelo fator de decaimento e os números que saíram ganham +1
+"""
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import get_chaves_sorteios, get_codigos_grupo, selecionar_premios
+from modules.data_loader import GRUPO_ANIMAL
+
+# Tipo de número -> (quantidade de valores possíveis, dígitos para exibição)
+TIPOS_DECAIMENTO = {
+    'grupo': (25, 2),
+    'dezena': (100, 2),
+    'centena': (1000, 3),
+}
+
+# Meia-vida padrão, em sorteios (depois dela um resultado vale metade)
+MEIA_VIDA_PADRAO = 30
+
+def get_fator(meia_vida: float) -> float:
+    """Fator de decaimento por sorteio para a meia-vida informada"""
+    return 0.5 ** (1 / meia_vida)
+
+def _valores_por_tipo(df: pd.DataFrame) -> dict:
+    """Códigos 0..K-1 de cada tipo (grupo 1-25 vira 0-24; inválidos viram -1)"""
+    milhares = df['milhar'].to_numpy(dtype=np.int64) % 10000
+    return {
+        'grupo': get_codigos_grupo(df),
+        'dezena': milhares % 100,
+        'centena': milhares % 1000,
+    }
+
+def _somar(scores: dict, df_lot: pd.DataFrame, pesos: np.ndarray):
+    """Soma o peso de cada linha ao score do seu valor (bincount ponderado, sem laço por linha)"""
+    for tipo, valores in _valores_por_tipo(df_lot).items():
+        validos = valores >= 0
+        scores[tipo] += np.bincount(valores[validos], weights=pesos[validos], minlength=len(scores[tipo]))
+
+def _estado_vazio() -> dict:
+    """Estado de uma loteria ainda sem sorteios"""
+    return {
+        'n_sorteios': 0,
+        'ultimo': None,
+        'scores': {tipo: np.zeros(k, dtype=np.float64) for tipo, (k, _) in TIPOS_DECAIMENTO.items()},
+    }
+
+def build_decaimento(df: pd.DataFrame, modo: str = 'todos', meia_vida: float = MEIA_VIDA_PADRAO) -> dict:
+    """
+    Calcula os scores com decaimento de cada loteria a partir do histórico.
+
+    O replay não precisa de laço por sorteio: o score final de um valor é a soma
+    de fator^(sorteios depois dele) em cada aparição, um bincount ponderado.
+
+    Returns:
+        Dict {'modo', 'fator', 'loterias': {loteria: {'n_sorteios', 'ultimo', 'scores'}}}
+        com scores[tipo] em arrays densos (índice = grupo - 1, dezena, centena)
+    """
+    fator = get_fator(meia_vida)
+    indice = {'modo': modo, 'fator': fator, 'loterias': {}}
+    df_sel = selecionar_premios(df, modo)
+
+    if len(df_sel) == 0:
+        return indice
+
+    ids, chaves = get_chaves_sorteios(df_sel)
+    loteria_ids, nomes = pd.factorize(chaves['loteria'])
+    inicio_loteria = np.searchsorted(loteria_ids, np.arange(len(nomes)))
+
+    for codigo, loteria in enumerate(nomes):
+        linhas = np.flatnonzero(loteria_ids[ids] == codigo)
+        fim = np.searchsorted(loteria_ids, codigo, side='right')
+        n_sorteios = int(fim - inicio_loteria[codigo])
+
+        # Sorteios depois de cada linha (0 para o último sorteio)
+        depois = (fim - 1 - ids[linhas]).astype(np.float64)
+        estado = _estado_vazio()
+        estado['n_sorteios'] = n_sorteios
+        estado['ultimo'] = (chaves['data'].iloc[fim - 1], chaves['horario'].iloc[fim - 1])
+        _somar(estado['scores'], df_sel.iloc[linhas], fator ** depois)
+        indice['loterias'][loteria] = estado
+
+    return indice
+
+def atualizar_decaimento(indice: dict, df_novos: pd.DataFrame) -> dict | None:
+    """
+    Aplica registros recém-inseridos: os scores decaem uma vez pelos m sorteios
+    novos (O(K)) e os novos resultados entram com peso fator^(sorteios depois).
+
+    Prêmios que completam o último sorteio já contado entram sem novo decaimento.
+    Resultados retroativos retornam None para que o índice seja reconstruído.
+    """
+    df_sel = selecionar_premios(df_novos, indice['modo'])
+    if len(df_sel) == 0:
+        return indice
+
+    fator = indice['fator']
+    ids, chaves = get_chaves_sorteios(df_sel)
+    loterias_chave = chaves['loteria'].to_numpy()
+
+    for loteria in pd.unique(loterias_chave):
+        sorteios = np.flatnonzero(loterias_chave == loteria)
+        estado = indice['loterias'].get(loteria)
+        if estado is None:
+            estado = _estado_vazio()
+
+        primeiro = (chaves['data'].iloc[sorteios[0]], chaves['horario'].iloc[sorteios[0]])
+        mesmo_ultimo = estado['ultimo'] is not None and primeiro == estado['ultimo']
+        if estado['ultimo'] is not None and primeiro < estado['ultimo']:
+            return None
+
+        # Decaimento dos sorteios realmente novos
+        novos = len(sorteios) - (1 if mesmo_ultimo else 0)
+        for tipo in estado['scores']:
+            estado['scores'][tipo] *= fator ** novos
+
+        ordem = np.full(len(chaves), -1, dtype=np.int64)
+        ordem[sorteios] = np.arange(len(sorteios))
+        linhas = np.flatnonzero(np.isin(ids, sorteios))
+        depois = (len(sorteios) - 1 - ordem[ids[linhas]]).astype(np.float64)
+        _somar(estado['scores'], df_sel.iloc[linhas], fator ** depois)
+
+        estado['n_sorteios'] += novos
+        estado['ultimo'] = (chaves['data'].iloc[sorteios[-1]], chaves['horario'].iloc[sorteios[-1]])
+        indice['loterias'][loteria] = estado
+
+    return indice
+
+def get_ranking_decaimento(indice: dict, loteria: str, tipo: str = 'grupo', top_n: int = 10,
+                           frios: bool = False) -> pd.DataFrame:
+    """
+    Ranking dos números mais quentes (ou mais frios) pelo score com decaimento.
+
+    Returns:
+        DataFrame com o número, score, indice (score / score médio do tipo:
+        acima de 1 = mais quente que a média) e rank
+    """
+    estado = indice['loterias'].get(loteria)
+    if estado is None:
+        return pd.DataFrame()
+
+    _, digitos = TIPOS_DECAIMENTO[tipo]
+    scores = estado['scores'][tipo]
+    media = scores.mean()
+    ordem = np.argsort(scores if frios else -scores, kind='stable')[:top_n]
+
+    numeros = ordem + 1 if tipo == 'grupo' else ordem
+    result = pd.DataFrame({
+        tipo: numeros,
+        'score': scores[ordem].round(3),
+        'indice': (scores[ordem] / media).round(2) if media > 0 else 0.0,
+    })
+    result[f'{tipo}_fmt'] = [f"{n:0{digitos}d}" for n in numeros.tolist()]
+    result['rank'] = range(1, len(result) + 1)
+
+    if tipo == 'grupo':
+        result['animal'] = GRUPO_ANIMAL[numeros]
+
+    return result
@@ -0,0 +1,138 @@
+"""
+Módulo de características dos dígitos - soma, pares, alto/baixo, espelho e outras derivadas da milhar
+Cada característica é uma tabela pré-calculada para as 10.000 milhares; extrair é um único gather por coluna
+"""
+import numpy as np
+import pandas as pd
+
+from modules.data_loader import encode_dias
+
+# Dígitos de todas as milhares 0000-9999 (milhar x 4, do milhar para a unidade)
+DIGITOS = (np.arange(10000)[:, None] // np.array([1000, 100, 10, 1])) % 10
+
+def _casa_pedra(digitos: np.ndarray) -> np.ndarray:
+    """Casa da pedra (primeiro dígito) como no Mapa de Pedras: 0-3 baixa, 4-6 média, 7-9 alta"""
+    return np.searchsorted([4, 7], digitos[:, 0], side='right')
+
+# Característica -> rótulo, rótulos dos valores e função sobre a matriz de dígitos.
+# Para incluir uma nova, basta acrescentar aqui: a tabela é calculada uma vez na importação.
+CARACTERISTICAS = {
+    'soma': {
+        'rotulo': 'Soma dos dígitos',
+        'rotulos': [str(s) for s in range(37)],
+        'calcular': lambda d: d.sum(axis=1),
+    },
+    'pares': {
+        'rotulo': 'Dígitos pares',
+        'rotulos': [str(n) for n in range(5)],
+        'calcular': lambda d: (d % 2 == 0).sum(axis=1),
+    },
+    'paridade': {
+        'rotulo': 'Milhar par/ímpar',
+        'rotulos': ['Par', 'Ímpar'],
+        'calcular': lambda d: d[:, 3] % 2,
+    },
+    'altos': {
+        'rotulo': 'Dígitos altos (5-9)',
+        'rotulos': [str(n) for n in range(5)],
+        'calcular': lambda d: (d >= 5).sum(axis=1),
+    },
+    'metade': {
+        'rotulo': 'Metade (0000-4999 / 5000-9999)',
+        'rotulos': ['Baixa', 'Alta'],
+        'calcular': lambda d: (d[:, 0] >= 5).astype(np.int64),
+    },
+    'casa_pedra': {
+        'rotulo': 'Casa da pedra',
+        'rotulos': ['Baixa (0-3)', 'Média (4-6)', 'Alta (7-9)'],
+        'calcular': _casa_pedra,
+    },
+    'distintos': {
+        'rotulo': 'Dígitos distintos',
+        'rotulos': [str(n) for n in range(1, 5)],
+        'calcular': lambda d: (np.sort(d, axis=1)[:, 1:] != np.sort(d, axis=1)[:, :-1]).sum(axis=1),
+    },
+    'espelho': {
+        'rotulo': 'Milhar espelho (ABBA)',
+        'rotulos': ['Não', 'Sim'],
+        'calcular': lambda d: ((d[:, 0] == d[:, 3]) & (d[:, 1] == d[:, 2])).astype(np.int64),
+    },
+    'dezena_dupla': {
+        'rotulo': 'Dezena dupla (00, 11, ..., 99)',
+        'rotulos': ['Não', 'Sim'],
+        'calcular': lambda d: (d[:, 2] == d[:, 3]).astype(np.int64),
+    },
+}
+
+# Tabelas milhar -> valor da característica (uint8)
+TABELAS = {nome: c['calcular'](DIGITOS).astype(np.uint8) for nome, c in CARACTERISTICAS.items()}
+
+def extrair_caracteristicas(milhares, nomes: list = None) -> pd.DataFrame:
+    """
+    Calcula as características de cada milhar com um gather por característica
+    (sem laços por linha), em colunas uint8.
+
+    Args:
+        milhares: Array/Series de milhares
+        nomes: Chaves de CARACTERISTICAS (padrão: todas)
+
+    Returns:
+        DataFrame com uma coluna por característica, alinhado com milhares
+    """
+    milhares = np.asarray(milhares, dtype=np.int64) % 10000
+    return pd.DataFrame({nome: TABELAS[nome][milhares] for nome in nomes or CARACTERISTICAS})
+
+def get_esperado(nome: str) -> np.ndarray:
+    """Distribuição (%) da característica se todas as milhares fossem igualmente prováveis"""
+    k = len(CARACTERISTICAS[nome]['rotulos'])
+    return np.bincount(TABELAS[nome], minlength=k) / len(TABELAS[nome]) * 100
+
+def get_distribuicoes(df: pd.DataFrame, nomes: list = None, janelas: list = None) -> pd.DataFrame:
+    """
+    Distribuição das características nas janelas dos últimos N dias com resultados.
+
+    Um bincount por característica monta a matriz (dia x valor), com o dia mais
+    recente primeiro; a soma acumulada nos dias entrega todas as janelas.
+
+    Args:
+        df: DataFrame (normalmente de uma loteria)
+        nomes: Chaves de CARACTERISTICAS (padrão: todas)
+        janelas: Quantidades de dias (None na lista = todo o DataFrame; padrão: [5, 30, None])
+
+    Returns:
+        DataFrame longo com caracteristica, janela, valor, rotulo, frequencia,
+        percentual e esperado (% com milhares uniformes)
+    """
+    nomes = list(nomes or CARACTERISTICAS)
+    janelas = list(janelas or [5, 30, None])
+    if df is None or len(df) == 0:
+        return pd.DataFrame()
+
+    dias = encode_dias(df['data'])
+    dias_unicos, posicao = np.unique(-dias, return_inverse=True)  # 0 = dia mais recente
+    n_dias = len(dias_unicos)
+    cortes = [n_dias if j is None else min(j, n_dias) for j in janelas]
+    milhares = df['milhar'].to_numpy(dtype=np.int64) % 10000
+
+    partes = []
+    for nome in nomes:
+        rotulos = CARACTERISTICAS[nome]['rotulos']
+        k = len(rotulos)
+        por_dia = np.bincount(posicao * k + TABELAS[nome][milhares], minlength=n_dias * k).reshape(n_dias, k)
+        acumulado = np.vstack([np.zeros((1, k), dtype=np.int64), np.cumsum(por_dia, axis=0)])
+        esperado = get_esperado(nome).round(2)
+
+        for janela, corte in zip(janelas, cortes):
+            contagens = acumulado[corte]
+            total = contagens.sum()
+            partes.append(pd.DataFrame({
+                'caracteristica': nome,
+                'janela': 'Tudo' if janela is None else f"{janela} dias",
+                'valor': np.arange(k),
+                'rotulo': rotulos,
+                'frequencia': contagens,
+                'percentual': (contagens / total * 100).round(2) if total else 0.0,
+                'esperado': esperado,
+            }))
+
+    return pd.concat(partes, ignore_index=True)
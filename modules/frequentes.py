@@ -0,0 +1,177 @@
+"""
+Módulo de números frequentes - resumos Space-Saving de milhares e centenas por loteria e mês
+Cada resumo guarda no máximo `capacidade` contadores e dois resumos se unem sem voltar aos dados,
+então o top-K de qualquer conjunto de meses é respondido com memória constante
+"""
+import numpy as np
+import pandas as pd
+
+# Tipo -> (quantidade de valores possíveis, dígitos para exibição)
+TIPOS_FREQUENTES = {
+    'milhar': (10000, 4),
+    'centena': (1000, 3),
+}
+
+# Contadores por resumo (folga sobre o top 50 exibido para manter os erros baixos)
+CAPACIDADE_PADRAO = 200
+
+def _resumo_vazio() -> dict:
+    """Resumo sem contadores"""
+    vazio = np.zeros(0, dtype=np.int64)
+    return {'itens': vazio, 'contagens': vazio, 'erros': vazio, 'piso': 0, 'n': 0}
+
+def _resumir(valores: np.ndarray, dominio: int, capacidade: int) -> dict:
+    """
+    Resumo de um lote de valores: a contagem exata do lote (um bincount) fica só
+    com os `capacidade` maiores contadores. Itens fora do resumo saíram no
+    máximo `piso` vezes.
+    """
+    contagens = np.bincount(valores, minlength=dominio)
+    itens = np.flatnonzero(contagens)
+    piso = 0
+    if len(itens) > capacidade:
+        ordem = np.lexsort((itens, -contagens[itens]))
+        piso = int(contagens[itens[ordem[capacidade:]]].max())
+        itens = np.sort(itens[ordem[:capacidade]])
+
+    return {
+        'itens': itens.astype(np.int64),
+        'contagens': contagens[itens].astype(np.int64),
+        'erros': np.zeros(len(itens), dtype=np.int64),
+        'piso': piso,
+        'n': int(len(valores)),
+    }
+
+def _alinhar(resumo: dict, itens: np.ndarray) -> tuple:
+    """Contagens e erros do resumo para os itens pedidos (ausentes valem o piso)"""
+    if len(resumo['itens']) == 0:
+        piso = np.full(len(itens), resumo['piso'], dtype=np.int64)
+        return piso, piso
+
+    pos = np.minimum(np.searchsorted(resumo['itens'], itens), len(resumo['itens']) - 1)
+    presente = resumo['itens'][pos] == itens
+    contagens = np.where(presente, resumo['contagens'][pos], resumo['piso'])
+    erros = np.where(presente, resumo['erros'][pos], resumo['piso'])
+    return contagens, erros
+
+def unir_resumos(a: dict, b: dict, capacidade: int = CAPACIDADE_PADRAO) -> dict:
+    """
+    Une dois resumos Space-Saving.
+
+    Cada item recebe a soma das duas contagens, e quem falta em um dos resumos
+    entra com o piso daquele resumo (o máximo que pode ter saído lá). O resultado
+    volta a ter no máximo `capacidade` contadores, e a frequência real de cada
+    item fica sempre entre contagem - erro e contagem.
+    """
+    itens = np.union1d(a['itens'], b['itens'])
+    contagens_a, erros_a = _alinhar(a, itens)
+    contagens_b, erros_b = _alinhar(b, itens)
+    contagens = contagens_a + contagens_b
+    erros = erros_a + erros_b
+    piso = a['piso'] + b['piso']
+
+    if len(itens) > capacidade:
+        ordem = np.lexsort((itens, -contagens))
+        piso = max(piso, int(contagens[ordem[capacidade:]].max()))
+        manter = np.sort(ordem[:capacidade])
+        itens, contagens, erros = itens[manter], contagens[manter], erros[manter]
+
+    return {'itens': itens, 'contagens': contagens, 'erros': erros, 'piso': piso, 'n': a['n'] + b['n']}
+
+def _resumos_por_mes(df: pd.DataFrame, capacidade: int) -> dict:
+    """Resumos de cada (loteria, mês AAAAMM) e tipo do DataFrame"""
+    if df is None or len(df) == 0:
+        return {}
+
+    datas = pd.to_datetime(df['data'])
+    meses = (datas.dt.year * 100 + datas.dt.month).to_numpy()
+    milhares = df['milhar'].to_numpy(dtype=np.int64) % 10000
+    valores = {'milhar': milhares, 'centena': milhares % 1000}
+
+    resumos = {}
+    grupos = pd.DataFrame({'loteria': df['loteria'].to_numpy(), 'mes': meses}).groupby(['loteria', 'mes'], sort=True).indices
+    for (loteria, mes), linhas in grupos.items():
+        resumos.setdefault(loteria, {})[int(mes)] = {
+            tipo: _resumir(valores[tipo][linhas], dominio, capacidade)
+            for tipo, (dominio, _) in TIPOS_FREQUENTES.items()
+        }
+    return resumos
+
+def build_frequentes(df: pd.DataFrame, capacidade: int = CAPACIDADE_PADRAO) -> dict:
+    """
+    Constrói os resumos de milhares e centenas de cada loteria e mês (todos os prêmios).
+
+    Returns:
+        Dict {'capacidade', 'loterias': {loteria: {mes AAAAMM: {tipo: resumo}}}}
+        onde cada resumo tem itens, contagens, erros (arrays de até `capacidade`),
+        piso e n (resultados resumidos)
+    """
+    return {'capacidade': capacidade, 'loterias': _resumos_por_mes(df, capacidade)}
+
+def atualizar_frequentes(indice: dict, df_novos: pd.DataFrame) -> dict:
+    """
+    Une os registros recém-inseridos aos resumos dos seus meses.
+
+    Como os resumos são combináveis, a ordem de chegada não importa: resultados
+    retroativos também entram sem reconstrução.
+    """
+    capacidade = indice['capacidade']
+    for loteria, meses in _resumos_por_mes(df_novos, capacidade).items():
+        destino = indice['loterias'].setdefault(loteria, {})
+        for mes, resumos in meses.items():
+            if mes not in destino:
+                destino[mes] = resumos
+                continue
+            for tipo, resumo in resumos.items():
+                destino[mes][tipo] = unir_resumos(destino[mes][tipo], resumo, capacidade)
+    return indice
+
+def get_meses(indice: dict, loterias: list = None) -> list:
+    """Meses (AAAAMM) com resultados nas loterias informadas (padrão: todas), em ordem"""
+    meses = set()
+    for loteria, por_mes in indice['loterias'].items():
+        if loterias is None or loteria in loterias:
+            meses.update(por_mes)
+    return sorted(meses)
+
+def get_top_frequentes(indice: dict, tipo: str = 'milhar', top_n: int = 50,
+                       loterias: list = None, meses: list = None) -> pd.DataFrame:
+    """
+    Top-K aproximado sobre a união dos resumos das loterias e meses escolhidos,
+    sem reler o histórico: cada união mantém no máximo `capacidade` contadores.
+
+    Args:
+        indice: Resultado de build_frequentes
+        tipo: Chave de TIPOS_FREQUENTES
+        top_n: Quantidade de números
+        loterias: Loterias incluídas (padrão: todas)
+        meses: Meses AAAAMM incluídos (padrão: todos)
+
+    Returns:
+        DataFrame com o número, frequencia (estimativa, nunca abaixo da real),
+        minimo (frequência garantida) e exato, ordenado pela estimativa
+    """
+    capacidade = indice['capacidade']
+    meses = None if meses is None else set(meses)
+    uniao = _resumo_vazio()
+    for loteria, por_mes in indice['loterias'].items():
+        if loterias is not None and loteria not in loterias:
+            continue
+        for mes, resumos in por_mes.items():
+            if meses is None or mes in meses:
+                uniao = unir_resumos(uniao, resumos[tipo], capacidade)
+
+    if len(uniao['itens']) == 0:
+        return pd.DataFrame()
+
+    _, digitos = TIPOS_FREQUENTES[tipo]
+    ordem = np.lexsort((uniao['itens'], -uniao['contagens']))[:top_n]
+    result = pd.DataFrame({
+        tipo: uniao['itens'][ordem],
+        'frequencia': uniao['contagens'][ordem],
+        'minimo': uniao['contagens'][ordem] - uniao['erros'][ordem],
+    })
+    result['exato'] = result['frequencia'] == result['minimo']
+    result[f'{tipo}_fmt'] = [f"{n:0{digitos}d}" for n in result[tipo].tolist()]
+    result.attrs['total'] = uniao['n']
+    return result
@@ -0,0 +1,110 @@
+"""
+Módulo de análise por horário - matrizes horário x grupo e horário x pedra por loteria
+"""
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import get_codigos_grupo, selecionar_premios
+from modules.data_loader import HORARIOS_POR_LOTERIA
+
+# Tipo de contagem -> rótulos das colunas
+TIPOS_HORARIO = {
+    'grupo': [f"{g:02d}" for g in range(1, 26)],
+    'pedra': [str(d) for d in range(10)],
+}
+
+def _contar_por_dia(posicao_dia: np.ndarray, codigo_horario: np.ndarray, valores: np.ndarray,
+                    n_dias: int, n_horarios: int, n_valores: int) -> np.ndarray:
+    """Tensor (dias x horários x valores) com um único bincount sobre o índice achatado"""
+    validos = (codigo_horario >= 0) & (valores >= 0)
+    plano = (posicao_dia[validos] * n_horarios + codigo_horario[validos]) * n_valores + valores[validos]
+    contagem = np.bincount(plano, minlength=n_dias * n_horarios * n_valores)
+    return contagem.reshape(n_dias, n_horarios, n_valores).astype(np.int32)
+
+def build_matrizes_horario(df: pd.DataFrame, modo: str = 'todos') -> dict:
+    """
+    Constrói, para cada loteria, as contagens por (dia, horário, grupo) e
+    (dia, horário, pedra). A pedra é o primeiro dígito da milhar.
+
+    Os horários são códigos categóricos: primeiro os da grade fixa da loteria
+    (HORARIOS_POR_LOTERIA), depois horários extras encontrados nos dados.
+    Guardar o eixo dos dias permite somar qualquer janela e comparar o mesmo
+    horário entre dias sem voltar ao DataFrame.
+
+    Args:
+        df: DataFrame com todos os dados
+        modo: 'cabeca' (só 1° prêmio) ou 'todos' (todos os prêmios)
+
+    Returns:
+        Dict {'modo', 'loterias': {loteria: {'horarios', 'dias', 'grupo', 'pedra'}}}
+        com 'dias' em ordem crescente (datetime64[D]) e tensores int32
+    """
+    indice = {'modo': modo, 'loterias': {}}
+    df_sel = selecionar_premios(df, modo)
+
+    if len(df_sel) == 0:
+        return indice
+
+    for loteria, df_lot in df_sel.groupby('loteria', sort=False):
+        grade = HORARIOS_POR_LOTERIA.get(loteria, [])
+        extras = sorted(set(df_lot['horario'].dropna().astype(str)) - set(grade))
+        horarios = list(grade) + extras
+
+        codigo_horario = pd.Categorical(df_lot['horario'].astype(str), categories=horarios).codes.astype(np.int64)
+        dias, posicao_dia = np.unique(df_lot['data'].to_numpy().astype('datetime64[D]'), return_inverse=True)
+        pedras = (df_lot['milhar'].to_numpy(dtype=np.int64) % 10000) // 1000
+
+        indice['loterias'][loteria] = {
+            'horarios': horarios,
+            'dias': dias,
+            'grupo': _contar_por_dia(posicao_dia, codigo_horario, get_codigos_grupo(df_lot), len(dias), len(horarios), 25),
+            'pedra': _contar_por_dia(posicao_dia, codigo_horario, pedras, len(dias), len(horarios), 10),
+        }
+
+    return indice
+
+def get_matriz_horario(indice: dict, loteria: str, tipo: str = 'grupo', n_dias: int = None) -> pd.DataFrame:
+    """
+    Matriz horário x grupo (ou pedra) somada nos últimos N dias com resultados.
+
+    Args:
+        indice: Índice construído por build_matrizes_horario
+        loteria: Loteria analisada
+        tipo: 'grupo' ou 'pedra'
+        n_dias: Quantidade de dias (None = histórico completo)
+
+    Returns:
+        DataFrame com os horários nas linhas e os grupos/pedras nas colunas
+    """
+    if loteria not in indice['loterias']:
+        return pd.DataFrame()
+
+    entrada = indice['loterias'][loteria]
+    tensor = entrada[tipo] if n_dias is None else entrada[tipo][-n_dias:]
+
+    return pd.DataFrame(tensor.sum(axis=0), index=entrada['horarios'], columns=TIPOS_HORARIO[tipo])
+
+def get_horario_por_dia(indice: dict, loteria: str, horario: str, tipo: str = 'grupo', n_dias: int = 5) -> pd.DataFrame:
+    """
+    Compara o mesmo horário entre os últimos N dias com resultados.
+
+    Returns:
+        DataFrame com as datas nas linhas (mais recente primeiro) e os
+        grupos/pedras nas colunas; dias sem sorteio no horário ficam de fora
+    """
+    if loteria not in indice['loterias']:
+        return pd.DataFrame()
+
+    entrada = indice['loterias'][loteria]
+    if horario not in entrada['horarios']:
+        return pd.DataFrame()
+
+    coluna = entrada['horarios'].index(horario)
+    fatia = entrada[tipo][:, coluna, :]
+    com_sorteio = np.flatnonzero(fatia.sum(axis=1) > 0)[::-1][:n_dias]
+
+    return pd.DataFrame(
+        fatia[com_sorteio],
+        index=pd.to_datetime(entrada['dias'][com_sorteio]).strftime('%d/%m/%Y'),
+        columns=TIPOS_HORARIO[tipo]
+    )
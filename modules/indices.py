@@ -0,0 +1,76 @@
+"""
+Módulo de índices em cache - estruturas construídas uma vez por versão do dataset
+"""
+import pandas as pd
+import streamlit as st
+
+from modules.data_loader import get_dataset_version
+
+def get_indice(nome: str, df: pd.DataFrame, construir, atualizar=None) -> object:
+    """
+    Retorna o índice `nome`, reconstruindo-o apenas quando o dataset mudou.
+    
+    Os índices ficam em st.session_state, então são compartilhados entre as páginas
+    durante a sessão. Índices sem `atualizar` são reconstruídos após inserções ou
+    exclusões; os demais são atualizados por atualizar_indices().
+    
+    Args:
+        nome: Identificador do índice (ex: 'dezenas')
+        df: DataFrame com todos os dados
+        construir: Função df -> índice, chamada quando não há versão válida em cache
+        atualizar: Função (índice, df_novos) -> índice atualizado, ou None quando
+                   a atualização incremental não é possível (opcional)
+    """
+    if '_indices' not in st.session_state:
+        st.session_state._indices = {}
+    
+    versao = get_dataset_version(df)
+    entrada = st.session_state._indices.get(nome)
+    
+    if entrada is None or entrada['versao'] != versao:
+        entrada = {'versao': versao, 'indice': construir(df), 'atualizar': atualizar}
+        st.session_state._indices[nome] = entrada
+    
+    return entrada['indice']
+
+def atualizar_indices(df_novos: pd.DataFrame, df: pd.DataFrame, df_anterior: pd.DataFrame) -> list:
+    """
+    Aplica registros recém-inseridos aos índices incrementais em cache.
+    
+    Deve ser chamada logo após uma inserção bem-sucedida, com `df` já recarregado.
+    Só são atualizados os índices construídos sobre `df_anterior` (o dataset de
+    antes da inserção); índices de versões mais antigas (por exemplo, anteriores
+    a uma exclusão), sem atualização incremental ou que a recusam são descartados
+    e reconstruídos na próxima leitura.
+    
+    Args:
+        df_novos: Registros que acabaram de ser inseridos
+        df: DataFrame completo após a inserção
+        df_anterior: DataFrame completo antes da inserção
+    
+    Returns:
+        Nomes dos índices atualizados (os demais foram descartados)
+    """
+    if '_indices' not in st.session_state or df_novos is None or len(df_novos) == 0:
+        return []
+    
+    versao_anterior = get_dataset_version(df_anterior)
+    versao = get_dataset_version(df)
+    atualizados = []
+    
+    for nome, entrada in list(st.session_state._indices.items()):
+        atualizado = None
+        if entrada.get('atualizar') is not None and entrada['versao'] == versao_anterior:
+            try:
+                atualizado = entrada['atualizar'](entrada['indice'], df_novos)
+            except Exception as e:
+                print(f"[Índices] Erro ao atualizar '{nome}': {e}")
+        
+        if atualizado is None:
+            del st.session_state._indices[nome]
+        else:
+            entrada['indice'] = atualizado
+            entrada['versao'] = versao
+            atualizados.append(nome)
+    
+    return atualizados
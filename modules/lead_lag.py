@@ -0,0 +1,104 @@
+"""
+Módulo de correlação entre loterias (lead-lag)
+Verifica se um grupo sorteado em uma loteria aparece em outra nos N sorteios seguintes
+"""
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import (
+    get_chaves_sorteios, get_matriz_sorteios, get_codigos_grupo, selecionar_premios
+)
+from modules.data_loader import encode_data_horario
+
+# Separação entre loterias na chave (loteria, tempo) - maior que qualquer tempo em minutos
+_DESLOCAMENTO_LOTERIA = np.int64(10 ** 12)
+
+def _presenca_sorteios(df: pd.DataFrame) -> tuple:
+    """
+    Matriz de presença (sorteios x 25) em ordem (loteria, data, horário).
+
+    Returns:
+        (presenca bool, loteria_ids, nomes das loterias, tempo de cada sorteio em minutos)
+    """
+    ids, chaves = get_chaves_sorteios(df)
+    matriz = get_matriz_sorteios(df, get_codigos_grupo(df), ids)
+
+    presenca = np.zeros((len(matriz), 25), dtype=bool)
+    linhas, colunas = np.nonzero(matriz >= 0)
+    presenca[linhas, matriz[linhas, colunas]] = True
+
+    loteria_ids, nomes = pd.factorize(chaves['loteria'])
+    tempos = encode_data_horario(chaves['data'], chaves['horario'])
+
+    return presenca, loteria_ids.astype(np.int64), list(nomes), tempos
+
+def get_lead_lag(df: pd.DataFrame, n_sorteios: int = 3, modo: str = 'cabeca') -> pd.DataFrame:
+    """
+    Calcula, para todos os pares de loterias (origem -> destino) de uma vez, a taxa
+    com que um grupo da origem aparece no destino dentro dos próximos N sorteios.
+
+    O alinhamento no tempo é feito com um único searchsorted sobre as chaves
+    (loteria, data+horário) de todos os sorteios, e a presença do grupo na janela
+    vem de somas acumuladas por grupo (diferença entre o fim e o início da janela).
+
+    Args:
+        df: DataFrame com todos os dados (várias loterias)
+        n_sorteios: Tamanho da janela no destino (sorteios seguintes)
+        modo: 'cabeca' (só 1° prêmio) ou 'todos' (todos os prêmios)
+
+    Returns:
+        DataFrame com origem, destino, eventos, acertos, taxa (%), esperado (%) e lift
+    """
+    df = selecionar_premios(df, modo)
+    if len(df) == 0:
+        return pd.DataFrame()
+
+    presenca, loteria_ids, nomes, tempos = _presenca_sorteios(df)
+    n_loterias = len(nomes)
+
+    # Somas acumuladas por grupo: contagem na janela [ini, fim) = acum[fim] - acum[ini]
+    acumulado = np.vstack([np.zeros((1, 25), dtype=np.int64), np.cumsum(presenca, axis=0)])
+    fim_segmento = np.searchsorted(loteria_ids, np.arange(n_loterias), side='right')
+    chaves = loteria_ids * _DESLOCAMENTO_LOTERIA + tempos
+
+    # Eventos: cada (sorteio, grupo) presente na origem
+    ev_sorteio, ev_grupo = np.nonzero(presenca)
+    ev_loteria = loteria_ids[ev_sorteio]
+
+    # Início da janela em cada destino: primeiro sorteio estritamente posterior
+    destinos = np.arange(n_loterias, dtype=np.int64)
+    consultas = destinos[None, :] * _DESLOCAMENTO_LOTERIA + tempos[ev_sorteio, None]
+    inicio = np.searchsorted(chaves, consultas, side='right')  # (eventos x destinos)
+    fim = inicio + n_sorteios
+    completo = fim <= fim_segmento[None, :]
+    fim = np.minimum(fim, fim_segmento[None, :])
+
+    grupo = ev_grupo[:, None]
+    acertos = (acumulado[fim, grupo] - acumulado[inicio, grupo]) > 0
+
+    # Agregar por par (origem, destino) com um bincount
+    par = ev_loteria[:, None] * n_loterias + destinos[None, :]
+    eventos_par = np.bincount(par[completo], minlength=n_loterias ** 2)
+    acertos_par = np.bincount(par[completo & acertos], minlength=n_loterias ** 2)
+
+    # Esperado: fração média de grupos distintos em uma janela qualquer do destino
+    esperado = np.zeros(n_loterias)
+    for destino in range(n_loterias):
+        ini_seg = fim_segmento[destino - 1] if destino > 0 else 0
+        inicios = np.arange(ini_seg, fim_segmento[destino] - n_sorteios + 1)
+        if len(inicios) > 0:
+            distintos = ((acumulado[inicios + n_sorteios] - acumulado[inicios]) > 0).sum(axis=1)
+            esperado[destino] = distintos.mean() / 25
+
+    origem_idx, destino_idx = np.divmod(np.arange(n_loterias ** 2), n_loterias)
+    result = pd.DataFrame({
+        'origem': [nomes[i] for i in origem_idx],
+        'destino': [nomes[i] for i in destino_idx],
+        'eventos': eventos_par,
+        'acertos': acertos_par,
+    })
+    result['taxa'] = np.where(eventos_par > 0, acertos_par / np.maximum(eventos_par, 1) * 100, np.nan).round(1)
+    result['esperado'] = (esperado[destino_idx] * 100).round(1)
+    result['lift'] = np.where(result['esperado'] > 0, result['taxa'] / result['esperado'], np.nan).round(2)
+
+    return result[result['eventos'] > 0].reset_index(drop=True)
@@ -0,0 +1,145 @@
+"""
+Módulo de transições de grupo (cadeia de Markov) entre sorteios consecutivos
+"""
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import (
+    get_chaves_sorteios, get_matriz_sorteios, get_codigos_grupo, selecionar_premios
+)
+
+def _contar_transicoes(matriz: np.ndarray, loteria_ids: np.ndarray, n_loterias: int) -> np.ndarray:
+    """
+    Conta as transições grupo(t) -> grupo(t+1) com um único deslocamento + bincount.
+    
+    Args:
+        matriz: Matriz (sorteios x prêmios) em ordem cronológica, -1 onde vazio
+        loteria_ids: Código da loteria de cada sorteio (transições só dentro da loteria)
+        n_loterias: Quantidade de loterias
+    
+    Returns:
+        Array (n_loterias x 25 x 25) com as contagens
+    """
+    if len(matriz) < 2:
+        return np.zeros((n_loterias, 25, 25), dtype=np.int64)
+    
+    anterior = matriz[:-1, :, None]
+    seguinte = matriz[1:, None, :]
+    mesma_loteria = (loteria_ids[:-1] == loteria_ids[1:])[:, None, None]
+    validos = (anterior >= 0) & (seguinte >= 0) & mesma_loteria
+    
+    codigos = loteria_ids[:-1, None, None] * 625 + anterior * 25 + seguinte
+    contagens = np.bincount(codigos[validos], minlength=n_loterias * 625)
+    
+    return contagens.reshape(n_loterias, 25, 25)
+
+def build_transicoes(df: pd.DataFrame, modo: str = 'cabeca') -> dict:
+    """
+    Constrói a matriz de transição 25x25 de cada loteria.
+    Os sorteios são ordenados por data e horário dentro de cada loteria.
+    
+    Returns:
+        Dict {'modo', 'loterias': {loteria: {'matriz', 'ultimo', 'ultimos_grupos'}}}
+        onde 'ultimo' é a chave (data, horário) do último sorteio contado e
+        'ultimos_grupos' os grupos desse sorteio, usados na atualização incremental
+    """
+    indice = {'modo': modo, 'loterias': {}}
+    df_sel = selecionar_premios(df, modo)
+    
+    if len(df_sel) == 0:
+        return indice
+    
+    ids, chaves = get_chaves_sorteios(df_sel)
+    matriz = get_matriz_sorteios(df_sel, get_codigos_grupo(df_sel), ids)
+    loteria_ids, nomes = pd.factorize(chaves['loteria'])
+    
+    contagens = _contar_transicoes(matriz, loteria_ids, len(nomes))
+    
+    # Último sorteio de cada loteria (chaves ordenadas por loteria)
+    ultimos = np.searchsorted(loteria_ids, np.arange(len(nomes)), side='right') - 1
+    
+    for codigo, loteria in enumerate(nomes):
+        ultimo = ultimos[codigo]
+        indice['loterias'][loteria] = {
+            'matriz': contagens[codigo],
+            'ultimo': (chaves['data'].iloc[ultimo], chaves['horario'].iloc[ultimo]),
+            'ultimos_grupos': matriz[ultimo],
+        }
+    
+    return indice
+
+def atualizar_transicoes(indice: dict, df_novos: pd.DataFrame) -> dict | None:
+    """
+    Atualiza o índice com sorteios recém-inseridos, sem recontar o histórico.
+    
+    Só é possível quando os novos sorteios vêm depois do último já contado em
+    cada loteria. Caso contrário (resultado retroativo ou prêmios faltantes de
+    um horário já contado) retorna None para que o índice seja reconstruído.
+    """
+    df_sel = selecionar_premios(df_novos, indice['modo'])
+    if len(df_sel) == 0:
+        return indice
+    
+    ids, chaves = get_chaves_sorteios(df_sel)
+    matriz = get_matriz_sorteios(df_sel, get_codigos_grupo(df_sel), ids)
+    loterias_chave = chaves['loteria'].to_numpy()
+    
+    for loteria in pd.unique(loterias_chave):
+        linhas = np.flatnonzero(loterias_chave == loteria)
+        primeiro = (chaves['data'].iloc[linhas[0]], chaves['horario'].iloc[linhas[0]])
+        bloco = matriz[linhas]
+        
+        estado = indice['loterias'].get(loteria)
+        if estado is not None:
+            if primeiro <= estado['ultimo']:
+                return None
+            
+            # Emendar o último sorteio conhecido antes dos novos
+            anterior = estado['ultimos_grupos']
+            largura = max(bloco.shape[1], len(anterior))
+            bloco = np.pad(bloco, ((0, 0), (0, largura - bloco.shape[1])), constant_values=-1)
+            anterior = np.pad(anterior, (0, largura - len(anterior)), constant_values=-1)
+            bloco = np.vstack([anterior, bloco])
+        
+        contagem = _contar_transicoes(bloco, np.zeros(len(bloco), dtype=np.int64), 1)[0]
+        ultimo = linhas[-1]
+        
+        indice['loterias'][loteria] = {
+            'matriz': contagem if estado is None else estado['matriz'] + contagem,
+            'ultimo': (chaves['data'].iloc[ultimo], chaves['horario'].iloc[ultimo]),
+            'ultimos_grupos': matriz[ultimo],
+        }
+    
+    return indice
+
+def get_matriz_transicao(indice: dict, loteria: str) -> np.ndarray:
+    """Retorna a matriz 25x25 (linha = grupo anterior, coluna = grupo seguinte)"""
+    estado = indice['loterias'].get(loteria)
+    if estado is None:
+        return np.zeros((25, 25), dtype=np.int64)
+    return estado['matriz']
+
+def get_proximos_grupos(indice: dict, loteria: str, grupo: int, top_n: int = 5) -> pd.DataFrame:
+    """
+    Responde "o que costuma vir depois do grupo X": grupos mais frequentes
+    no sorteio seguinte, com a probabilidade empírica de cada um.
+    """
+    from modules.data_loader import GRUPOS_ANIMAIS
+    
+    linha = get_matriz_transicao(indice, loteria)[grupo - 1]
+    total = linha.sum()
+    if total == 0:
+        return pd.DataFrame()
+    
+    seguintes = np.flatnonzero(linha)
+    seguintes = seguintes[np.argsort(-linha[seguintes], kind='stable')][:top_n]
+    
+    result = pd.DataFrame({
+        'grupo': seguintes + 1,
+        'frequencia': linha[seguintes],
+    })
+    result['animal'] = result['grupo'].map(GRUPOS_ANIMAIS)
+    result['probabilidade'] = (result['frequencia'] / total * 100).round(1)
+    result['grupo_animal'] = result.apply(lambda x: f"{x['grupo']:02d} - {x['animal']}", axis=1)
+    
+    return result
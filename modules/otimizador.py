@@ -0,0 +1,181 @@
+"""
+Módulo de otimização - busca em grade ou aleatória dos parâmetros das estratégias de backtest
+Escolhe os parâmetros no período de treino e informa o desempenho fora da amostra (teste)
+"""
+import os
+from itertools import product
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.backtest import ESTRATEGIAS, executar_backtest, preparar_loteria
+from modules.data_loader import get_dataset_version
+
+# Valores testados de cada parâmetro (só os que a estratégia usa entram na busca)
+ESPACO_PADRAO = {
+    'janela': [3, 5, 7, 10],
+    'top_n': [3, 5, 7],
+    'premios': ['todos', 'cabeca', 'regra'],
+    'peso_rep': [0, 1, 2, 3, 4],
+}
+
+# Métrica otimizada -> descrição (todas: quanto maior, melhor)
+METRICAS = {
+    'lift_cabeca': 'Lift na cabeça (acerto / acaso)',
+    'roi_cabeca': 'ROI apostando na cabeça (%)',
+    'taxa_qualquer': 'Acerto do 1° ao 5° (%)',
+}
+
+def get_metricas(estrategia: str) -> dict:
+    """Métricas que a estratégia produz (o ROI só existe para palpites de grupo, que têm cotação na cabeça)"""
+    if ESTRATEGIAS[estrategia]['tipo'] == 'grupo':
+        return METRICAS
+    return {m: descricao for m, descricao in METRICAS.items() if m != 'roi_cabeca'}
+
+METODOS_BUSCA = {
+    'grade': 'Grade completa',
+    'aleatorio': 'Amostra aleatória da grade',
+}
+
+def gerar_candidatos(estrategia: str, espaco: dict = None, metodo: str = 'grade',
+                     n_amostras: int = 50, semente: int = None) -> list:
+    """
+    Lista de combinações de parâmetros a testar.
+
+    Args:
+        estrategia: Chave de ESTRATEGIAS (define quais parâmetros entram)
+        espaco: {parâmetro: valores} (padrão: ESPACO_PADRAO)
+        metodo: 'grade' (todas as combinações) ou 'aleatorio' (n_amostras sem repetição)
+        n_amostras: Combinações sorteadas na busca aleatória
+        semente: Semente da busca aleatória
+
+    Returns:
+        Lista de dicts de parâmetros
+    """
+    espaco = espaco or ESPACO_PADRAO
+    nomes = [p for p in ESTRATEGIAS[estrategia]['params'] if p in espaco]
+    grade = [dict(zip(nomes, valores)) for valores in product(*(espaco[p] for p in nomes))]
+
+    if metodo == 'aleatorio' and n_amostras < len(grade):
+        rng = np.random.default_rng(semente)
+        escolhidos = np.sort(rng.choice(len(grade), size=n_amostras, replace=False))
+        grade = [grade[i] for i in escolhidos]
+
+    return grade
+
+def _chave_params(params: dict) -> tuple:
+    """Chave estável de um dict de parâmetros"""
+    return tuple(sorted(params.items()))
+
+def _avaliar_lote(preparado: dict, estrategia: str, candidatos: list, corte) -> list:
+    """Unidade de trabalho do pool: vários candidatos da mesma loteria (o histórico viaja uma vez)"""
+    resultados = []
+    for params in candidatos:
+        resultado = executar_backtest(preparado, estrategia, params, corte=corte)
+        resultados.append({'treino': resultado['treino'], 'teste': resultado['teste']})
+    return resultados
+
+def otimizar(df: pd.DataFrame, estrategia: str = 'fechamento', candidatos: list = None,
+             fracao_teste: float = 0.3, loterias: list = None, n_processos: int = None,
+             cache: dict = None) -> pd.DataFrame:
+    """
+    Avalia os candidatos no backtest de cada loteria, separando treino e teste.
+
+    Os dias de cada loteria são divididos em ordem cronológica: os sorteios da
+    fração final (fracao_teste) formam o teste, nunca usado na escolha. Os
+    candidatos de cada loteria são divididos em lotes distribuídos em um pool
+    de processos. Resultados já calculados são reaproveitados do cache, cuja
+    chave inclui a versão do dataset, a loteria, a estratégia, os parâmetros e
+    a data de corte.
+
+    Args:
+        df: DataFrame com todos os dados
+        estrategia: Chave de ESTRATEGIAS
+        candidatos: Lista de params (padrão: gerar_candidatos(estrategia))
+        fracao_teste: Fração final dos dias reservada para o teste
+        loterias: Loterias avaliadas (padrão: todas)
+        n_processos: Processos do pool (padrão: núcleos da máquina; 1 = sem pool)
+        cache: Dict reaproveitado entre chamadas (opcional)
+
+    Returns:
+        DataFrame com loteria, corte, params, as colunas do resumo de treino e
+        as de teste (prefixo 'teste_'), uma linha por loteria e candidato
+    """
+    if df is None or len(df) == 0:
+        return pd.DataFrame()
+
+    candidatos = candidatos or gerar_candidatos(estrategia)
+    loterias = loterias or df['loteria'].unique().tolist()
+    cache = {} if cache is None else cache
+    versao = get_dataset_version(df)
+
+    linhas, pendentes = [], []
+    for loteria, df_lot in df[df['loteria'].isin(loterias)].groupby('loteria', sort=False):
+        preparado = preparar_loteria(df_lot)
+        n_dias = len(preparado['dias'])
+        if n_dias < 2:
+            continue
+        corte = preparado['dias'][min(n_dias - 1, max(1, int(round(n_dias * (1 - fracao_teste)))))]
+
+        faltando = []
+        for params in candidatos:
+            chave = (versao, loteria, estrategia, _chave_params(params), str(corte))
+            if chave in cache:
+                linhas.append((loteria, corte, params, cache[chave]))
+            else:
+                faltando.append(params)
+        if faltando:
+            pendentes.append((loteria, corte, preparado, faltando))
+
+    # Lotes de candidatos por loteria, no máximo um lote por processo em cada loteria
+    n_processos = n_processos or os.cpu_count() or 1
+    lotes = []
+    for loteria, corte, preparado, faltando in pendentes:
+        n_lotes = min(n_processos, len(faltando))
+        for parte in np.array_split(np.arange(len(faltando)), n_lotes):
+            lotes.append((loteria, corte, preparado, [faltando[i] for i in parte]))
+
+    argumentos = ([l[2] for l in lotes], [estrategia] * len(lotes), [l[3] for l in lotes], [l[1] for l in lotes])
+    if n_processos > 1 and len(lotes) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_processos, len(lotes))) as pool:
+            avaliados = list(pool.map(_avaliar_lote, *argumentos))
+    else:
+        avaliados = [_avaliar_lote(*args) for args in zip(*argumentos)]
+
+    for (loteria, corte, _, lote), resultados in zip(lotes, avaliados):
+        for params, resultado in zip(lote, resultados):
+            cache[(versao, loteria, estrategia, _chave_params(params), str(corte))] = resultado
+            linhas.append((loteria, corte, params, resultado))
+
+    registros = []
+    for loteria, corte, params, resultado in linhas:
+        registros.append({
+            'loteria': loteria,
+            'corte': pd.Timestamp(corte),
+            'params': ', '.join(f"{chave}={valor}" for chave, valor in params.items()),
+            **params,
+            **resultado['treino'],
+            **{f"teste_{chave}": valor for chave, valor in resultado['teste'].items()},
+        })
+
+    return pd.DataFrame(registros)
+
+def get_melhores(resultados: pd.DataFrame, metrica: str = 'lift_cabeca', min_sorteios: int = 30) -> pd.DataFrame:
+    """
+    Melhor configuração de cada loteria pela métrica no treino, com o score fora
+    da amostra (teste) ao lado. Candidatos com menos de min_sorteios no treino
+    são ignorados.
+
+    Returns:
+        Uma linha por loteria, ordenada pelo score de teste
+    """
+    if len(resultados) == 0:
+        return pd.DataFrame()
+
+    validos = resultados[(resultados['sorteios'] >= min_sorteios) & resultados[metrica].notna()]
+    if len(validos) == 0:
+        return pd.DataFrame()
+
+    ordem = validos.sort_values(['loteria', metrica], ascending=[True, False], kind='stable')
+    melhores = ordem.groupby('loteria', sort=False).head(1)
+    return melhores.sort_values(f"teste_{metrica}", ascending=False, kind='stable').reset_index(drop=True)
@@ -0,0 +1,155 @@
+"""
+Módulo de presença de grupos - máscara de 25 bits por (loteria, data)
+O bit g-1 ligado indica que o grupo g saiu naquele dia
+"""
+import numpy as np
+import pandas as pd
+
+# Máscara com os 25 grupos ligados
+TODOS_GRUPOS = (1 << 25) - 1
+
+# Bit de cada grupo (índice 0 = grupo 1)
+_BITS_GRUPO = np.left_shift(np.uint32(1), np.arange(25, dtype=np.uint32))
+
+def _mascaras_por_dia(df: pd.DataFrame) -> tuple:
+    """
+    Calcula as máscaras de um DataFrame de uma única loteria.
+
+    Returns:
+        (dias desde 1970 em ordem crescente, máscara com todos os prêmios,
+         máscara só com 1° prêmio e legados)
+    """
+    dias = pd.to_datetime(df['data']).to_numpy().astype('datetime64[D]').astype(np.int32)
+    grupos = df['grupo'].to_numpy(dtype=np.int64)
+    premios = df['premio'].to_numpy(dtype=np.int64) if 'premio' in df.columns else np.zeros(len(df), dtype=np.int64)
+
+    validos = (grupos >= 1) & (grupos <= 25)
+    dias_unicos, posicao = np.unique(dias, return_inverse=True)
+    bits = np.where(validos, _BITS_GRUPO[np.clip(grupos - 1, 0, 24)], np.uint32(0))
+
+    todos = np.zeros(len(dias_unicos), dtype=np.uint32)
+    cabeca = np.zeros(len(dias_unicos), dtype=np.uint32)
+    np.bitwise_or.at(todos, posicao, bits)
+    np.bitwise_or.at(cabeca, posicao, np.where(premios <= 1, bits, np.uint32(0)))
+
+    return dias_unicos, todos, cabeca
+
+def build_presenca(df: pd.DataFrame) -> dict:
+    """
+    Constrói as máscaras de presença de grupos de cada loteria.
+
+    Returns:
+        Dict {loteria: {'dias', 'todos', 'cabeca'}} com arrays alinhados: 'dias' em
+        ordem crescente (dias desde 1970), 'todos' com a máscara de todos os prêmios
+        e 'cabeca' só com o 1° prêmio (e legados com premio=0)
+    """
+    indice = {}
+    if df is None or len(df) == 0:
+        return indice
+
+    for loteria, df_lot in df.groupby('loteria', sort=False):
+        dias, todos, cabeca = _mascaras_por_dia(df_lot)
+        indice[loteria] = {'dias': dias, 'todos': todos, 'cabeca': cabeca}
+
+    return indice
+
+def atualizar_presenca(indice: dict, df_novos: pd.DataFrame) -> dict:
+    """
+    Aplica registros recém-inseridos às máscaras (OR dos novos bits em cada dia).
+    Inserções nunca desligam bits, então não há caso de reconstrução.
+    """
+    for loteria, df_lot in df_novos.groupby('loteria', sort=False):
+        dias, todos, cabeca = _mascaras_por_dia(df_lot)
+        atual = indice.get(loteria)
+
+        if atual is None:
+            indice[loteria] = {'dias': dias, 'todos': todos, 'cabeca': cabeca}
+            continue
+
+        dias_unidos = np.union1d(atual['dias'], dias)
+        entrada = {'dias': dias_unidos}
+        for chave, novos in (('todos', todos), ('cabeca', cabeca)):
+            mascaras = np.zeros(len(dias_unidos), dtype=np.uint32)
+            mascaras[np.searchsorted(dias_unidos, atual['dias'])] = atual[chave]
+            mascaras[np.searchsorted(dias_unidos, dias)] |= novos
+            entrada[chave] = mascaras
+        indice[loteria] = entrada
+
+    return indice
+
+def get_mascara(indice: dict, loteria: str, data, somente_cabeca: bool = False) -> int:
+    """
+    Retorna a máscara de grupos de uma loteria em uma data (0 se não houve sorteio).
+    """
+    if loteria not in indice:
+        return 0
+
+    entrada = indice[loteria]
+    dia = int(np.datetime64(pd.Timestamp(data).date(), 'D').astype(np.int32))
+    pos = np.searchsorted(entrada['dias'], dia)
+
+    if pos >= len(entrada['dias']) or entrada['dias'][pos] != dia:
+        return 0
+
+    return int(entrada['cabeca' if somente_cabeca else 'todos'][pos])
+
+def get_mascaras_ciclo(indice: dict, loteria: str, datas: list) -> list:
+    """
+    Máscaras dos dias do ciclo (datas do mais recente ao mais antigo), aplicando
+    a regra de prêmio: dias 1 e 2 com todos os prêmios, dias 3 a 5 só o 1° prêmio.
+    """
+    return [
+        get_mascara(indice, loteria, data, somente_cabeca=dia_num > 2)
+        for dia_num, data in enumerate(datas, start=1)
+    ]
+
+def get_contagens_ciclo(df: pd.DataFrame, loteria: str, datas: list) -> np.ndarray:
+    """
+    Quantas vezes cada grupo saiu em cada dia do ciclo (datas do mais recente ao
+    mais antigo), com a mesma regra de prêmio de get_mascaras_ciclo. As máscaras
+    só dizem se o grupo saiu; as repetições no mesmo dia saem de um bincount.
+
+    Returns:
+        Matriz (dias do ciclo x 26) onde [dia_num - 1, grupo] é a quantidade
+    """
+    contagens = np.zeros((len(datas), 26), dtype=np.int64)
+    if df is None or len(df) == 0 or not datas:
+        return contagens
+
+    df_lot = df[df['loteria'] == loteria]
+    dias = pd.to_datetime(df_lot['data']).to_numpy().astype('datetime64[D]')
+    posicao = pd.Index(np.array(datas, dtype='datetime64[D]')).get_indexer(dias)
+    grupos = df_lot['grupo'].to_numpy(dtype=np.int64)
+    premios = df_lot['premio'].to_numpy(dtype=np.int64) if 'premio' in df_lot.columns else np.zeros(len(df_lot), dtype=np.int64)
+
+    validos = (posicao >= 0) & (grupos >= 1) & (grupos <= 25) & ((posicao < 2) | (premios <= 1))
+    return np.bincount(
+        posicao[validos] * 26 + grupos[validos], minlength=len(datas) * 26
+    ).reshape(len(datas), 26)
+
+def grupos_da_mascara(mascara: int) -> list:
+    """Lista os grupos (1-25) com o bit ligado"""
+    return [g for g in range(1, 26) if mascara >> (g - 1) & 1]
+
+def get_ausentes(mascara: int) -> list:
+    """Lista os grupos (1-25) que não saíram"""
+    return grupos_da_mascara(~mascara & TODOS_GRUPOS)
+
+def get_dias_grupo(mascaras: list, grupo: int) -> list:
+    """Números dos dias (1-5) em que o grupo saiu, dadas as máscaras do ciclo"""
+    bit = 1 << (grupo - 1)
+    return [dia_num for dia_num, mascara in enumerate(mascaras, start=1) if mascara & bit]
+
+def uniao(mascaras) -> int:
+    """Grupos que saíram em pelo menos uma das máscaras"""
+    resultado = 0
+    for mascara in mascaras:
+        resultado |= mascara
+    return resultado
+
+def intersecao(mascaras) -> int:
+    """Grupos que saíram em todas as máscaras"""
+    resultado = TODOS_GRUPOS
+    for mascara in mascaras:
+        resultado &= mascara
+    return resultado
@@ -0,0 +1,178 @@
+"""
+Módulo de sequências - dias seguidos com e sem cada grupo (run-length das máscaras de presença)
+Os dias contados são os dias com resultados da loteria
+"""
+import numpy as np
+import pandas as pd
+
+from modules.combinatorics import MODOS_PREMIO
+from modules.presenca import build_presenca
+
+_BITS = np.arange(25, dtype=np.uint32)
+
+# Sequência mínima para exibir selo
+SEQUENCIA_MINIMA = 3
+
+def _bits(mascaras: np.ndarray) -> np.ndarray:
+    """Máscaras de 25 bits -> matriz bool (dias x 25 grupos)"""
+    return ((np.asarray(mascaras, dtype=np.uint32)[:, None] >> _BITS) & 1).astype(bool)
+
+def _estado_vazio() -> dict:
+    """Sequência atual e recorde de presença e ausência de cada grupo (arrays de 25)"""
+    return {chave: np.zeros(25, dtype=np.int32) for chave in ('presenca', 'ausencia', 'max_presenca', 'max_ausencia')}
+
+def _aplicar(estado: dict, mascara: int) -> dict:
+    """Avança o estado em um dia, em O(25)"""
+    saiu = _bits([mascara])[0]
+    presenca = np.where(saiu, estado['presenca'] + 1, 0).astype(np.int32)
+    ausencia = np.where(saiu, 0, estado['ausencia'] + 1).astype(np.int32)
+    return {
+        'presenca': presenca,
+        'ausencia': ausencia,
+        'max_presenca': np.maximum(estado['max_presenca'], presenca),
+        'max_ausencia': np.maximum(estado['max_ausencia'], ausencia),
+    }
+
+def _corridas(bits: np.ndarray) -> dict:
+    """
+    Tamanho da sequência que termina em cada dia, para todos os grupos de uma vez:
+    a última quebra antes de cada dia sai de um np.maximum.accumulate.
+    """
+    linhas = np.arange(len(bits))[:, None]
+    corridas = {}
+    for chave, valor in (('presenca', True), ('ausencia', False)):
+        ultima_quebra = np.maximum.accumulate(np.where(bits != valor, linhas, -1), axis=0)
+        corridas[chave] = (linhas - ultima_quebra).astype(np.int32)
+    return corridas
+
+def _estado_historico(mascaras: np.ndarray) -> dict:
+    """Estado depois de todos os dias informados (vetorizado)"""
+    estado = _estado_vazio()
+    if len(mascaras) == 0:
+        return estado
+    for chave, corrida in _corridas(_bits(mascaras)).items():
+        estado[chave] = corrida[-1]
+        estado[f'max_{chave}'] = corrida.max(axis=0)
+    return estado
+
+def _construir(dias: np.ndarray, mascaras: np.ndarray) -> dict:
+    """
+    Entrada de uma loteria/modo. Guarda também o estado anterior ao último dia,
+    para que prêmios que completam o último dia sejam reaplicados sem reprocessar.
+    """
+    anterior = _estado_historico(mascaras[:-1])
+    return {
+        'n_dias': len(dias),
+        'ultimo_dia': int(dias[-1]),
+        'mascara_ultimo': int(mascaras[-1]),
+        'anterior': anterior,
+        'atual': _aplicar(anterior, mascaras[-1]),
+    }
+
+def build_sequencias(df: pd.DataFrame) -> dict:
+    """
+    Constrói as sequências de cada loteria nos dois modos de prêmio.
+
+    Returns:
+        Dict {loteria: {modo: {'n_dias', 'ultimo_dia', 'mascara_ultimo', 'anterior', 'atual'}}}
+        onde 'atual' tem, para cada grupo, a sequência atual de dias com
+        (presenca) e sem (ausencia) o grupo e os recordes do histórico
+    """
+    indice = {}
+    for loteria, entrada in build_presenca(df).items():
+        indice[loteria] = {
+            modo: _construir(entrada['dias'], entrada[modo]) for modo in MODOS_PREMIO
+        }
+    return indice
+
+def atualizar_sequencias(indice: dict, df_novos: pd.DataFrame) -> dict | None:
+    """
+    Avança as sequências com os dias recém-inseridos, em O(25) por dia.
+
+    Registros do último dia já contado refazem só esse dia a partir do estado
+    anterior. Resultados retroativos retornam None para reconstrução.
+    """
+    for loteria, novos in build_presenca(df_novos).items():
+        if loteria not in indice:
+            indice[loteria] = {modo: _construir(novos['dias'], novos[modo]) for modo in MODOS_PREMIO}
+            continue
+
+        for modo in MODOS_PREMIO:
+            entrada = indice[loteria][modo]
+            dias, mascaras = novos['dias'], novos[modo]
+            if dias[0] < entrada['ultimo_dia']:
+                return None
+
+            inicio = 0
+            if dias[0] == entrada['ultimo_dia']:
+                entrada['mascara_ultimo'] |= int(mascaras[0])
+                entrada['atual'] = _aplicar(entrada['anterior'], entrada['mascara_ultimo'])
+                inicio = 1
+
+            for dia, mascara in zip(dias[inicio:], mascaras[inicio:]):
+                entrada['anterior'] = entrada['atual']
+                entrada['atual'] = _aplicar(entrada['atual'], mascara)
+                entrada['mascara_ultimo'] = int(mascara)
+                entrada['ultimo_dia'] = int(dia)
+                entrada['n_dias'] += 1
+
+    return indice
+
+def get_sequencia(indice: dict, loteria: str, grupo: int, modo: str = 'todos') -> dict | None:
+    """Sequências atuais e recordes de um grupo, em O(1)"""
+    if loteria not in indice:
+        return None
+    atual = indice[loteria][modo]['atual']
+    return {chave: int(valores[grupo - 1]) for chave, valores in atual.items()}
+
+def get_selo_sequencia(sequencia: dict | None, minimo: int = SEQUENCIA_MINIMA) -> str:
+    """Selo do card: '🔥 4 dias seguidos' ou '🧊 7 dias sem sair' (🏆 quando é o recorde)"""
+    if sequencia is None:
+        return ""
+    if sequencia['presenca'] >= minimo:
+        recorde = " 🏆" if sequencia['presenca'] == sequencia['max_presenca'] else ""
+        return f"🔥 {sequencia['presenca']} dias seguidos{recorde}"
+    if sequencia['ausencia'] >= minimo:
+        recorde = " 🏆" if sequencia['ausencia'] == sequencia['max_ausencia'] else ""
+        return f"🧊 {sequencia['ausencia']} dias sem sair{recorde}"
+    return ""
+
+def get_tabela_sequencias(indice: dict, loteria: str, modo: str = 'todos') -> pd.DataFrame:
+    """
+    Sequências de todos os grupos da loteria.
+
+    Returns:
+        DataFrame com grupo, animal, presenca, ausencia, max_presenca e max_ausencia
+    """
+    if loteria not in indice:
+        return pd.DataFrame()
+
+    from modules.data_loader import GRUPO_ANIMAL
+    result = pd.DataFrame({'grupo': np.arange(1, 26), 'animal': GRUPO_ANIMAL[1:]})
+    for chave, valores in indice[loteria][modo]['atual'].items():
+        result[chave] = valores
+    return result
+
+def codificar_sequencias(indice_presenca: dict, loteria: str, grupo: int, modo: str = 'todos') -> pd.DataFrame:
+    """
+    Run-length do histórico de um grupo: cada linha é uma sequência de dias
+    seguidos com ou sem o grupo.
+
+    Returns:
+        DataFrame com inicio, fim (datas), dias e saiu (bool), em ordem cronológica
+    """
+    entrada = indice_presenca.get(loteria)
+    if entrada is None or len(entrada['dias']) == 0:
+        return pd.DataFrame()
+
+    saiu = _bits(entrada[modo])[:, grupo - 1]
+    inicios = np.flatnonzero(np.concatenate(([True], saiu[1:] != saiu[:-1])))
+    fins = np.concatenate((inicios[1:], [len(saiu)])) - 1
+    dias = entrada['dias']
+
+    return pd.DataFrame({
+        'inicio': pd.to_datetime(dias[inicios].astype('datetime64[D]')),
+        'fim': pd.to_datetime(dias[fins].astype('datetime64[D]')),
+        'dias': fins - inicios + 1,
+        'saiu': saiu[inicios],
+    })
@@ -0,0 +1,200 @@
+"""
+Módulo de significância - qui-quadrado, z-scores e entropia contra a distribuição uniforme
+Indica se os desvios de frequência são maiores do que o esperado pelo acaso
+"""
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from modules.data_loader import encode_dias
+
+# Tipo testado -> quantidade de valores possíveis
+TIPOS_TESTE = {
+    'grupo': 25,
+    'pedra': 10,
+    'dezena': 100,
+}
+
+# Frequência esperada mínima por valor para o qui-quadrado ser confiável
+ESPERADO_MINIMO = 5
+
+# Z mínimo para os selos 🔥/❄️ de um valor isolado
+LIMIAR_Z = 2
+
+_erfc = np.vectorize(math.erfc, otypes=[float])
+
+def _valores_teste(df: pd.DataFrame, tipo: str) -> np.ndarray:
+    """Códigos 0..K-1 de cada linha (grupos inválidos viram -1)"""
+    if tipo == 'grupo':
+        grupos = df['grupo'].to_numpy(dtype=np.int64)
+        return np.where((grupos >= 1) & (grupos <= 25), grupos - 1, -1)
+    milhares = df['milhar'].to_numpy(dtype=np.int64) % 10000
+    if tipo == 'pedra':
+        return milhares // 1000
+    return milhares % 100
+
+def qui2_p_valor(qui2, graus_liberdade) -> np.ndarray:
+    """
+    P-valor do qui-quadrado pela aproximação de Wilson-Hilferty
+    (boa para graus de liberdade a partir de ~3, sem depender do scipy).
+    """
+    qui2 = np.asarray(qui2, dtype=float)
+    k = np.asarray(graus_liberdade, dtype=float)
+    z = (np.cbrt(qui2 / k) - (1 - 2 / (9 * k))) / np.sqrt(2 / (9 * k))
+    return 0.5 * _erfc(z / math.sqrt(2))
+
+def get_z_score(frequencia, n, k: int) -> np.ndarray:
+    """Z-score da frequência de um valor contra a binomial uniforme (n sorteios, K valores)"""
+    frequencia = np.asarray(frequencia, dtype=float)
+    n = np.asarray(n, dtype=float)
+    p = 1 / k
+    desvio = np.sqrt(n * p * (1 - p))
+    return np.where(desvio > 0, (frequencia - n * p) / np.where(desvio > 0, desvio, 1), 0.0)
+
+def get_selo(p_valor: float, n: int, k: int) -> str:
+    """Selo de significância do teste de uniformidade"""
+    if n / k < ESPERADO_MINIMO:
+        return "⚪ Amostra pequena"
+    if p_valor < 0.01:
+        return "🔴 Desvio significativo"
+    if p_valor < 0.05:
+        return "🟡 Desvio moderado"
+    return "🟢 Compatível com o acaso"
+
+def get_limiar_z(comparacoes: int = 1) -> float:
+    """
+    Z mínimo para o selo quando o valor foi escolhido entre `comparacoes` valores
+    (ex: o mais frequente de 25 grupos). Aplica a correção de Bonferroni ao nível
+    de 5% bilateral, nunca abaixo de LIMIAR_Z.
+    """
+    return max(LIMIAR_Z, NormalDist().inv_cdf(1 - 0.025 / max(comparacoes, 1)))
+
+def get_selo_z(z: float, n: int, k: int, comparacoes: int = 1) -> str:
+    """
+    Marca valores muito acima (🔥) ou abaixo (❄️) do esperado.
+    Sem selo quando a frequência esperada por valor (n / K) é pequena demais
+    para a aproximação normal, como no get_selo.
+    """
+    if n / k < ESPERADO_MINIMO:
+        return ""
+    limiar = get_limiar_z(comparacoes)
+    if z >= limiar:
+        return "🔥"
+    if z <= -limiar:
+        return "❄️"
+    return ""
+
+def get_significancia(df: pd.DataFrame, janelas: list = None, tipos: list = None, por_loteria: bool = True) -> dict:
+    """
+    Testa a uniformidade de grupos, pedras e dezenas para todas as loterias e
+    janelas de uma vez.
+
+    As janelas são os últimos N dias com resultados de cada loteria. Um único
+    bincount por tipo monta o tensor (loteria x dia x valor); a soma acumulada
+    no eixo dos dias entrega todas as janelas, e qui-quadrado, z-scores e
+    entropia são calculados sobre o tensor inteiro.
+
+    Args:
+        df: DataFrame com os resultados
+        janelas: Quantidades de dias (None na lista = todos os dias do DataFrame)
+        tipos: Chaves de TIPOS_TESTE (padrão: todas)
+        por_loteria: Se False, todas as linhas formam um único grupo 'Todas'
+
+    Returns:
+        Dict com 'loterias', 'janelas' e, por tipo, arrays 'contagens' e 'z'
+        (loterias x janelas x valores) e 'n', 'qui2', 'p_valor', 'entropia'
+        (loterias x janelas); 'entropia' é normalizada (1 = perfeitamente uniforme)
+    """
+    janelas = list(janelas or [None])
+    tipos = list(tipos or TIPOS_TESTE)
+    resultado = {'loterias': [], 'janelas': janelas}
+
+    if df is None or len(df) == 0:
+        return resultado
+
+    if por_loteria:
+        loteria_ids, nomes = pd.factorize(df['loteria'])
+        nomes = list(nomes)
+    else:
+        loteria_ids, nomes = np.zeros(len(df), dtype=np.int64), ['Todas']
+    loteria_ids = loteria_ids.astype(np.int64)
+    n_loterias = len(nomes)
+    resultado['loterias'] = nomes
+
+    # Posição de cada linha entre os dias da sua loteria (0 = dia mais recente)
+    dias = encode_dias(df['data'])
+    chave = loteria_ids * (1 << 32) + (dias.max() - dias)
+    chaves_unicas, por_linha = np.unique(chave, return_inverse=True)
+    loteria_dia = chaves_unicas >> 32
+    inicio = np.searchsorted(loteria_dia, np.arange(n_loterias))
+    posicao_dia = (np.arange(len(chaves_unicas)) - inicio[loteria_dia])[por_linha]
+    n_dias = np.bincount(loteria_dia, minlength=n_loterias)
+    max_dias = int(n_dias.max())
+
+    # Janela -> quantidade de dias somados em cada loteria (loterias x janelas)
+    tamanhos = np.array([max_dias if j is None else j for j in janelas], dtype=np.int64)
+    corte = np.minimum(tamanhos[None, :], n_dias[:, None])
+
+    for tipo in tipos:
+        k = TIPOS_TESTE[tipo]
+        valores = _valores_teste(df, tipo)
+        validos = valores >= 0
+        plano = (loteria_ids[validos] * max_dias + posicao_dia[validos]) * k + valores[validos]
+        por_dia = np.bincount(plano, minlength=n_loterias * max_dias * k).reshape(n_loterias, max_dias, k)
+        acumulado = np.concatenate([np.zeros((n_loterias, 1, k), dtype=np.int64), np.cumsum(por_dia, axis=1)], axis=1)
+        contagens = acumulado[np.arange(n_loterias)[:, None], corte]  # (loterias x janelas x k)
+
+        n = contagens.sum(axis=2)
+        esperado = n / k
+        qui2 = ((contagens - esperado[..., None]) ** 2).sum(axis=2) / np.where(esperado > 0, esperado, 1)
+        proporcoes = contagens / np.where(n > 0, n, 1)[..., None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entropia = -np.where(proporcoes > 0, proporcoes * np.log2(proporcoes), 0).sum(axis=2) / math.log2(k)
+
+        resultado[tipo] = {
+            'contagens': contagens,
+            'n': n,
+            'qui2': qui2,
+            'p_valor': np.where(n > 0, qui2_p_valor(qui2, k - 1), 1.0),
+            'z': get_z_score(contagens, n[..., None], k),
+            'entropia': entropia,
+        }
+
+    return resultado
+
+def get_resumo_significancia(resultado: dict) -> pd.DataFrame:
+    """
+    Tabela com um teste por (loteria, janela, tipo).
+
+    Returns:
+        DataFrame com loteria, janela, tipo, n, qui2, gl, p_valor, entropia,
+        z_max, valor_z_max (valor mais acima do esperado) e selo
+    """
+    linhas = []
+    for tipo, k in TIPOS_TESTE.items():
+        if tipo not in resultado:
+            continue
+        testes = resultado[tipo]
+        for i, loteria in enumerate(resultado['loterias']):
+            for j, janela in enumerate(resultado['janelas']):
+                n = int(testes['n'][i, j])
+                if n == 0:
+                    continue
+                maior = int(np.argmax(testes['z'][i, j]))
+                linhas.append({
+                    'loteria': loteria,
+                    'janela': 'Tudo' if janela is None else f"{janela} dias",
+                    'tipo': tipo,
+                    'n': n,
+                    'qui2': round(float(testes['qui2'][i, j]), 1),
+                    'gl': k - 1,
+                    'p_valor': round(float(testes['p_valor'][i, j]), 4),
+                    'entropia': round(float(testes['entropia'][i, j]), 3),
+                    'z_max': round(float(testes['z'][i, j, maior]), 2),
+                    'valor_z_max': f"{maior + 1:02d}" if tipo == 'grupo' else (f"{maior:02d}" if tipo == 'dezena' else str(maior)),
+                    'selo': get_selo(float(testes['p_valor'][i, j]), n, k),
+                })
+
+    return pd.DataFrame(linhas)
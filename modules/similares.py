@@ -0,0 +1,196 @@
+"""
+Módulo de dias parecidos - vetor de características por (loteria, data) e busca dos k vizinhos mais próximos
+Cada dia vira um vetor com as contagens de grupos, pedras e linhas; a busca é um único produto/soma vetorizado
+"""
+import numpy as np
+import pandas as pd
+
+from modules.agrupamentos import ESQUEMAS
+from modules.combinatorics import get_codigos_grupo, selecionar_premios
+from modules.data_loader import encode_dias, GRUPO_ANIMAL
+
+# Blocos do vetor de características -> quantidade de colunas
+BLOCOS = {
+    'grupo': 25,
+    'pedra': 10,
+    'linha': len(ESQUEMAS['linhas']['rotulos']),
+}
+
+# Início de cada bloco no vetor
+_INICIO_BLOCO = dict(zip(BLOCOS, np.concatenate(([0], np.cumsum(list(BLOCOS.values()))[:-1]))))
+
+METRICAS_DISTANCIA = {
+    'cosseno': 'Cosseno',
+    'l1': 'L1 (soma das diferenças)',
+}
+
+# Grupo (código 0-24) -> linha (0-4)
+_LINHA_GRUPO = ESQUEMAS['linhas']['mapa'][1:]
+
+def _contar_dias(df: pd.DataFrame) -> tuple:
+    """
+    Contagens por dia de um DataFrame de uma loteria: grupos e pedras saem de
+    um bincount sobre (dia, valor); as linhas são somas dos grupos de cada linha.
+
+    Returns:
+        (dias desde 1970 em ordem crescente, matriz int32 dias x colunas de BLOCOS)
+    """
+    dias, posicao = np.unique(encode_dias(df['data']), return_inverse=True)
+    n_dias = len(dias)
+    grupos = get_codigos_grupo(df)
+    pedras = (df['milhar'].to_numpy(dtype=np.int64) % 10000) // 1000
+
+    contagens = np.zeros((n_dias, sum(BLOCOS.values())), dtype=np.int32)
+    for bloco, valores in (('grupo', grupos), ('pedra', pedras)):
+        validos = valores >= 0
+        k, inicio = BLOCOS[bloco], _INICIO_BLOCO[bloco]
+        contagens[:, inicio:inicio + k] = np.bincount(
+            posicao[validos] * k + valores[validos], minlength=n_dias * k
+        ).reshape(n_dias, k)
+
+    inicio = _INICIO_BLOCO['linha']
+    por_grupo = contagens[:, :BLOCOS['grupo']]
+    for linha in range(BLOCOS['linha']):
+        contagens[:, inicio + linha] = por_grupo[:, _LINHA_GRUPO == linha].sum(axis=1)
+
+    return dias.astype(np.int32), contagens
+
+def build_similares(df: pd.DataFrame, modo: str = 'todos') -> dict:
+    """
+    Constrói a matriz de características (dias x colunas) de cada loteria.
+
+    Returns:
+        Dict {'modo', 'loterias': {loteria: {'dias', 'contagens'}}} com 'dias'
+        em ordem crescente (dias desde 1970)
+    """
+    indice = {'modo': modo, 'loterias': {}}
+    df_sel = selecionar_premios(df, modo)
+
+    if len(df_sel) == 0:
+        return indice
+
+    for loteria, df_lot in df_sel.groupby('loteria', sort=False):
+        dias, contagens = _contar_dias(df_lot)
+        indice['loterias'][loteria] = {'dias': dias, 'contagens': contagens}
+
+    return indice
+
+def atualizar_similares(indice: dict, df_novos: pd.DataFrame) -> dict:
+    """Soma os registros recém-inseridos às linhas dos seus dias (criando os dias novos)"""
+    df_sel = selecionar_premios(df_novos, indice['modo'])
+
+    for loteria, df_lot in df_sel.groupby('loteria', sort=False):
+        dias, contagens = _contar_dias(df_lot)
+        atual = indice['loterias'].get(loteria)
+
+        if atual is None:
+            indice['loterias'][loteria] = {'dias': dias, 'contagens': contagens}
+            continue
+
+        dias_unidos = np.union1d(atual['dias'], dias)
+        unidas = np.zeros((len(dias_unidos), contagens.shape[1]), dtype=np.int32)
+        unidas[np.searchsorted(dias_unidos, atual['dias'])] = atual['contagens']
+        unidas[np.searchsorted(dias_unidos, dias)] += contagens
+        indice['loterias'][loteria] = {'dias': dias_unidos, 'contagens': unidas}
+
+    return indice
+
+def get_vetores(contagens: np.ndarray, blocos: list = None) -> np.ndarray:
+    """
+    Vetores comparáveis entre dias: cada bloco vira proporção (soma 1), então dias
+    com mais ou menos sorteios têm o mesmo peso.
+    """
+    partes = []
+    for bloco in blocos or list(BLOCOS):
+        inicio = _INICIO_BLOCO[bloco]
+        parte = contagens[:, inicio:inicio + BLOCOS[bloco]].astype(np.float32)
+        total = parte.sum(axis=1, keepdims=True)
+        partes.append(parte / np.where(total > 0, total, 1))
+    return np.hstack(partes)
+
+def buscar_similares(indice: dict, loteria: str, data=None, k: int = 10,
+                     metrica: str = 'cosseno', blocos: list = None) -> pd.DataFrame:
+    """
+    Dias anteriores mais parecidos com o dia de referência.
+
+    As distâncias para todos os dias anteriores saem de uma vez (produto matriz x
+    vetor no cosseno, soma das diferenças absolutas no L1) e os k menores são
+    separados com argpartition, sem ordenar o histórico inteiro.
+
+    Args:
+        indice: Resultado de build_similares
+        loteria: Loteria consultada
+        data: Dia de referência (padrão: o mais recente da loteria)
+        k: Quantidade de vizinhos
+        metrica: Chave de METRICAS_DISTANCIA
+        blocos: Blocos usados na comparação (padrão: todos)
+
+    Returns:
+        DataFrame com data, distancia, similaridade (0-100%) e proxima_data
+        (dia seguinte com resultados), ordenado do mais parecido; empates
+        ficam com o dia mais recente
+    """
+    entrada = indice['loterias'].get(loteria)
+    if entrada is None or len(entrada['dias']) < 2:
+        return pd.DataFrame()
+
+    dias = entrada['dias']
+    if data is None:
+        referencia = len(dias) - 1
+    else:
+        dia = encode_dias([data])[0]
+        referencia = int(np.searchsorted(dias, dia))
+        if referencia >= len(dias) or dias[referencia] != dia:
+            return pd.DataFrame()
+    if referencia == 0:
+        return pd.DataFrame()
+
+    vetores = get_vetores(entrada['contagens'][:referencia + 1], blocos).astype(np.float64)
+    candidatos, alvo = vetores[:-1], vetores[-1]
+
+    if metrica == 'cosseno':
+        normas = np.linalg.norm(candidatos, axis=1) * np.linalg.norm(alvo)
+        similaridade = (candidatos @ alvo) / np.where(normas > 0, normas, 1)
+        distancia = 1 - similaridade
+    else:
+        distancia = np.abs(candidatos - alvo).sum(axis=1)
+        similaridade = 1 - distancia / (2 * len(blocos or BLOCOS))
+
+    k = min(k, len(candidatos))
+    vizinhos = np.argpartition(distancia, k - 1)[:k]
+    vizinhos = vizinhos[np.lexsort((-vizinhos, distancia[vizinhos]))]
+
+    proximos = vizinhos + 1
+    return pd.DataFrame({
+        'data': pd.to_datetime(dias[vizinhos].astype('datetime64[D]')),
+        'distancia': distancia[vizinhos].round(4),
+        'similaridade': (similaridade[vizinhos] * 100).round(1),
+        'proxima_data': pd.to_datetime(dias[proximos].astype('datetime64[D]')),
+    })
+
+def get_o_que_veio_depois(indice: dict, loteria: str, vizinhos: pd.DataFrame) -> pd.DataFrame:
+    """
+    Grupos que saíram no dia seguinte aos dias parecidos.
+
+    Returns:
+        DataFrame com grupo, animal, frequencia (soma nos dias seguintes),
+        dias (em quantos dias seguintes o grupo saiu) e percentual dos dias,
+        ordenado por dias e frequência
+    """
+    entrada = indice['loterias'].get(loteria)
+    if entrada is None or len(vizinhos) == 0:
+        return pd.DataFrame()
+
+    proximos = encode_dias(vizinhos['proxima_data']).astype(np.int32)
+    linhas = np.searchsorted(entrada['dias'], proximos)
+    grupos = entrada['contagens'][linhas, :BLOCOS['grupo']]
+
+    result = pd.DataFrame({
+        'grupo': np.arange(1, 26),
+        'animal': GRUPO_ANIMAL[1:],
+        'frequencia': grupos.sum(axis=0),
+        'dias': (grupos > 0).sum(axis=0),
+    })
+    result['percentual'] = (result['dias'] / len(vizinhos) * 100).round(1)
+    result = result[result['frequencia'] > 0]
+    return result.sort_values(['dias', 'frequencia'], ascending=False, kind='stable').reset_index(drop=True)
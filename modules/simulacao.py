@@ -0,0 +1,116 @@
+"""
+Módulo de simulação (modelo nulo) - históricos sintéticos com sorteios uniformes
+Serve para avaliar se um grupo "quente" na janela é mais do que ruído
+"""
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.data_loader import HORARIOS_POR_LOTERIA, HORARIOS_PADRAO
+
+# Prêmios por sorteio (como no Processador)
+PREMIOS_POR_SORTEIO = 5
+
+# Estatísticas calculadas em cada histórico sintético
+ESTATISTICAS = ['freq_max', 'ausentes', 'qui2']
+
+def get_resultados_janela(loteria: str, n_dias: int = 5, regra_premio: bool = True) -> int:
+    """
+    Quantidade de resultados da janela pela grade de horários da loteria.
+    Com a regra de prêmio, os dias 1 e 2 contam os 5 prêmios e os dias 3 a 5 só o 1°.
+    """
+    horarios = len(HORARIOS_POR_LOTERIA.get(loteria, HORARIOS_PADRAO))
+    if not regra_premio:
+        return n_dias * horarios * PREMIOS_POR_SORTEIO
+    dias_completos = min(n_dias, 2)
+    return dias_completos * horarios * PREMIOS_POR_SORTEIO + (n_dias - dias_completos) * horarios
+
+def _simular_lote(n_resultados: int, n_simulacoes: int, semente) -> dict:
+    """
+    Simula um lote de históricos de uma vez: matriz (simulações x resultados) de
+    grupos uniformes e contagem por grupo com um único bincount deslocado.
+    """
+    rng = np.random.default_rng(semente)
+    grupos = rng.integers(0, 25, size=(n_simulacoes, n_resultados), dtype=np.int64)
+    deslocamento = np.arange(n_simulacoes, dtype=np.int64)[:, None] * 25
+    contagens = np.bincount((grupos + deslocamento).ravel(), minlength=n_simulacoes * 25).reshape(n_simulacoes, 25)
+
+    esperado = n_resultados / 25
+    return {
+        'freq_max': contagens.max(axis=1),
+        'ausentes': (contagens == 0).sum(axis=1),
+        'qui2': ((contagens - esperado) ** 2).sum(axis=1) / esperado,
+        'freq_grupo': np.bincount(contagens.ravel(), minlength=n_resultados + 1),
+    }
+
+def simular(n_resultados: int, n_simulacoes: int = 100_000, n_processos: int = None,
+            semente: int = None, tamanho_lote: int = 10_000) -> dict:
+    """
+    Gera N históricos sintéticos da janela sob o modelo nulo (todos os grupos
+    igualmente prováveis) e calcula as estatísticas de cada um.
+
+    Os lotes são vetorizados com numpy e distribuídos em um pool de processos;
+    cada lote recebe uma semente independente (SeedSequence.spawn), então o
+    resultado é reprodutível para a mesma semente.
+
+    Args:
+        n_resultados: Resultados (grupos sorteados) na janela
+        n_simulacoes: Quantidade de históricos sintéticos
+        n_processos: Processos do pool (padrão: núcleos da máquina; 1 = sem pool)
+        semente: Semente para reprodutibilidade (opcional)
+        tamanho_lote: Simulações por lote
+
+    Returns:
+        Dict com 'n_resultados', 'n_simulacoes', arrays por simulação de
+        'freq_max', 'ausentes' e 'qui2', e 'freq_grupo' (histograma da
+        frequência de um grupo qualquer, somado em todas as simulações)
+    """
+    n_resultados = int(n_resultados)
+    lotes = [tamanho_lote] * (n_simulacoes // tamanho_lote)
+    if n_simulacoes % tamanho_lote:
+        lotes.append(n_simulacoes % tamanho_lote)
+    sementes = np.random.SeedSequence(semente).spawn(len(lotes))
+
+    n_processos = n_processos or os.cpu_count() or 1
+    if n_processos > 1 and len(lotes) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_processos, len(lotes))) as pool:
+            partes = list(pool.map(_simular_lote, [n_resultados] * len(lotes), lotes, sementes))
+    else:
+        partes = [_simular_lote(n_resultados, n, s) for n, s in zip(lotes, sementes)]
+
+    resultado = {'n_resultados': n_resultados, 'n_simulacoes': n_simulacoes}
+    for estatistica in ESTATISTICAS:
+        resultado[estatistica] = np.concatenate([p[estatistica] for p in partes])
+    resultado['freq_grupo'] = np.sum([p['freq_grupo'] for p in partes], axis=0)
+
+    return resultado
+
+def avaliar_grupos(simulacao: dict, frequencias: dict) -> pd.DataFrame:
+    """
+    Compara as frequências observadas dos grupos com o modelo nulo.
+
+    Args:
+        simulacao: Resultado de simular()
+        frequencias: Dict {grupo: frequência observada na janela}
+
+    Returns:
+        DataFrame com grupo, frequencia, p_grupo (chance de um grupo específico
+        sair pelo menos tantas vezes) e p_max (chance de o grupo mais frequente
+        de uma janela aleatória sair pelo menos tantas vezes - já corrige por
+        olhar 25 grupos de uma vez), ordenado por frequência
+    """
+    cauda_grupo = np.cumsum(simulacao['freq_grupo'][::-1])[::-1] / simulacao['freq_grupo'].sum()
+    maximos = np.sort(simulacao['freq_max'])
+
+    grupos = np.array(list(frequencias.keys()), dtype=np.int64)
+    freq = np.array(list(frequencias.values()), dtype=np.int64)
+    indice_cauda = np.minimum(freq, len(cauda_grupo) - 1)
+
+    result = pd.DataFrame({
+        'grupo': grupos,
+        'frequencia': freq,
+        'p_grupo': np.where(freq < len(cauda_grupo), cauda_grupo[indice_cauda], 0.0),
+        'p_max': 1 - np.searchsorted(maximos, freq, side='left') / len(maximos),
+    })
+    return result.sort_values('frequencia', ascending=False, kind='stable').reset_index(drop=True)
@@ -1,9 +1,31 @@
 """
 Módulo de cálculos estatísticos do Jogo do Bicho
 """
+import numpy as np
 import pandas as pd
 from collections import Counter
 
+from modules import agrupamentos
+
+def _tabela_assinaturas(digitos: int) -> tuple:
+    """
+    Mapeia cada número de `digitos` dígitos para a assinatura dos seus dígitos
+    ordenados (ex: 7345 -> '3457'). Números que são permutações um do outro
+    compartilham a mesma assinatura.
+    
+    Returns:
+        (id da assinatura de cada número, texto de cada assinatura)
+    """
+    numeros = np.arange(10 ** digitos)
+    casas = 10 ** np.arange(digitos - 1, -1, -1)
+    ordenados = np.sort((numeros[:, None] // casas) % 10, axis=1)
+    codigos, ids = np.unique(ordenados @ casas, return_inverse=True)
+    return ids.astype(np.int16), np.array([f"{c:0{digitos}d}" for c in codigos])
+
+# Assinaturas de invertida: 715 multiconjuntos de 4 dígitos e 220 de 3 dígitos
+ASSINATURA_MILHAR, ASSINATURAS_MILHAR = _tabela_assinaturas(4)
+ASSINATURA_CENTENA, ASSINATURAS_CENTENA = _tabela_assinaturas(3)
+
 def get_grupo_frequency(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
     """
     Calcula frequência dos grupos
@@ -47,6 +69,63 @@ def get_milhar_frequency(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
     
     return freq.head(top_n)
 
+def _invertida_frequency(valores: np.ndarray, assinatura: np.ndarray, textos: np.ndarray, top_n: int) -> pd.DataFrame:
+    """Ranking por assinatura de dígitos com um único bincount"""
+    ids = assinatura[valores]
+    contagens = np.bincount(ids, minlength=len(textos))
+    
+    # Quantas permutações distintas cada assinatura tem e quantas efetivamente saíram
+    permutacoes = np.bincount(assinatura, minlength=len(textos))
+    saidas = np.bincount(assinatura[np.unique(valores)], minlength=len(textos))
+    
+    presentes = np.flatnonzero(contagens)
+    presentes = presentes[np.argsort(-contagens[presentes], kind='stable')][:top_n]
+    
+    return pd.DataFrame({
+        'assinatura': textos[presentes],
+        'frequencia': contagens[presentes],
+        'permutacoes': permutacoes[presentes],
+        'permutacoes_saidas': saidas[presentes],
+    })
+
+def get_milhar_invertida_frequency(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+    """
+    Calcula frequência das milhares invertidas: todas as permutações dos dígitos
+    contam juntas (ex: 7345, 3457 e 5734 somam na assinatura '3457')
+    """
+    if df is None or len(df) == 0:
+        return pd.DataFrame()
+    
+    milhares = df['milhar'].to_numpy(dtype=np.int64) % 10000
+    return _invertida_frequency(milhares, ASSINATURA_MILHAR, ASSINATURAS_MILHAR, top_n)
+
+def get_centena_invertida_frequency(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
+    """
+    Calcula frequência das centenas invertidas (permutações dos 3 dígitos)
+    """
+    if df is None or len(df) == 0:
+        return pd.DataFrame()
+    
+    centenas = df['centena'].to_numpy(dtype=np.int64) % 1000
+    return _invertida_frequency(centenas, ASSINATURA_CENTENA, ASSINATURAS_CENTENA, top_n)
+
+def get_frequencia_invertida(df: pd.DataFrame, numero: int, digitos: int = 4) -> int:
+    """
+    Quantas vezes alguma permutação de `numero` saiu no DataFrame
+    (digitos=4 para milhar invertida, 3 para centena invertida)
+    """
+    if df is None or len(df) == 0:
+        return 0
+    
+    if digitos == 4:
+        assinatura = ASSINATURA_MILHAR
+        valores = df['milhar'].to_numpy(dtype=np.int64) % 10000
+    else:
+        assinatura = ASSINATURA_CENTENA
+        valores = df['centena'].to_numpy(dtype=np.int64) % 1000
+    
+    return int((assinatura[valores] == assinatura[numero]).sum())
+
 def get_repeticoes_grupos(df: pd.DataFrame) -> pd.DataFrame:
     """
     Identifica grupos que se repetem em sequência
@@ -134,36 +213,17 @@ def get_linhas_grupos(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or len(df) == 0:
         return pd.DataFrame()
     
-    def get_linha(grupo):
-        if 1 <= grupo <= 5:
-            return 1
-        elif 6 <= grupo <= 10:
-            return 2
-        elif 11 <= grupo <= 15:
-            return 3
-        elif 16 <= grupo <= 20:
-            return 4
-        elif 21 <= grupo <= 25:
-            return 5
-        return 0
+    esquema = agrupamentos.ESQUEMAS['linhas']
+    contagens = agrupamentos.contar_esquema(df['grupo'].to_numpy(), esquema)
     
-    df_copy = df.copy()
-    df_copy['linha'] = df_copy['grupo'].apply(get_linha)
+    freq = pd.DataFrame({
+        'linha': np.arange(1, len(contagens) + 1),
+        'frequencia': contagens,
+        'descricao': [agrupamentos.get_descricao_classe(esquema, c) for c in range(len(contagens))]
+    })
+    freq = freq[freq['frequencia'] > 0].sort_values('frequencia', ascending=False, kind='stable')
     
-    linhas_desc = {
-        1: 'Linha 1 (01-05): Avestruz, Águia, Burro, Borboleta, Cachorro',
-        2: 'Linha 2 (06-10): Cabra, Carneiro, Camelo, Cobra, Coelho',
-        3: 'Linha 3 (11-15): Cavalo, Elefante, Galo, Gato, Jacaré',
-        4: 'Linha 4 (16-20): Leão, Macaco, Porco, Pavão, Peru',
-        5: 'Linha 5 (21-25): Touro, Tigre, Urso, Veado, Vaca'
-    }
-    
-    freq = df_copy['linha'].value_counts().reset_index()
-    freq.columns = ['linha', 'frequencia']
-    freq['descricao'] = freq['linha'].map(linhas_desc)
-    freq = freq.sort_values('frequencia', ascending=False)
-    
-    return freq
+    return freq.reset_index(drop=True)
 
 def get_correlacao_grupo_centena(df: pd.DataFrame, grupo: int) -> pd.DataFrame:
     """
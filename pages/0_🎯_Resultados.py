@@ -70,6 +70,10 @@ from modules.data_loader import (
     filter_day_data_by_prize
 )
 
+from modules import busca, frequentes
+from modules import statistics as stats
+from modules.indices import get_indice
+
 df = st.session_state.dados
 
 # Sidebar - Filtro por Loteria (OBRIGATÓRIO)
@@ -81,6 +85,17 @@ loteria_selecionada = st.sidebar.selectbox(
     help="Cada loteria é analisada separadamente."
 )
 
+# Sidebar - Filtro por padrão de milhar (histórico)
+st.sidebar.header("🧩 Filtro por Padrão")
+padrao_milhar = st.sidebar.text_input(
+    "Padrão de milhar:",
+    placeholder="Ex: 7?4?",
+    help="Use ? para qualquer dígito e [..] para conjuntos ou faixas. Ex: 7?4?, [12]??5, ?[0-4]?9",
+    key="padrao_milhar"
+)
+PERIODOS_PADRAO = {'Últimos 7 dias': 7, 'Últimos 30 dias': 30, 'Últimos 365 dias': 365, 'Todo o histórico': None}
+periodo_padrao = st.sidebar.selectbox("Período:", list(PERIODOS_PADRAO.keys()), key="periodo_padrao")
+
 # Filtrar dados - apenas últimos 5 dias
 df_5dias = filter_5_day_cycle(df, loteria_selecionada)
 df_5dias = df_5dias.sort_values(['data', 'horario'], ascending=[False, True])
@@ -201,6 +216,154 @@ for idx, data in enumerate(datas_5dias):
     
     st.markdown("---")
 
+# Resultado do filtro por padrão de milhar (bitmaps por posição)
+if padrao_milhar:
+    st.subheader(f"🧩 Milhares no padrão {padrao_milhar} - {loteria_selecionada}")
+    indice_busca = get_indice('busca', df, busca.build_indice_busca)
+    dias_padrao = PERIODOS_PADRAO[periodo_padrao]
+    desde = pd.Timestamp(df['data'].max()).normalize() - pd.Timedelta(days=dias_padrao - 1) if dias_padrao else None
+    
+    try:
+        casados = busca.buscar_padrao(indice_busca, padrao_milhar, loteria_selecionada, desde=desde, limite=500)
+    except ValueError as e:
+        st.error(f"❌ Padrão inválido: {e}")
+        casados = None
+    
+    if casados is not None:
+        if len(casados) == 0:
+            st.info(f"ℹ️ Nenhuma milhar no padrão **{padrao_milhar}** ({periodo_padrao.lower()}).")
+        else:
+            st.success(f"✅ {len(casados)} milhar(es) encontradas ({periodo_padrao.lower()}).")
+            display_padrao = casados.copy()
+            display_padrao['data'] = display_padrao['data'].dt.strftime('%d/%m/%Y')
+            display_padrao['premio'] = display_padrao['premio'].apply(lambda x: f"{x}°" if x > 0 else "—")
+            display_padrao['grupo'] = display_padrao['grupo'].apply(lambda x: f"{x:02d}")
+            display_padrao['milhar'] = display_padrao['milhar'].apply(lambda x: f"{x:04d}")
+            st.dataframe(
+                display_padrao[['data', 'horario', 'premio', 'grupo', 'milhar']].rename(columns={
+                    'data': 'Data',
+                    'horario': 'Horário',
+                    'premio': 'Prêmio',
+                    'grupo': 'Grupo',
+                    'milhar': 'Milhar'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+    
+    st.divider()
+
+# Busca de número no histórico completo (índice invertido)
+st.subheader("🔎 Buscar Número no Histórico")
+
+col_num, col_modo, col_escopo = st.columns([1, 2, 1])
+with col_num:
+    numero_busca = st.text_input("Número:", max_chars=4, placeholder="Ex: 7345 ou 45", key="busca_numero")
+with col_modo:
+    modo_busca = st.radio(
+        "Tipo de busca:",
+        options=list(busca.MODOS_BUSCA.keys()),
+        format_func=lambda m: busca.MODOS_BUSCA[m],
+        index=1,
+        horizontal=True,
+        key="busca_modo"
+    )
+with col_escopo:
+    somente_loteria = st.checkbox(f"Somente {loteria_selecionada}", value=True, key="busca_loteria")
+
+if numero_busca:
+    if not numero_busca.strip().isdigit():
+        st.error("❌ Digite apenas números (1 a 4 dígitos).")
+    else:
+        indice_busca = get_indice('busca', df, busca.build_indice_busca)
+        loteria_busca = loteria_selecionada if somente_loteria else None
+        total = busca.contar_aparicoes(indice_busca, numero_busca, modo_busca, loteria_busca)
+        encontrados = busca.buscar_numero(indice_busca, numero_busca, modo_busca, loteria_busca, limite=50)
+        
+        if total == 0:
+            st.info(f"ℹ️ Nenhuma aparição de **{numero_busca}** encontrada no histórico.")
+        else:
+            ultima = encontrados.iloc[0]
+            st.success(
+                f"✅ **{total} aparição(ões)**. Última: {ultima['data'].strftime('%d/%m/%Y')} — "
+                f"{ultima['loteria']} {ultima['horario']} (milhar {ultima['milhar']:04d})"
+            )
+            
+            display_busca = encontrados.copy()
+            display_busca['data'] = display_busca['data'].dt.strftime('%d/%m/%Y')
+            display_busca['premio'] = display_busca['premio'].apply(lambda x: f"{x}°" if x > 0 else "—")
+            display_busca['grupo'] = display_busca['grupo'].apply(lambda x: f"{x:02d}")
+            display_busca['milhar'] = display_busca['milhar'].apply(lambda x: f"{x:04d}")
+            st.dataframe(
+                display_busca[['data', 'loteria', 'horario', 'premio', 'grupo', 'milhar']].rename(columns={
+                    'data': 'Data',
+                    'loteria': 'Loteria',
+                    'horario': 'Horário',
+                    'premio': 'Prêmio',
+                    'grupo': 'Grupo',
+                    'milhar': 'Milhar'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+            if total > len(encontrados):
+                st.caption(f"Exibindo as {len(encontrados)} aparições mais recentes.")
+
+st.divider()
+
+# Números mais sorteados em qualquer intervalo de meses (resumos por loteria e mês)
+st.subheader("🏅 Milhares e Centenas Mais Sorteadas")
+
+indice_frequentes = get_indice('frequentes', df, frequentes.build_frequentes, frequentes.atualizar_frequentes)
+
+col_tipo_freq, col_escopo_freq, col_modo_freq = st.columns([2, 1, 1])
+with col_tipo_freq:
+    tipo_freq = st.radio(
+        "Tipo:", options=list(frequentes.TIPOS_FREQUENTES.keys()),
+        format_func=lambda t: {'milhar': 'Milhares', 'centena': 'Centenas'}[t],
+        horizontal=True, key="frequentes_tipo"
+    )
+with col_escopo_freq:
+    somente_loteria_freq = st.checkbox(f"Somente {loteria_selecionada}", value=True, key="frequentes_loteria")
+with col_modo_freq:
+    aproximado = st.checkbox(
+        "Modo aproximado", value=False, key="frequentes_aproximado",
+        help="Une os resumos Space-Saving de cada mês (memória constante) em vez de recontar o histórico."
+    )
+
+loterias_freq = [loteria_selecionada] if somente_loteria_freq else None
+meses_freq = frequentes.get_meses(indice_frequentes, loterias_freq)
+if meses_freq:
+    if len(meses_freq) > 1:
+        mes_inicio, mes_fim = st.select_slider(
+            "Meses:", options=meses_freq, value=(meses_freq[0], meses_freq[-1]),
+            format_func=lambda m: f"{m % 100:02d}/{m // 100}", key="frequentes_meses"
+        )
+    else:
+        mes_inicio = mes_fim = meses_freq[0]
+    meses_sel = [m for m in meses_freq if mes_inicio <= m <= mes_fim]
+
+    if aproximado:
+        top_freq = frequentes.get_top_frequentes(indice_frequentes, tipo_freq, 50, loterias_freq, meses_sel)
+    else:
+        df_freq = df if loterias_freq is None else df[df['loteria'].isin(loterias_freq)]
+        datas_freq = pd.to_datetime(df_freq['data'])
+        df_freq = df_freq[(datas_freq.dt.year * 100 + datas_freq.dt.month).between(mes_inicio, mes_fim)]
+        top_freq = stats.get_milhar_frequency(df_freq, 50) if tipo_freq == 'milhar' else stats.get_centena_frequency(df_freq, 50)
+
+    if len(top_freq) > 0:
+        colunas_freq = {f'{tipo_freq}_fmt': tipo_freq.capitalize(), 'frequencia': 'Frequência'}
+        if aproximado:
+            colunas_freq['minimo'] = 'Mínimo garantido'
+            st.caption("No modo aproximado a frequência real fica entre o mínimo garantido e a frequência exibida.")
+        st.dataframe(
+            top_freq[list(colunas_freq.keys())].rename(columns=colunas_freq),
+            use_container_width=True,
+            hide_index=True
+        )
+
+st.divider()
+
 # Tabela completa
 with st.expander("📋 Ver tabela completa"):
     display_df = df_5dias.copy()
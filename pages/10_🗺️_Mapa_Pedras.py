@@ -97,6 +97,7 @@ from modules.data_loader import (
     filter_by_day_prize_rules, filter_day_data_by_prize
 )
 from modules import statistics as stats
+from modules import digitos
 
 df = st.session_state.dados
 
@@ -296,6 +297,29 @@ with col2:
     st.markdown(f"**Presentes:** 🔵 ({','.join(map(str, baixas_c)) or '—'}), 🟢 ({','.join(map(str, medias_c)) or '—'}), 🟡 ({','.join(map(str, altas_c)) or '—'})")
     st.markdown(f"**Ausentes:** 🔵 ({','.join(map(str, ausentes_baixas_c)) or '—'}), 🟢 ({','.join(map(str, ausentes_medias_c)) or '—'}), 🟡 ({','.join(map(str, ausentes_altas_c)) or '—'})")
 
+st.divider()
+
+# Características derivadas das milhares (soma, pares, alto/baixo, espelho...)
+st.subheader("🔢 Características das Milhares")
+caracteristica = st.selectbox(
+    "Característica:",
+    options=list(digitos.CARACTERISTICAS.keys()),
+    format_func=lambda c: digitos.CARACTERISTICAS[c]['rotulo'],
+    key="digitos_caracteristica"
+)
+distribuicao = digitos.get_distribuicoes(df[df['loteria'] == loteria_sel], [caracteristica], janelas=[5, 30, None])
+if len(distribuicao) > 0:
+    tabela_dist = distribuicao.pivot(index='rotulo', columns='janela', values='percentual')
+    tabela_dist = tabela_dist.reindex(index=digitos.CARACTERISTICAS[caracteristica]['rotulos'], columns=distribuicao['janela'].unique())
+    tabela_dist['Esperado'] = digitos.get_esperado(caracteristica).round(2)
+    st.dataframe(
+        tabela_dist.rename_axis(index=digitos.CARACTERISTICAS[caracteristica]['rotulo'], columns=None).rename(
+            columns=lambda c: f"{c} (%)"
+        ),
+        use_container_width=True
+    )
+    st.caption("Percentual das milhares de cada janela (últimos dias com resultados, todos os prêmios). Esperado = se todas as milhares fossem igualmente prováveis.")
+
 st.divider()
 st.markdown("""
 <div style="background: #1a1a1a; border: 1px solid #333; border-radius: 10px; padding: 15px; margin-top: 10px;">
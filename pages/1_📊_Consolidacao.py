@@ -79,9 +79,16 @@ if 'dados' not in st.session_state or st.session_state.dados is None:
 
 from modules.data_loader import (
     GRUPOS_ANIMAIS, DIA_CORES, filter_5_day_cycle, get_last_5_unique_dates,
-    filter_by_day_prize_rules, filter_day_data_by_prize
+    filter_by_day_prize_rules
 )
 from modules import statistics as stats
+from modules import combinatorics, markov, lead_lag, presenca, agrupamentos, significancia, simulacao, decaimento, coincidencias
+from modules.indices import get_indice
+
+@st.cache_data(show_spinner="Simulando janelas...")
+def simular_janela(n_resultados: int) -> dict:
+    """Modelo nulo de uma janela: só depende da quantidade de resultados, não dos dados"""
+    return simulacao.simular(n_resultados, n_simulacoes=100_000, semente=0, n_processos=1)
 
 df = st.session_state.dados
 
@@ -136,12 +143,21 @@ st.divider()
 # Consolidação por Frequência (ORDENAÇÃO POR FREQUÊNCIA, NÃO CRONOLÓGICA)
 col1, col2, col3 = st.columns(3)
 
+# Teste de uniformidade da janela (qui-quadrado e z-score de cada grupo)
+teste_grupos = significancia.get_significancia(df_5dias_filtered, tipos=['grupo'], por_loteria=False)
+resumo_grupos = significancia.get_resumo_significancia(teste_grupos)
+
 with col1:
     st.markdown("### 🐾 Grupos Mais Frequentes")
+    if len(resumo_grupos) > 0:
+        teste = resumo_grupos.iloc[0]
+        st.caption(f"{teste['selo']} · χ² = {teste['qui2']} (p = {teste['p_valor']:.3f})")
     
     grupos_freq = df_5dias_filtered['grupo'].value_counts().reset_index()
     grupos_freq.columns = ['Grupo', 'Frequência']
     grupos_freq['Animal'] = grupos_freq['Grupo'].map(GRUPOS_ANIMAIS)
+    n_grupos = int(df_5dias_filtered['grupo'].between(1, 25).sum())
+    grupos_freq['Z'] = significancia.get_z_score(grupos_freq['Frequência'], n_grupos, 25).round(2)
     grupos_freq['Grupo'] = grupos_freq['Grupo'].apply(lambda x: f"{x:02d}")
     
     # Top 5 com cards visuais
@@ -150,8 +166,8 @@ with col1:
         st.markdown(f"""
         <div class="stat-card">
             <div class="stat-rank">{emoji}</div>
-            <div class="stat-value">{row['Grupo']} - {row['Animal']}</div>
-            <div class="stat-freq">{row['Frequência']}x nos últimos 5 dias</div>
+            <div class="stat-value">{row['Grupo']} - {row['Animal']} {significancia.get_selo_z(row['Z'], n_grupos, 25, comparacoes=25)}</div>
+            <div class="stat-freq">{row['Frequência']}x nos últimos 5 dias · z = {row['Z']:+.1f}</div>
         </div>
         """, unsafe_allow_html=True)
     
@@ -179,6 +195,21 @@ with col2:
     
     with st.expander("Ver ranking completo"):
         st.dataframe(centenas_freq, use_container_width=True, hide_index=True)
+    
+    # Centena invertida: permutações dos dígitos contam juntas
+    with st.expander("🔄 Ranking de centenas invertidas"):
+        centenas_inv = stats.get_centena_invertida_frequency(df_5dias_filtered, top_n=220)
+        if len(centenas_inv) > 0:
+            st.dataframe(
+                centenas_inv.rename(columns={
+                    'assinatura': 'Dígitos',
+                    'frequencia': 'Frequência',
+                    'permutacoes': 'Permutações',
+                    'permutacoes_saidas': 'Permutações que saíram'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
 
 with col3:
     st.markdown("### 🔢 Milhares Mais Frequentes")
@@ -200,6 +231,288 @@ with col3:
     
     with st.expander("Ver ranking completo"):
         st.dataframe(milhares_freq, use_container_width=True, hide_index=True)
+    
+    # Milhar invertida: permutações dos dígitos contam juntas
+    with st.expander("🔄 Ranking de milhares invertidas"):
+        milhares_inv = stats.get_milhar_invertida_frequency(df_5dias_filtered, top_n=715)
+        if len(milhares_inv) > 0:
+            st.dataframe(
+                milhares_inv.rename(columns={
+                    'assinatura': 'Dígitos',
+                    'frequencia': 'Frequência',
+                    'permutacoes': 'Permutações',
+                    'permutacoes_saidas': 'Permutações que saíram'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+
+# Testes de uniformidade de todas as loterias e janelas (um único cálculo por versão dos dados)
+with st.expander("📐 Significância dos desvios - todas as loterias"):
+    st.caption("Qui-quadrado contra a distribuição uniforme (todos os prêmios). Entropia 1,000 = perfeitamente uniforme; z máx. é o valor mais acima do esperado.")
+    resumo_sig = get_indice(
+        'significancia', df,
+        lambda dados: significancia.get_resumo_significancia(
+            significancia.get_significancia(dados, janelas=[5, 30, 90, None])
+        )
+    )
+    if len(resumo_sig) > 0:
+        tipo_sig = st.radio(
+            "Tipo:", options=list(significancia.TIPOS_TESTE.keys()),
+            format_func=lambda t: {'grupo': 'Grupos', 'pedra': 'Pedras', 'dezena': 'Dezenas'}[t],
+            horizontal=True, key="tipo_significancia"
+        )
+        st.dataframe(
+            resumo_sig[resumo_sig['tipo'] == tipo_sig].drop(columns='tipo').rename(columns={
+                'loteria': 'Loteria',
+                'janela': 'Janela',
+                'n': 'Resultados',
+                'qui2': 'χ²',
+                'gl': 'GL',
+                'p_valor': 'p-valor',
+                'entropia': 'Entropia',
+                'z_max': 'Z máx.',
+                'valor_z_max': 'Valor (Z máx.)',
+                'selo': 'Resultado'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+
+# Modelo nulo: quão quente o grupo mais frequente ficaria só por acaso
+with st.expander("🎲 Grupo quente ou ruído? (simulação)"):
+    n_janela = int(df_5dias_filtered['grupo'].between(1, 25).sum())
+    st.caption(
+        f"100.000 janelas sintéticas com {n_janela} resultados e todos os grupos igualmente prováveis "
+        f"(a grade de horários de {loteria_selecionada} prevê {simulacao.get_resultados_janela(loteria_selecionada)} resultados em 5 dias com a regra de prêmio)."
+    )
+    if n_janela > 0:
+        nulo = simular_janela(n_janela)
+        freq_obs = df_5dias_filtered['grupo'].value_counts()
+        freq_obs = freq_obs[freq_obs.index.to_series().between(1, 25)]
+        avaliacao = simulacao.avaliar_grupos(nulo, freq_obs.to_dict()).head(10)
+        avaliacao['animal'] = avaliacao['grupo'].map(GRUPOS_ANIMAIS)
+        avaliacao['grupo'] = avaliacao['grupo'].apply(lambda x: f"{x:02d}")
+        avaliacao['p_grupo'] = (avaliacao['p_grupo'] * 100).round(2)
+        avaliacao['p_max'] = (avaliacao['p_max'] * 100).round(1)
+        st.dataframe(
+            avaliacao[['grupo', 'animal', 'frequencia', 'p_grupo', 'p_max']].rename(columns={
+                'grupo': 'Grupo',
+                'animal': 'Animal',
+                'frequencia': 'Frequência',
+                'p_grupo': 'Chance p/ este grupo (%)',
+                'p_max': 'Chance do mais frequente (%)'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+        st.markdown(
+            f"O grupo mais frequente saiu **{int(freq_obs.max())}x**; em **{avaliacao['p_max'].iloc[0]:.1f}%** das janelas "
+            f"aleatórias o grupo mais frequente sai pelo menos isso. Valores abaixo de 5% sugerem algo além do acaso."
+        )
+
+# Quentes e frios sem janela fixa: cada sorteio antigo vale um pouco menos que o seguinte
+with st.expander("🌡️ Quentes e frios (decaimento)"):
+    col_meia_vida, col_tipo_dec, col_modo_dec = st.columns(3)
+    with col_meia_vida:
+        meia_vida = st.slider(
+            "Meia-vida (sorteios):", min_value=5, max_value=200,
+            value=decaimento.MEIA_VIDA_PADRAO, step=5, key="meia_vida_decaimento"
+        )
+    with col_tipo_dec:
+        tipo_dec = st.radio(
+            "Tipo:", options=list(decaimento.TIPOS_DECAIMENTO.keys()),
+            format_func=lambda t: {'grupo': 'Grupos', 'dezena': 'Dezenas', 'centena': 'Centenas'}[t],
+            horizontal=True, key="tipo_decaimento"
+        )
+    with col_modo_dec:
+        modo_dec = st.radio(
+            "Prêmios considerados:",
+            options=list(combinatorics.MODOS_PREMIO.keys()),
+            format_func=lambda m: combinatorics.MODOS_PREMIO[m],
+            horizontal=True,
+            key="modo_decaimento"
+        )
+    st.caption(
+        f"A cada sorteio todos os scores são multiplicados por {decaimento.get_fator(meia_vida):.4f} e quem saiu ganha +1: "
+        f"um resultado de {meia_vida} sorteios atrás vale metade de um de hoje. Índice acima de 1 = mais quente que a média."
+    )
+
+    # Índice mantido incrementalmente a cada inserção (O(valores) por sorteio novo)
+    indice_decaimento = get_indice(
+        f"decaimento_{modo_dec}_{meia_vida}", df,
+        lambda dados: decaimento.build_decaimento(dados, modo_dec, meia_vida),
+        decaimento.atualizar_decaimento
+    )
+    colunas_dec = {f'{tipo_dec}_fmt': tipo_dec.capitalize(), 'animal': 'Animal', 'score': 'Score', 'indice': 'Índice'}
+    col_quentes, col_frios = st.columns(2)
+    for coluna, titulo, frios in [(col_quentes, "🔥 Mais quentes", False), (col_frios, "🧊 Mais frios", True)]:
+        with coluna:
+            st.markdown(f"**{titulo}**")
+            ranking_dec = decaimento.get_ranking_decaimento(indice_decaimento, loteria_selecionada, tipo_dec, top_n=10, frios=frios)
+            if len(ranking_dec) > 0:
+                st.dataframe(
+                    ranking_dec[[c for c in colunas_dec if c in ranking_dec.columns]].rename(columns=colunas_dec),
+                    use_container_width=True,
+                    hide_index=True
+                )
+            else:
+                st.info("Sem resultados para esta loteria.")
+
+st.divider()
+
+# Duques e Ternos de Grupo - grupos que saíram juntos no mesmo horário
+st.subheader("🎲 Duques e Ternos de Grupo")
+st.caption("Combinações de grupos que saíram juntas no mesmo sorteio (todos os prêmios do horário), nos últimos 5 dias.")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("### 🎯 Duques Mais Frequentes")
+    duques = combinatorics.get_duques_grupos(df_5dias, top_n=300)
+    if len(duques) > 0:
+        st.dataframe(
+            duques[['rank', 'combinacao', 'animais', 'frequencia']].rename(columns={
+                'rank': 'Rank',
+                'combinacao': 'Duque',
+                'animais': 'Animais',
+                'frequencia': 'Frequência'
+            }),
+            use_container_width=True,
+            hide_index=True,
+            height=400
+        )
+    else:
+        st.info("Nenhum duque encontrado.")
+
+with col2:
+    st.markdown("### 🎯 Ternos Mais Frequentes")
+    ternos = combinatorics.get_ternos_grupos(df_5dias, top_n=100)
+    if len(ternos) > 0:
+        st.dataframe(
+            ternos[['rank', 'combinacao', 'animais', 'frequencia']].rename(columns={
+                'rank': 'Rank',
+                'combinacao': 'Terno',
+                'animais': 'Animais',
+                'frequencia': 'Frequência'
+            }),
+            use_container_width=True,
+            hide_index=True,
+            height=400
+        )
+    else:
+        st.info("Nenhum terno encontrado.")
+
+st.divider()
+
+# Agrupamentos de grupos - linhas, colunas, quadrantes e conjuntos personalizados
+st.subheader("🧮 Agrupamentos de Grupos")
+st.caption("Frequência (% dos resultados, todos os prêmios) de cada conjunto de grupos nos últimos N dias da loteria. 'Esperado' é o percentual se todos os grupos fossem igualmente prováveis.")
+
+col_esq, col_jan = st.columns(2)
+with col_esq:
+    esquemas_sel = st.multiselect(
+        "Esquemas:",
+        options=list(agrupamentos.ESQUEMAS.keys()),
+        default=['linhas', 'colunas'],
+        format_func=lambda k: agrupamentos.ESQUEMAS[k]['nome'],
+        key="esquemas_agrupamento"
+    )
+with col_jan:
+    janelas_sel = st.multiselect(
+        "Janelas (dias):",
+        options=[5, 10, 30, 90, 365],
+        default=[5, 30],
+        key="janelas_agrupamento"
+    )
+
+with st.expander("➕ Conjunto personalizado"):
+    texto_conjuntos = st.text_area(
+        "Um conjunto por linha, no formato Nome: grupos",
+        placeholder="Favoritos: 01 05 09 13\nOutros: 02 14 25",
+        key="conjuntos_personalizados"
+    )
+
+esquemas_calc = list(esquemas_sel)
+if texto_conjuntos.strip():
+    try:
+        conjuntos = {}
+        for linha in texto_conjuntos.strip().splitlines():
+            if ':' not in linha:
+                raise ValueError(f"Linha sem ':' - {linha}")
+            nome, grupos_txt = linha.split(':', 1)
+            conjuntos[nome.strip()] = [int(g) for g in grupos_txt.replace(',', ' ').split()]
+        esquemas_calc.append(agrupamentos.criar_esquema('Personalizado', conjuntos))
+    except ValueError as e:
+        st.error(f"❌ Conjunto inválido: {e}")
+
+if esquemas_calc and janelas_sel:
+    df_loteria = df[df['loteria'] == loteria_selecionada]
+    freq_esquemas = agrupamentos.get_frequencia_esquemas(df_loteria, esquemas_calc, janelas_sel)
+    
+    cols_esq = st.columns(min(len(esquemas_calc), 3))
+    for idx, (nome_esquema, freq_esq) in enumerate(freq_esquemas.groupby('esquema', sort=False)):
+        with cols_esq[idx % len(cols_esq)]:
+            st.markdown(f"**{nome_esquema}**")
+            tabela = freq_esq.pivot(index=['rotulo', 'grupos', 'esperado'], columns='janela', values='percentual')
+            tabela.columns = [f"{j} dias (%)" for j in tabela.columns]
+            tabela = tabela.reset_index().rename(columns={'rotulo': 'Conjunto', 'grupos': 'Grupos', 'esperado': 'Esperado (%)'})
+            st.dataframe(tabela, use_container_width=True, hide_index=True)
+
+st.divider()
+
+# Transições de grupo - o que costuma vir no sorteio seguinte
+st.subheader("🔀 Transições de Grupo")
+st.caption("Grupo de um sorteio → grupo do sorteio seguinte da mesma loteria, em ordem de data e horário.")
+
+col_modo, col_grupo = st.columns(2)
+with col_modo:
+    modo_transicao = st.radio(
+        "Prêmios considerados:",
+        options=list(combinatorics.MODOS_PREMIO.keys()),
+        format_func=lambda m: combinatorics.MODOS_PREMIO[m],
+        horizontal=True,
+        key="modo_transicao"
+    )
+with col_grupo:
+    grupo_transicao = st.selectbox(
+        "O que costuma vir depois do grupo:",
+        options=list(range(1, 26)),
+        format_func=lambda g: f"{g:02d} - {GRUPOS_ANIMAIS[g]}",
+        key="grupo_transicao"
+    )
+
+# Histórico completo: índice mantido incrementalmente a cada inserção
+transicoes_historico = get_indice(
+    f"transicoes_{modo_transicao}", df,
+    lambda dados: markov.build_transicoes(dados, modo_transicao),
+    markov.atualizar_transicoes
+)
+transicoes_janela = markov.build_transicoes(df_5dias, modo_transicao)
+
+col1, col2 = st.columns(2)
+for coluna, titulo, indice_transicao in [
+    (col1, "📅 Últimos 5 dias", transicoes_janela),
+    (col2, "📚 Histórico completo", transicoes_historico),
+]:
+    with coluna:
+        st.markdown(f"#### {titulo}")
+        proximos = markov.get_proximos_grupos(indice_transicao, loteria_selecionada, grupo_transicao, top_n=5)
+        if len(proximos) > 0:
+            st.dataframe(
+                proximos[['grupo_animal', 'frequencia', 'probabilidade']].rename(columns={
+                    'grupo_animal': 'Grupo Seguinte',
+                    'frequencia': 'Frequência',
+                    'probabilidade': 'Probabilidade (%)'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("Sem transições registradas para este grupo.")
+
+if modo_transicao == 'cabeca':
+    st.caption("ℹ️ No modo 1° prêmio, registros legados (sem número do prêmio) contam como cabeça.")
 
 st.divider()
 
@@ -209,6 +522,13 @@ st.subheader("🔍 Análise de Ausências")
 # Obter todas as loterias disponíveis
 todas_loterias = df['loteria'].unique().tolist()
 
+# Máscaras de presença de grupos por (loteria, data)
+indice_presenca = get_indice('presenca', df, presenca.build_presenca, presenca.atualizar_presenca)
+mascaras_ciclo = {
+    loteria: presenca.get_mascaras_ciclo(indice_presenca, loteria, datas_5dias)
+    for loteria in todas_loterias
+}
+
 # Para cada dia, mostrar os grupos que NÃO saíram em cada loteria
 for idx, data in enumerate(datas_5dias):
     dia_num = idx + 1
@@ -227,18 +547,13 @@ for idx, data in enumerate(datas_5dias):
     
     for col_idx, loteria in enumerate(todas_loterias):
         with cols[col_idx]:
-            # Filtrar dados do dia específico para essa loteria
-            df_dia_loteria = df[(df['data'].dt.date == data) & (df['loteria'] == loteria)]
-            
-            # Aplicar regra de prêmio
-            df_dia_loteria = filter_day_data_by_prize(df_dia_loteria, dia_num)
-            
-            grupos_presentes = set(df_dia_loteria['grupo'].unique())
-            grupos_ausentes = [g for g in range(1, 26) if g not in grupos_presentes]
+            # Máscara do dia já com a regra de prêmio aplicada
+            mascara = mascaras_ciclo[loteria][idx]
+            grupos_ausentes = presenca.get_ausentes(mascara)
             
             st.markdown(f"**{loteria}**")
             
-            if len(df_dia_loteria) == 0:
+            if mascara == 0:
                 st.caption("Sem resultados")
             elif grupos_ausentes:
                 # Mostrar grupos ausentes com nome do animal
@@ -256,4 +571,135 @@ for idx, data in enumerate(datas_5dias):
             else:
                 st.success("✅ Todos saíram!")
 
+# Combinações entre dias e loterias (operações de bits sobre as máscaras)
+if datas_5dias:
+    dias_com_dados = [m for m in mascaras_ciclo[loteria_selecionada] if m]
+    todos_dias = presenca.grupos_da_mascara(presenca.intersecao(dias_com_dados)) if dias_com_dados else []
+    nenhuma = presenca.get_ausentes(presenca.uniao(m for mascaras in mascaras_ciclo.values() for m in mascaras))
+    
+    col_todos, col_nenhuma = st.columns(2)
+    with col_todos:
+        st.markdown(f"**✅ Saíram em todos os dias - {loteria_selecionada}**")
+        st.markdown(", ".join(f"{g:02d} - {GRUPOS_ANIMAIS.get(g, '')}" for g in todos_dias) or "Nenhum grupo")
+    with col_nenhuma:
+        st.markdown("**🚫 Não saíram em nenhum dia (todas as loterias)**")
+        st.markdown(", ".join(f"{g:02d} - {GRUPOS_ANIMAIS.get(g, '')}" for g in nenhuma) or "Nenhum grupo")
+
+st.divider()
+
+# Correlação entre loterias - um grupo de uma loteria aparece na outra logo depois?
+st.subheader("🔗 Correlação entre Loterias")
+st.caption("Taxa com que um grupo sorteado na loteria de origem aparece na loteria de destino nos próximos N sorteios (histórico completo).")
+
+col_n, col_modo_ll = st.columns(2)
+with col_n:
+    n_sorteios_ll = st.slider("Próximos N sorteios do destino:", min_value=1, max_value=10, value=3, key="n_lead_lag")
+with col_modo_ll:
+    modo_ll = st.radio(
+        "Prêmios considerados:",
+        options=list(combinatorics.MODOS_PREMIO.keys()),
+        format_func=lambda m: combinatorics.MODOS_PREMIO[m],
+        horizontal=True,
+        key="modo_lead_lag"
+    )
+
+correlacao = get_indice(
+    f"lead_lag_{modo_ll}_{n_sorteios_ll}", df,
+    lambda dados: lead_lag.get_lead_lag(dados, n_sorteios_ll, modo_ll)
+)
+
+if len(correlacao) > 0:
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### 🎯 Taxa de acerto (%)")
+        st.dataframe(correlacao.pivot(index='origem', columns='destino', values='taxa'), use_container_width=True)
+    with col2:
+        st.markdown("#### 📈 Lift (taxa ÷ esperado)")
+        st.dataframe(correlacao.pivot(index='origem', columns='destino', values='lift'), use_container_width=True)
+    st.caption("Lift acima de 1 indica que o grupo aparece no destino mais do que o esperado pela própria frequência do destino.")
+else:
+    st.info("Dados insuficientes para correlacionar loterias.")
+
+st.divider()
+
+# Coincidências - o mesmo número em loterias diferentes no mesmo dia (histórico completo em uma passada)
+st.subheader("🪞 Coincidências no Mesmo Dia")
+st.caption("Milhares, centenas ou grupos que saíram em duas ou mais loterias no mesmo dia.")
+
+col_tipo_co, col_modo_co, col_periodo_co = st.columns(3)
+with col_tipo_co:
+    tipo_co = st.radio(
+        "Tipo:", options=list(coincidencias.TIPOS_COINCIDENCIA.keys()),
+        format_func=lambda t: {'milhar': 'Milhares', 'centena': 'Centenas', 'grupo': 'Grupos'}[t],
+        horizontal=True, key="tipo_coincidencia"
+    )
+with col_modo_co:
+    modo_co = st.radio(
+        "Prêmios considerados:",
+        options=list(combinatorics.MODOS_PREMIO.keys()),
+        format_func=lambda m: combinatorics.MODOS_PREMIO[m],
+        index=1,
+        horizontal=True,
+        key="modo_coincidencia"
+    )
+with col_periodo_co:
+    data_max_co = pd.to_datetime(df['data']).max().date()
+    data_min_co = pd.to_datetime(df['data']).min().date()
+    periodo_co = st.date_input(
+        "Período:",
+        value=(max(data_min_co, data_max_co - pd.Timedelta(days=30)), data_max_co),
+        min_value=data_min_co,
+        max_value=data_max_co,
+        format="DD/MM/YYYY",
+        key="periodo_coincidencia"
+    )
+loterias_co = st.multiselect("Loterias:", options=todas_loterias, default=todas_loterias, key="loterias_coincidencia")
+
+indice_coincidencias = get_indice(
+    f"coincidencias_{modo_co}", df,
+    lambda dados: coincidencias.build_coincidencias(dados, modo_co)
+)
+desde_co, ate_co = (periodo_co[0], periodo_co[-1]) if periodo_co else (None, None)
+
+if len(loterias_co) < 2:
+    st.info("Selecione ao menos duas loterias.")
+else:
+    pares_co = coincidencias.get_resumo_pares(indice_coincidencias, tipo_co, desde_co, ate_co, loterias_co)
+    tabela_co = coincidencias.get_coincidencias(indice_coincidencias, tipo_co, desde_co, ate_co, loterias_co)
+
+    col_pares, col_tabela = st.columns([1, 2])
+    with col_pares:
+        st.markdown("#### 👥 Por par de loterias")
+        if len(pares_co) > 0:
+            st.dataframe(
+                pares_co.rename(columns={
+                    'loteria_a': 'Loteria A',
+                    'loteria_b': 'Loteria B',
+                    'coincidencias': 'Coincidências',
+                    'esperado': 'Esperado',
+                    'lift': 'Lift'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+            st.caption("Esperado: média se os números fossem sorteados ao acaso, dada a quantidade de resultados de cada loteria em cada dia.")
+    with col_tabela:
+        st.markdown(f"#### 📋 {len(tabela_co)} coincidência(s)")
+        if len(tabela_co) > 0:
+            tabela_co['data'] = tabela_co['data'].dt.strftime('%d/%m/%Y')
+            colunas_co = {
+                'data': 'Data',
+                'numero_fmt': tipo_co.capitalize(),
+                'animal': 'Animal',
+                'loterias': 'Loterias',
+                'n_loterias': 'Qtd. loterias'
+            }
+            st.dataframe(
+                tabela_co[[c for c in colunas_co if c in tabela_co.columns]].head(500).rename(columns=colunas_co),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("Nenhuma coincidência no período.")
+
 st.caption("⚠️ Consolidação estatística dos últimos 5 dias. Ordenação por FREQUÊNCIA, não cronológica. Cada loteria é analisada separadamente.")
@@ -0,0 +1,132 @@
+"""
+Análise por Horário - Mapas de calor horário x grupo e horário x pedra por loteria
+"""
+import streamlit as st
+import pandas as pd
+
+st.set_page_config(page_title="Análise por Horário", page_icon="⏰", layout="wide")
+
+# Verificação de autenticação
+from modules.auth import check_authentication
+check_authentication()
+
+st.title("⏰ Análise por Horário")
+
+st.markdown("""
+Quantas vezes cada grupo (ou pedra - primeiro dígito da milhar) saiu em cada horário da loteria.
+Cores mais fortes indicam mais aparições no período escolhido.
+""")
+
+if 'dados' not in st.session_state or st.session_state.dados is None:
+    st.warning("⚠️ Nenhuma base de dados carregada. Acesse **✨ Processador** para inserir resultados.")
+    st.stop()
+
+import plotly.express as px
+
+from modules import horarios
+from modules.combinatorics import MODOS_PREMIO
+from modules.indices import get_indice
+
+df = st.session_state.dados
+
+# Sidebar - Filtro por Loteria (OBRIGATÓRIO)
+st.sidebar.header("🔍 Filtro por Loteria")
+loterias = df['loteria'].unique().tolist()
+loteria_selecionada = st.sidebar.selectbox(
+    "Selecione a Loteria:",
+    options=loterias,
+    help="Cada loteria é analisada separadamente."
+)
+
+st.sidebar.header("⚙️ Opções")
+modo_premio = st.sidebar.radio(
+    "Prêmios:",
+    options=list(MODOS_PREMIO.keys()),
+    format_func=lambda m: MODOS_PREMIO[m],
+    index=1,
+    key="horario_modo"
+)
+tipo = st.sidebar.radio(
+    "Contar por:",
+    options=list(horarios.TIPOS_HORARIO.keys()),
+    format_func=lambda t: 'Grupo' if t == 'grupo' else 'Pedra (milhar)',
+    key="horario_tipo"
+)
+
+JANELAS = {'Últimos 5 dias': 5, 'Últimos 30 dias': 30, 'Últimos 90 dias': 90, 'Todo o histórico': None}
+janela = st.sidebar.selectbox("Período:", list(JANELAS.keys()), index=1, key="horario_janela")
+
+# Tensores (dia x horário x grupo/pedra) construídos uma vez por versão dos dados
+indice_horarios = get_indice(
+    f"horarios_{modo_premio}", df,
+    lambda dados: horarios.build_matrizes_horario(dados, modo_premio)
+)
+
+matriz = horarios.get_matriz_horario(indice_horarios, loteria_selecionada, tipo, JANELAS[janela])
+
+if len(matriz) == 0:
+    st.warning(f"⚠️ Nenhum dado encontrado para a loteria **{loteria_selecionada}**.")
+    st.stop()
+
+rotulo_tipo = 'Grupo' if tipo == 'grupo' else 'Pedra'
+
+# Mapa de calor horário x grupo/pedra
+st.subheader(f"🔥 Horário x {rotulo_tipo} - {loteria_selecionada} ({janela.lower()})")
+
+fig = px.imshow(
+    matriz,
+    text_auto=True,
+    aspect='auto',
+    color_continuous_scale='Reds',
+    labels={'x': rotulo_tipo, 'y': 'Horário', 'color': 'Aparições'}
+)
+fig.update_xaxes(side='top', type='category')
+fig.update_yaxes(type='category')
+st.plotly_chart(fig, use_container_width=True)
+
+# Destaques por horário
+with st.expander("📋 Mais frequente em cada horário"):
+    destaques = pd.DataFrame({
+        'Horário': matriz.index,
+        'Resultados': matriz.sum(axis=1).to_numpy(),
+        rotulo_tipo: matriz.idxmax(axis=1).to_numpy(),
+        'Aparições': matriz.max(axis=1).to_numpy()
+    })
+    destaques = destaques[destaques['Resultados'] > 0]
+    st.dataframe(destaques, use_container_width=True, hide_index=True)
+
+st.divider()
+
+# Mesmo horário ao longo dos dias
+st.subheader("📆 Comparar um Horário entre Dias")
+
+col_h, col_n = st.columns(2)
+with col_h:
+    horario_sel = st.selectbox("Horário:", matriz.index.tolist(), key="horario_comparar")
+with col_n:
+    n_dias_cmp = st.slider("Últimos N dias com sorteio nesse horário:", min_value=2, max_value=30, value=5, key="horario_n_dias")
+
+por_dia = horarios.get_horario_por_dia(indice_horarios, loteria_selecionada, horario_sel, tipo, n_dias_cmp)
+
+if len(por_dia) > 0:
+    fig_dias = px.imshow(
+        por_dia,
+        text_auto=True,
+        aspect='auto',
+        color_continuous_scale='Blues',
+        labels={'x': rotulo_tipo, 'y': 'Data', 'color': 'Aparições'}
+    )
+    fig_dias.update_xaxes(side='top', type='category')
+    fig_dias.update_yaxes(type='category')
+    st.plotly_chart(fig_dias, use_container_width=True)
+
+    repetidos = por_dia.columns[(por_dia > 0).sum(axis=0) >= 2].tolist()
+    if repetidos:
+        st.markdown(f"🔁 **Repetiram em 2 ou mais dias neste horário:** {', '.join(repetidos)}")
+else:
+    st.info(f"Sem resultados no horário {horario_sel}.")
+
+if modo_premio == 'cabeca':
+    st.caption("ℹ️ No modo 1° prêmio, registros legados (sem número do prêmio) contam como cabeça.")
+
+st.caption("⚠️ Análise estatística do histórico. Os resultados passados não garantem resultados futuros.")
@@ -0,0 +1,115 @@
+"""
+Sazonalidade - Grupos e pedras por dia da semana, semana do ano e mês (histórico completo)
+"""
+import streamlit as st
+import pandas as pd
+
+st.set_page_config(page_title="Sazonalidade", page_icon="📆", layout="wide")
+
+# Verificação de autenticação
+from modules.auth import check_authentication
+check_authentication()
+
+st.title("📆 Sazonalidade")
+
+st.markdown("""
+Distribuição dos grupos (ou pedras - primeiro dígito da milhar) por **dia da semana**, **semana do ano**
+e **mês**, considerando todo o histórico da loteria. Cada linha mostra o percentual dos resultados daquele período.
+""")
+
+if 'dados' not in st.session_state or st.session_state.dados is None:
+    st.warning("⚠️ Nenhuma base de dados carregada. Acesse **✨ Processador** para inserir resultados.")
+    st.stop()
+
+import plotly.express as px
+
+from modules import calendario
+from modules.combinatorics import MODOS_PREMIO
+from modules.indices import get_indice
+
+df = st.session_state.dados
+
+# Sidebar - Filtro por Loteria (OBRIGATÓRIO)
+st.sidebar.header("🔍 Filtro por Loteria")
+loterias = df['loteria'].unique().tolist()
+loteria_selecionada = st.sidebar.selectbox(
+    "Selecione a Loteria:",
+    options=loterias,
+    help="Cada loteria é analisada separadamente."
+)
+
+st.sidebar.header("⚙️ Opções")
+modo_premio = st.sidebar.radio(
+    "Prêmios:",
+    options=list(MODOS_PREMIO.keys()),
+    format_func=lambda m: MODOS_PREMIO[m],
+    index=1,
+    key="sazonalidade_modo"
+)
+tipo = st.sidebar.radio(
+    "Contar por:",
+    options=list(calendario.TIPOS_CALENDARIO.keys()),
+    format_func=lambda t: 'Grupo' if t == 'grupo' else 'Pedra (milhar)',
+    key="sazonalidade_tipo"
+)
+
+# Contagens do histórico completo (mantidas incrementalmente a cada inserção)
+indice_calendario = get_indice(
+    f"calendario_{modo_premio}", df,
+    lambda dados: calendario.build_calendario(dados, modo_premio),
+    calendario.atualizar_calendario
+)
+
+if loteria_selecionada not in indice_calendario['loterias']:
+    st.warning(f"⚠️ Nenhum dado encontrado para a loteria **{loteria_selecionada}**.")
+    st.stop()
+
+rotulo_tipo = 'Grupo' if tipo == 'grupo' else 'Pedra'
+NOMES_DIMENSOES = {'dia_semana': '📅 Dia da Semana', 'mes': '🗓️ Mês', 'semana': '📈 Semana do Ano'}
+
+tabs = st.tabs(list(NOMES_DIMENSOES.values()))
+for tab, dimensao in zip(tabs, NOMES_DIMENSOES.keys()):
+    with tab:
+        tabela = calendario.get_sazonalidade(indice_calendario, loteria_selecionada, dimensao, tipo)
+        if len(tabela) == 0:
+            st.info("Sem resultados.")
+            continue
+
+        dias_por_posicao = calendario.get_dias_por_posicao(indice_calendario, loteria_selecionada, dimensao)
+        st.caption("Dias com resultados: " + " | ".join(
+            f"{rotulo}: {n}" for rotulo, n in dias_por_posicao.items() if n > 0
+        ))
+
+        fig = px.imshow(
+            tabela,
+            text_auto=dimensao != 'semana',
+            aspect='auto',
+            color_continuous_scale='Greens',
+            labels={'x': rotulo_tipo, 'y': '', 'color': '% da linha'}
+        )
+        fig.update_xaxes(side='top', type='category')
+        fig.update_yaxes(type='category')
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Maiores desvios em relação ao esperado
+        st.markdown("**🔎 Maiores desvios em relação ao esperado**")
+        desvios = calendario.get_desvios(indice_calendario, loteria_selecionada, dimensao, tipo)
+        if len(desvios) > 0:
+            st.dataframe(
+                desvios.rename(columns={
+                    'posicao': 'Período',
+                    'valor': rotulo_tipo,
+                    'frequencia': 'Frequência',
+                    'esperado': 'Esperado',
+                    'indice': 'Índice (freq/esperado)'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.caption("Histórico ainda pequeno para comparar com o esperado.")
+
+if modo_premio == 'cabeca':
+    st.caption("ℹ️ No modo 1° prêmio, registros legados (sem número do prêmio) contam como cabeça.")
+
+st.caption("⚠️ Análise estatística do histórico. Os resultados passados não garantem resultados futuros.")
@@ -0,0 +1,142 @@
+"""
+Backtest - Replay do histórico para medir as estratégias de fechamento
+"""
+import streamlit as st
+import pandas as pd
+
+st.set_page_config(page_title="Backtest", page_icon="🧪", layout="wide")
+
+# Verificação de autenticação
+from modules.auth import check_authentication
+check_authentication()
+
+st.title("🧪 Backtest de Estratégias")
+
+st.markdown("""
+Refaz o histórico **dia a dia**: em cada dia, a estratégia olha só a janela dos últimos dias com resultados,
+escolhe os palpites e eles são conferidos nos sorteios do **dia seguinte**. A taxa de acerto é comparada
+com a de palpites escolhidos ao acaso.
+""")
+
+if 'dados' not in st.session_state or st.session_state.dados is None:
+    st.warning("⚠️ Nenhuma base de dados carregada. Acesse **✨ Processador** para inserir resultados.")
+    st.stop()
+
+import plotly.express as px
+
+from modules import backtest
+from modules.apostas import MULTIPLICADORES
+from modules.data_loader import get_dataset_version
+
+df = st.session_state.dados
+
+# Sidebar - Configuração
+st.sidebar.header("🔍 Loterias")
+loterias = df['loteria'].unique().tolist()
+loterias_selecionadas = st.sidebar.multiselect(
+    "Loterias testadas:",
+    options=loterias,
+    default=loterias,
+    key="backtest_loterias"
+)
+
+st.sidebar.header("🧠 Estratégias")
+estrategias = st.sidebar.multiselect(
+    "Estratégias:",
+    options=list(backtest.ESTRATEGIAS.keys()),
+    default=['fechamento', 'frequencia'],
+    format_func=lambda e: backtest.ESTRATEGIAS[e]['nome'],
+    key="backtest_estrategias"
+)
+
+st.sidebar.header("⚙️ Parâmetros")
+janela = st.sidebar.slider("Dias na janela:", min_value=1, max_value=15, value=5, key="backtest_janela")
+modo_janela = st.sidebar.radio(
+    "Prêmios da janela:",
+    options=list(backtest.MODOS_JANELA.keys()),
+    format_func=lambda m: backtest.MODOS_JANELA[m],
+    index=2,
+    key="backtest_premios"
+)
+top_grupos = st.sidebar.slider("Grupos por palpite:", min_value=1, max_value=10, value=5, key="backtest_top_grupos")
+top_pedras = st.sidebar.slider("Pedras por palpite:", min_value=1, max_value=5, value=3, key="backtest_top_pedras")
+peso_rep = st.sidebar.number_input("Peso das repetições (fechamento):", min_value=0.0, max_value=10.0, value=2.0, step=0.5, key="backtest_peso_rep")
+
+if not loterias_selecionadas or not estrategias:
+    st.info("Selecione ao menos uma loteria e uma estratégia.")
+    st.stop()
+
+configuracoes = []
+for estrategia in estrategias:
+    params = {'janela': janela, 'premios': modo_janela}
+    params['top_n'] = top_pedras if backtest.ESTRATEGIAS[estrategia]['tipo'] == 'pedra' else top_grupos
+    if 'peso_rep' in backtest.ESTRATEGIAS[estrategia]['params']:
+        params['peso_rep'] = peso_rep
+    configuracoes.append((estrategia, params))
+
+# O resultado fica guardado enquanto a base e a configuração não mudarem
+chave = (get_dataset_version(df), tuple(loterias_selecionadas), repr(configuracoes))
+if st.button("▶️ Executar backtest", type="primary") or st.session_state.get('backtest_chave') == chave:
+    if st.session_state.get('backtest_chave') != chave:
+        with st.spinner("Refazendo o histórico..."):
+            st.session_state.backtest_resultado = backtest.executar_backtests(df, configuracoes, loterias_selecionadas)
+            st.session_state.backtest_chave = chave
+    resumo, diarios = st.session_state.backtest_resultado
+else:
+    st.info("Ajuste a configuração na barra lateral e clique em **Executar backtest**.")
+    st.stop()
+
+if len(resumo) == 0 or resumo['sorteios'].sum() == 0:
+    st.warning("⚠️ Histórico insuficiente para a janela escolhida.")
+    st.stop()
+
+# Resumo
+st.subheader("📋 Resumo")
+tabela = resumo[resumo['sorteios'] > 0].copy()
+for coluna in ['taxa_cabeca', 'esperado_cabeca', 'taxa_qualquer', 'esperado_qualquer']:
+    tabela[coluna] = tabela[coluna].round(1)
+tabela['lift_cabeca'] = tabela['lift_cabeca'].round(2)
+tabela['roi_cabeca'] = tabela['roi_cabeca'].round(1)
+st.dataframe(
+    tabela.drop(columns=['configuracao']).rename(columns={
+        'loteria': 'Loteria',
+        'estrategia': 'Estratégia',
+        'params': 'Parâmetros',
+        'dias': 'Dias',
+        'sorteios': 'Sorteios',
+        'taxa_cabeca': 'Acerto cabeça (%)',
+        'esperado_cabeca': 'Acaso cabeça (%)',
+        'taxa_qualquer': 'Acerto 1°-5° (%)',
+        'esperado_qualquer': 'Acaso 1°-5° (%)',
+        'lift_cabeca': 'Lift cabeça',
+        'roi_cabeca': 'ROI cabeça (%)',
+    }),
+    use_container_width=True,
+    hide_index=True
+)
+st.caption(
+    "Lift = acerto na cabeça / acerto esperado ao acaso (acima de 1 = melhor que o acaso). "
+    f"ROI = retorno apostando 1 em cada grupo do palpite na cabeça (cotação {MULTIPLICADORES['grupo']}x)."
+)
+
+# Evolução da taxa de acerto acumulada
+st.subheader("📈 Acerto acumulado na cabeça")
+linhas = []
+for _, linha in resumo.iterrows():
+    diario = diarios[(linha['loteria'], linha['configuracao'])]
+    if len(diario) == 0:
+        continue
+    acumulado = diario[['data']].copy()
+    acumulado['taxa'] = diario['acertos_cabeca'].cumsum() / diario['sorteios_cabeca'].cumsum().where(lambda s: s > 0) * 100
+    acumulado['serie'] = f"{linha['loteria']} - {linha['estrategia']}"
+    linhas.append(acumulado)
+
+if linhas:
+    fig = px.line(
+        pd.concat(linhas, ignore_index=True),
+        x='data', y='taxa', color='serie',
+        labels={'data': 'Data', 'taxa': 'Acerto acumulado (%)', 'serie': ''}
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+st.caption("⚠️ Análise estatística do histórico. Os resultados passados não garantem resultados futuros.")
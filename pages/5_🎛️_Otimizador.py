@@ -0,0 +1,152 @@
+"""
+Otimizador - Busca dos melhores parâmetros das estratégias com validação fora da amostra
+"""
+import streamlit as st
+import pandas as pd
+
+st.set_page_config(page_title="Otimizador", page_icon="🎛️", layout="wide")
+
+# Verificação de autenticação
+from modules.auth import check_authentication
+check_authentication()
+
+st.title("🎛️ Otimizador de Estratégias")
+
+st.markdown("""
+Testa várias combinações de parâmetros (peso das repetições, dias na janela, prêmios considerados e
+quantidade de palpites) no **backtest**. A melhor combinação de cada loteria é escolhida só com o
+período de **treino** e depois medida no período de **teste**, que fica fora da escolha.
+""")
+
+if 'dados' not in st.session_state or st.session_state.dados is None:
+    st.warning("⚠️ Nenhuma base de dados carregada. Acesse **✨ Processador** para inserir resultados.")
+    st.stop()
+
+from modules import otimizador
+from modules.backtest import ESTRATEGIAS, MODOS_JANELA
+from modules.data_loader import get_dataset_version
+from modules.indices import get_indice
+
+df = st.session_state.dados
+
+# Sidebar - Configuração
+st.sidebar.header("🔍 Loterias")
+loterias = df['loteria'].unique().tolist()
+loterias_selecionadas = st.sidebar.multiselect(
+    "Loterias otimizadas:",
+    options=loterias,
+    default=loterias,
+    key="otimizador_loterias"
+)
+
+st.sidebar.header("🧠 Estratégia")
+estrategia = st.sidebar.selectbox(
+    "Estratégia:",
+    options=list(ESTRATEGIAS.keys()),
+    format_func=lambda e: ESTRATEGIAS[e]['nome'],
+    key="otimizador_estrategia"
+)
+metricas = otimizador.get_metricas(estrategia)
+metrica = st.sidebar.selectbox(
+    "Otimizar:",
+    options=list(metricas.keys()),
+    format_func=lambda m: metricas[m],
+    key="otimizador_metrica"
+)
+
+st.sidebar.header("🔎 Busca")
+metodo = st.sidebar.radio(
+    "Método:",
+    options=list(otimizador.METODOS_BUSCA.keys()),
+    format_func=lambda m: otimizador.METODOS_BUSCA[m],
+    key="otimizador_metodo"
+)
+n_amostras = 50
+if metodo == 'aleatorio':
+    n_amostras = st.sidebar.slider("Combinações sorteadas:", min_value=10, max_value=200, value=50, step=10, key="otimizador_amostras")
+fracao_teste = st.sidebar.slider("Dias reservados para teste (%):", min_value=10, max_value=50, value=30, step=5, key="otimizador_teste") / 100
+
+# Espaço de busca
+NOMES_PARAMETROS = {
+    'janela': 'Dias na janela',
+    'top_n': 'Palpites por dia',
+    'premios': 'Prêmios da janela',
+    'peso_rep': 'Peso das repetições',
+}
+st.subheader("🧩 Espaço de busca")
+espaco = {}
+parametros = [p for p in ESTRATEGIAS[estrategia]['params'] if p in otimizador.ESPACO_PADRAO]
+colunas = st.columns(len(parametros))
+for coluna, parametro in zip(colunas, parametros):
+    with coluna:
+        opcoes = otimizador.ESPACO_PADRAO[parametro]
+        if parametro == 'top_n' and ESTRATEGIAS[estrategia]['tipo'] == 'pedra':
+            opcoes = [1, 2, 3, 4, 5]
+        espaco[parametro] = st.multiselect(
+            NOMES_PARAMETROS[parametro],
+            options=opcoes,
+            default=opcoes,
+            format_func=lambda v, p=parametro: MODOS_JANELA[v] if p == 'premios' else str(v),
+            key=f"otimizador_{estrategia}_{parametro}"
+        )
+
+if not loterias_selecionadas or any(len(valores) == 0 for valores in espaco.values()):
+    st.info("Selecione ao menos uma loteria e um valor de cada parâmetro.")
+    st.stop()
+
+candidatos = otimizador.gerar_candidatos(estrategia, espaco, metodo, n_amostras, semente=0)
+st.caption(f"{len(candidatos)} combinações x {len(loterias_selecionadas)} loterias")
+
+# O resultado fica guardado enquanto a base e a configuração da busca não mudarem
+chave = (get_dataset_version(df), estrategia, tuple(loterias_selecionadas), repr(candidatos), fracao_teste)
+if st.button("▶️ Otimizar", type="primary") or st.session_state.get('otimizador_chave') == chave:
+    if st.session_state.get('otimizador_chave') != chave:
+        # Resultados em cache por (versão do dataset, loteria, estratégia, parâmetros, corte)
+        cache = get_indice('otimizacao', df, lambda dados: {})
+        with st.spinner("Testando combinações..."):
+            st.session_state.otimizador_resultado = otimizador.otimizar(
+                df, estrategia, candidatos,
+                fracao_teste=fracao_teste,
+                loterias=loterias_selecionadas,
+                cache=cache
+            )
+            st.session_state.otimizador_chave = chave
+    resultados = st.session_state.otimizador_resultado
+else:
+    st.info("Ajuste o espaço de busca e clique em **Otimizar**.")
+    st.stop()
+
+melhores = otimizador.get_melhores(resultados, metrica)
+if len(melhores) == 0:
+    st.warning("⚠️ Histórico insuficiente para otimizar com essa configuração.")
+    st.stop()
+
+st.subheader("🏆 Melhor configuração por loteria")
+colunas_melhores = {
+    'loteria': 'Loteria',
+    'params': 'Parâmetros',
+    'corte': 'Teste a partir de',
+    'sorteios': 'Sorteios (treino)',
+    metrica: f"{otimizador.METRICAS[metrica]} - treino",
+    'teste_sorteios': 'Sorteios (teste)',
+    f"teste_{metrica}": f"{otimizador.METRICAS[metrica]} - teste",
+}
+tabela = melhores[list(colunas_melhores.keys())].copy()
+tabela['corte'] = tabela['corte'].dt.strftime('%d/%m/%Y')
+tabela[metrica] = tabela[metrica].round(2)
+tabela[f"teste_{metrica}"] = tabela[f"teste_{metrica}"].round(2)
+st.dataframe(tabela.rename(columns=colunas_melhores), use_container_width=True, hide_index=True)
+st.caption(
+    "O score de teste é o que importa: uma configuração que vai bem no treino e mal no teste "
+    "só se ajustou ao ruído do passado."
+)
+
+with st.expander("📋 Todas as combinações"):
+    todas = resultados[['loteria', 'params', 'sorteios', metrica, 'teste_sorteios', f"teste_{metrica}"]]
+    st.dataframe(
+        todas.sort_values(['loteria', metrica], ascending=[True, False]).round(2),
+        use_container_width=True,
+        hide_index=True
+    )
+
+st.caption("⚠️ Análise estatística do histórico. Os resultados passados não garantem resultados futuros.")
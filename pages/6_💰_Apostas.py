@@ -0,0 +1,133 @@
+"""
+Apostas - Confere apostas no histórico e calcula acertos e retorno
+"""
+import streamlit as st
+import pandas as pd
+
+st.set_page_config(page_title="Apostas", page_icon="💰", layout="wide")
+
+# Verificação de autenticação
+from modules.auth import check_authentication
+check_authentication()
+
+st.title("💰 Simulador de Apostas")
+
+st.markdown("""
+Confere as apostas digitadas em **todos os sorteios** do período escolhido e calcula quantas vezes
+cada uma teria sido premiada e o retorno pela cotação informada.
+""")
+
+if 'dados' not in st.session_state or st.session_state.dados is None:
+    st.warning("⚠️ Nenhuma base de dados carregada. Acesse **✨ Processador** para inserir resultados.")
+    st.stop()
+
+from modules import apostas
+
+df = st.session_state.dados
+
+# Sidebar - Filtro por Loteria (OBRIGATÓRIO)
+st.sidebar.header("🔍 Filtro por Loteria")
+loterias = df['loteria'].unique().tolist()
+loteria_selecionada = st.sidebar.selectbox(
+    "Selecione a Loteria:",
+    options=loterias,
+    help="Cada loteria é analisada separadamente."
+)
+
+st.sidebar.header("📅 Período")
+PERIODOS_APOSTA = {'Últimos 7 dias': 7, 'Últimos 30 dias': 30, 'Últimos 90 dias': 90, 'Todo o histórico': None}
+periodo = st.sidebar.selectbox("Conferir em:", options=list(PERIODOS_APOSTA.keys()), index=1, key="apostas_periodo")
+
+st.sidebar.header("🎫 Aposta")
+tipo = st.sidebar.selectbox(
+    "Tipo:",
+    options=list(apostas.TIPOS_APOSTA.keys()),
+    format_func=lambda t: apostas.TIPOS_APOSTA[t]['nome'],
+    key="apostas_tipo"
+)
+combinada = apostas.TIPOS_APOSTA[tipo]['numeros'] > 1
+alcance = st.sidebar.radio(
+    "Vale em:",
+    options=list(apostas.ALCANCES.keys()),
+    format_func=lambda a: apostas.ALCANCES[a],
+    index=1 if combinada else 0,
+    disabled=combinada,
+    key="apostas_alcance"
+)
+if combinada:
+    alcance = 'cercado'
+valor = st.sidebar.number_input("Valor por sorteio (R$):", min_value=0.5, value=1.0, step=0.5, key="apostas_valor")
+cotacao = st.sidebar.number_input(
+    "Cotação (x o valor):",
+    min_value=1.0,
+    value=float(apostas.MULTIPLICADORES[tipo]),
+    step=1.0,
+    key=f"apostas_cotacao_{tipo}"
+)
+
+exemplo = '01-05; 07 12' if tipo == 'duque_grupo' else ('01-05-09; 07 12 20' if combinada else '07 12 25')
+texto = st.text_area(
+    f"Apostas ({apostas.TIPOS_APOSTA[tipo]['nome']}):",
+    placeholder=f"Ex.: {exemplo}",
+    help="Duques e ternos: uma aposta por linha ou separadas por ';'. Demais tipos: um número por aposta.",
+    key="apostas_texto"
+)
+
+if not texto.strip():
+    st.info("Digite as apostas para conferir.")
+    st.stop()
+
+try:
+    matriz_apostas = apostas.parse_apostas(texto, tipo)
+except ValueError as e:
+    st.error(f"❌ Aposta inválida: {e}")
+    st.stop()
+
+df_loteria = df[df['loteria'] == loteria_selecionada]
+dias_periodo = PERIODOS_APOSTA[periodo]
+if dias_periodo:
+    desde = pd.Timestamp(df_loteria['data'].max()).normalize() - pd.Timedelta(days=dias_periodo - 1)
+    df_loteria = df_loteria[pd.to_datetime(df_loteria['data']) >= desde]
+_, milhares = apostas.get_matriz_resultados(df_loteria)
+
+if len(milhares) == 0:
+    st.warning(f"⚠️ Nenhum sorteio encontrado para **{loteria_selecionada}** no período.")
+    st.stop()
+
+avaliacao = apostas.avaliar_apostas(matriz_apostas, milhares, tipo, alcance, valor, {tipo: cotacao})
+resumo = apostas.resumir_apostas(matriz_apostas, avaliacao, tipo)
+
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    st.metric("Sorteios conferidos", len(milhares))
+with col2:
+    st.metric("Total apostado", f"R$ {resumo['custo'].sum():,.2f}")
+with col3:
+    st.metric("Total recebido", f"R$ {resumo['retorno'].sum():,.2f}")
+with col4:
+    lucro = resumo['lucro'].sum()
+    st.metric("Lucro", f"R$ {lucro:,.2f}", delta=f"{lucro / resumo['custo'].sum() * 100:.1f}%")
+
+st.subheader("📋 Resultado por aposta")
+st.dataframe(
+    resumo.assign(
+        retorno=resumo['retorno'].round(2),
+        lucro=resumo['lucro'].round(2),
+        roi=resumo['roi'].round(1)
+    ).rename(columns={
+        'aposta': 'Aposta',
+        'sorteios': 'Sorteios',
+        'sorteios_premiados': 'Sorteios premiados',
+        'retorno': 'Recebido (R$)',
+        'custo': 'Apostado (R$)',
+        'lucro': 'Lucro (R$)',
+        'roi': 'ROI (%)',
+    }),
+    use_container_width=True,
+    hide_index=True
+)
+
+if alcance == 'cercado' and not combinada:
+    st.caption("ℹ️ Do 1° ao 5° prêmio o valor é dividido entre os 5 prêmios: cada prêmio acertado paga 1/5 da cotação.")
+st.caption("ℹ️ Registros legados (sem número do prêmio) não entram na conferência.")
+st.caption("⚠️ Simulação sobre o histórico. Os resultados passados não garantem resultados futuros.")
@@ -120,9 +120,12 @@ if 'dados' not in st.session_state or st.session_state.dados is None:
 from modules.data_loader import (
     GRUPOS_ANIMAIS, DIA_CORES, 
     get_last_5_unique_dates, get_day_number, filter_5_day_cycle, get_day_color,
-    filter_day_data_by_prize
+    filter_day_data_by_prize, get_dezenas_por_grupo, GRUPO_ANIMAL, DEZENA_TEXTO
 )
 
+from modules import combinatorics, similares
+from modules.indices import get_indice
+
 df = st.session_state.dados
 
 # Sidebar - Filtro por Loteria (OBRIGATÓRIO)
@@ -155,6 +158,37 @@ if len(datas_5dias) == 0:
     st.warning(f"⚠️ Nenhum dado encontrado para a loteria **{loteria_selecionada}**.")
     st.stop()
 
+# Índice de duques/ternos de dezena (reconstruído apenas quando os dados mudam)
+indice_dezenas = get_indice('dezenas', df, combinatorics.build_indice_dezenas)
+
+# Ranking geral de duques e ternos de dezena da loteria
+with st.expander(f"🔗 Duques e Ternos de Dezena - {loteria_selecionada} (histórico)"):
+    col_duques, col_ternos = st.columns(2)
+    with col_duques:
+        top_duques = combinatorics.get_top_duques_dezena(indice_dezenas, loteria_selecionada, top_n=20)
+        if len(top_duques) > 0:
+            st.dataframe(
+                top_duques[['rank', 'combinacao', 'frequencia']].rename(columns={
+                    'rank': 'Rank', 'combinacao': 'Duque', 'frequencia': 'Frequência'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.caption("Nenhum duque de dezena encontrado.")
+    with col_ternos:
+        top_ternos = combinatorics.get_top_ternos_dezena(indice_dezenas, loteria_selecionada, top_n=20)
+        if len(top_ternos) > 0:
+            st.dataframe(
+                top_ternos[['rank', 'combinacao', 'frequencia']].rename(columns={
+                    'rank': 'Rank', 'combinacao': 'Terno', 'frequencia': 'Frequência'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.caption("Nenhum terno de dezena encontrado.")
+
 # Nomes dos dias com cores
 dias_config = [
     {"nome": "DIA 1 (MAIS RECENTE)", "classe": "day-header-1", "cor": DIA_CORES[1]},
@@ -248,29 +282,42 @@ for idx, data in enumerate(datas_5dias):
         with col1:
             st.markdown(f"### 📋 Tabela de Dezenas - DIA {dia_num}")
             
-            # Criar tabela de dezenas (usa dados filtrados)
-            dezenas_data = []
-            dezenas_found = {}
-            
-            for _, row in df_dia_filtrado.iterrows():
-                grupo = row['grupo']
-                milhar = str(row['milhar']).zfill(4)
-                dezena = milhar[-2:]
-                if grupo not in dezenas_found:
-                    dezenas_found[grupo] = []
-                dezenas_found[grupo].append(dezena)
-            
-            for grupo in range(1, 26):
-                animal = GRUPOS_ANIMAIS.get(grupo, '')
-                dezenas = ', '.join(dezenas_found.get(grupo, []))
-                dezenas_data.append({
-                    'Grupo': f"{grupo:02d}",
-                    'Nome': animal,
-                    'Dezenas': dezenas if dezenas else '—'
-                })
-            
-            df_dezenas = pd.DataFrame(dezenas_data)
+            # Criar tabela de dezenas (usa dados filtrados) com tabelas de consulta
+            dezenas_por_grupo = get_dezenas_por_grupo(df_dia_filtrado)
+            df_dezenas = pd.DataFrame({
+                'Grupo': [f"{g:02d}" for g in range(1, 26)],
+                'Nome': GRUPO_ANIMAL[1:],
+                'Dezenas': dezenas_por_grupo.replace('', '—').to_numpy()
+            })
             st.dataframe(df_dezenas, use_container_width=True, hide_index=True, height=400)
+            
+            # Duques de dezena no histórico da loteria (índice construído uma vez por versão dos dados)
+            with st.expander(f"🔗 Duques de dezena - DIA {dia_num}"):
+                dezenas_dia = sorted(set(DEZENA_TEXTO[df_dia_filtrado['milhar'].to_numpy(dtype=int) % 100]))
+                if dezenas_dia:
+                    dezena_sel = st.selectbox(
+                        "Dezena:", dezenas_dia, key=f"duque_dezena_{dia_num}",
+                        help="Dezenas que mais saíram junto com esta no mesmo sorteio (histórico completo da loteria)."
+                    )
+                    duques_dezena = combinatorics.get_duques_com_dezena(
+                        indice_dezenas, loteria_selecionada, int(dezena_sel), top_n=10
+                    )
+                    if len(duques_dezena) > 0:
+                        duques_dezena['parceira'] = duques_dezena['parceira'].apply(lambda x: f"{x:02d}")
+                        st.dataframe(
+                            duques_dezena[['rank', 'combinacao', 'parceira', 'frequencia']].rename(columns={
+                                'rank': 'Rank',
+                                'combinacao': 'Duque',
+                                'parceira': 'Parceira',
+                                'frequencia': 'Frequência'
+                            }),
+                            use_container_width=True,
+                            hide_index=True
+                        )
+                    else:
+                        st.caption("Nenhum duque com esta dezena no histórico.")
+                else:
+                    st.caption("Sem dezenas neste dia.")
         
         with col2:
             # Frequência de Pedras - Milhar
@@ -396,4 +443,70 @@ for idx, data in enumerate(datas_5dias):
     
     st.markdown("---")
 
+# Dias do histórico parecidos com o Dia 1 e o que saiu no dia seguinte a eles
+with st.expander(f"🔍 Dias parecidos com o Dia 1 ({datas_5dias[0].strftime('%d/%m/%Y')}) - {loteria_selecionada}"):
+    col_metrica, col_k, col_modo = st.columns(3)
+    with col_metrica:
+        metrica_similar = st.radio(
+            "Distância:",
+            options=list(similares.METRICAS_DISTANCIA.keys()),
+            format_func=lambda m: similares.METRICAS_DISTANCIA[m],
+            key="similares_metrica"
+        )
+    with col_k:
+        k_similar = st.slider("Dias parecidos:", min_value=3, max_value=30, value=10, key="similares_k")
+    with col_modo:
+        modo_similar = st.radio(
+            "Prêmios:",
+            options=list(combinatorics.MODOS_PREMIO.keys()),
+            format_func=lambda m: combinatorics.MODOS_PREMIO[m],
+            index=1,
+            key="similares_modo"
+        )
+    blocos_similar = st.multiselect(
+        "Comparar por:",
+        options=list(similares.BLOCOS.keys()),
+        default=list(similares.BLOCOS.keys()),
+        format_func=lambda b: {'grupo': 'Grupos', 'pedra': 'Pedras (milhar)', 'linha': 'Linhas'}[b],
+        key="similares_blocos"
+    )
+
+    indice_similares = get_indice(
+        f"similares_{modo_similar}", df,
+        lambda dados: similares.build_similares(dados, modo_similar),
+        similares.atualizar_similares
+    )
+    vizinhos = similares.buscar_similares(
+        indice_similares, loteria_selecionada, datas_5dias[0],
+        k=k_similar, metrica=metrica_similar, blocos=blocos_similar or None
+    )
+
+    if len(vizinhos) == 0:
+        st.caption("Histórico insuficiente para comparar.")
+    else:
+        col_vizinhos, col_depois = st.columns(2)
+        with col_vizinhos:
+            st.markdown("**📆 Dias mais parecidos**")
+            st.dataframe(
+                vizinhos.assign(
+                    data=vizinhos['data'].dt.strftime('%d/%m/%Y'),
+                    proxima_data=vizinhos['proxima_data'].dt.strftime('%d/%m/%Y')
+                )[['data', 'similaridade', 'proxima_data']].rename(columns={
+                    'data': 'Data', 'similaridade': 'Similaridade (%)', 'proxima_data': 'Dia seguinte'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+        with col_depois:
+            st.markdown("**➡️ O que saiu no dia seguinte**")
+            depois = similares.get_o_que_veio_depois(indice_similares, loteria_selecionada, vizinhos)
+            st.dataframe(
+                depois.assign(grupo=depois['grupo'].map(lambda g: f"{g:02d}")).rename(columns={
+                    'grupo': 'Grupo', 'animal': 'Animal', 'frequencia': 'Frequência',
+                    'dias': 'Dias', 'percentual': '% dos dias'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+
 st.caption("⚠️ Análise estatística para fins informativos. Cores indicam APENAS o dia, não representam frequência ou probabilidade.")
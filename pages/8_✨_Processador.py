@@ -4,6 +4,7 @@ Sistema adaptado para o novo escopo com ciclo de 5 dias
 """
 import streamlit as st
 import pandas as pd
+import numpy as np
 import re
 from datetime import datetime, date
 
@@ -58,7 +59,14 @@ st.markdown("""
 
 st.title("✨ Processador de Resultados")
 
-from modules.data_loader import GRUPOS_ANIMAIS, DIA_CORES, get_day_number, save_data_to_database, load_data_from_database
+from modules.data_loader import (
+    GRUPOS_ANIMAIS, DIA_CORES, GRUPO_ANIMAL, get_day_number, get_codigo_grupo, get_grupo_da_milhar,
+    validar_grupos, save_data_to_database, load_data_from_database, get_registros_inseridos,
+    HORARIOS_POR_LOTERIA, HORARIOS_PADRAO
+)
+from modules.indices import atualizar_indices, get_indice
+from modules.database import insert_alertas
+from modules import alertas
 
 # Inverter mapeamento para buscar grupo pelo nome
 ANIMAIS_GRUPOS = {v.upper(): k for k, v in GRUPOS_ANIMAIS.items()}
@@ -93,17 +101,8 @@ with col1:
         help="Cada loteria é analisada separadamente. Nunca misturar dados entre loterias."
     )
     
-    # Horários específicos por loteria (conforme documentação)
-    HORARIOS_POR_LOTERIA = {
-        "Nacional": ["02:00", "08:00", "10:00", "12:00", "15:00", "17:00", "21:00", "23:00"],
-        "Look GO": ["07:00", "09:00", "11:00", "14:00", "16:00", "18:00", "21:00", "23:00"],
-        "Capital": ["10:00", "11:00", "13:00", "14:00", "16:00", "18:00", "20:00", "22:00"],
-        "RJ": ["09:00", "11:00", "14:00", "16:00", "18:00", "21:00"],  # Horários RJ
-        "Federal": ["19:00"],  # Federal tem horário único
-    }
-    
-    # Seleção de horário (baseado na loteria selecionada)
-    horarios_loteria = HORARIOS_POR_LOTERIA.get(loteria_selecionada, ["11:00", "14:00", "18:00", "21:00"])
+    # Seleção de horário (horários específicos da loteria, conforme documentação)
+    horarios_loteria = HORARIOS_POR_LOTERIA.get(loteria_selecionada, HORARIOS_PADRAO)
     horario_selecionado = st.selectbox(
         "⏰ Horário:", 
         horarios_loteria,
@@ -217,22 +216,16 @@ if processar and resultados_texto:
                     if animal_nome in linha_limpa.upper():
                         grupo = animal_grupo
                         break
-                else:
-                    # Tentar deduzir da dezena (últimos 2 dígitos)
-                    dezena = milhar % 100
-                    grupo = ((dezena - 1) % 25) + 1 if dezena > 0 else 25
-            
-            animal = GRUPOS_ANIMAIS.get(grupo, 'Desconhecido')
             
+            # Grupo não informado (0) é deduzido da dezena depois, para todas as linhas de uma vez
             resultados_processados.append({
                 'data': data_resultado,
                 'loteria': loteria_selecionada,
                 'horario': horario_selecionado,
                 'premio': premio,
-                'grupo': grupo,
+                'grupo': grupo or 0,
                 'centena': centena,
                 'milhar': milhar,
-                'animal': animal,
                 'linha_original': linha
             })
             
@@ -246,8 +239,20 @@ if processar and resultados_texto:
         
         # Criar DataFrame e SALVAR no session_state
         df_novos = pd.DataFrame(resultados_processados)
+        
+        # Deduzir grupo da dezena (últimos 2 dígitos) e nome do animal por tabela de consulta
+        milhares = df_novos['milhar'].to_numpy()
+        grupos = df_novos['grupo'].to_numpy()
+        df_novos['grupo'] = np.where(grupos == 0, get_grupo_da_milhar(milhares), grupos)
+        df_novos['animal'] = GRUPO_ANIMAL[get_codigo_grupo(df_novos['grupo'])]
         st.session_state.df_processados = df_novos
         
+        # Validar grupo informado x dezena da milhar
+        divergentes = ~validar_grupos(df_novos['grupo'], milhares)
+        if divergentes.any():
+            linhas_div = ", ".join(f"{m:04d} (G.{g:02d})" for m, g in zip(milhares[divergentes], df_novos['grupo'][divergentes]))
+            st.warning(f"⚠️ {int(divergentes.sum())} resultado(s) com grupo diferente da dezena da milhar: {linhas_div}")
+        
         # Preview - Formatar números com zeros à esquerda para visualização
         st.markdown("### 📋 Resultados Processados")
         
@@ -301,6 +306,13 @@ if 'df_processados' in st.session_state and st.session_state.df_processados is n
                 df_add = df_novos[['data', 'loteria', 'horario', 'premio', 'grupo', 'centena', 'milhar', 'animal']].copy()
                 df_add['data'] = pd.to_datetime(df_add['data'])
                 
+                # Contadores das regras de alerta no estado anterior à inserção
+                if st.session_state.get('dados') is not None and len(st.session_state.dados) > 0:
+                    get_indice('alertas', st.session_state.dados, alertas.build_alertas, alertas.atualizar_alertas)
+                
+                # Dataset antes da inserção: só os índices construídos sobre ele recebem os novos registros
+                df_anterior = st.session_state.get('dados')
+                
                 # Salvar no banco de dados
                 inseridos, duplicados, erros = save_data_to_database(df_add)
                 
@@ -308,6 +320,21 @@ if 'df_processados' in st.session_state and st.session_state.df_processados is n
                 st.session_state.dados = load_data_from_database()
                 st.session_state.dados_loaded = True
                 
+                # Atualizar índices em cache só com os registros que entraram (sem duplicados)
+                df_inseridos = get_registros_inseridos(df_add, df_anterior, st.session_state.dados)
+                atualizados = atualizar_indices(df_inseridos, st.session_state.dados, df_anterior)
+                
+                # Alertas disparados pelas regras com os novos registros
+                if 'alertas' in atualizados:
+                    disparados = get_indice(
+                        'alertas', st.session_state.dados, alertas.build_alertas, alertas.atualizar_alertas
+                    )['disparados']
+                    insert_alertas(disparados)
+                    for descricao in disparados.get('descricao', []):
+                        st.warning(f"🚨 {descricao}")
+                elif len(df_inseridos) > 0 and df_anterior is not None and len(df_anterior) > 0:
+                    st.info("ℹ️ Regras de alerta não avaliadas: os registros são anteriores ao último resultado da loteria (retroativos).")
+                
                 # Limpar dados processados
                 st.session_state.df_processados = None
                 
@@ -424,7 +451,7 @@ if 'dados' in st.session_state and st.session_state.dados is not None:
         with col2:
             del_data = st.date_input("Data:", key="del_data")
         with col3:
-            del_horarios = HORARIOS_POR_LOTERIA.get(del_loteria, ["11:00", "14:00", "18:00", "21:00"])
+            del_horarios = HORARIOS_POR_LOTERIA.get(del_loteria, HORARIOS_PADRAO)
             del_horario = st.selectbox("Horário:", del_horarios, key="del_horario")
         
         # Mostrar quantos registros serão afetados
@@ -83,52 +83,17 @@ st.markdown("""
 st.title("🐾 Tabela dos 25 Bichos")
 
 from modules.data_loader import (
-    GRUPOS_ANIMAIS, DIA_CORES, 
-    filter_5_day_cycle, get_grupo_days, get_day_color
+    GRUPOS_ANIMAIS, DIA_CORES, EMOJIS, DEZENAS,
+    filter_5_day_cycle, get_last_5_unique_dates, get_day_color
 )
 
-# Emojis para cada animal
-EMOJIS = {
-    1: '🦢', 2: '🦅', 3: '🐴', 4: '🦋', 5: '🐕',
-    6: '🐐', 7: '🐏', 8: '🐫', 9: '🐍', 10: '🐰',
-    11: '🐎', 12: '🐘', 13: '🐓', 14: '🐱', 15: '🐊',
-    16: '🦁', 17: '🐵', 18: '🐷', 19: '🦚', 20: '🦃',
-    21: '🐂', 22: '🐅', 23: '🐻', 24: '🦌', 25: '🐄'
-}
-
-# Dezenas de cada grupo
-DEZENAS = {
-    1: ['01', '02', '03', '04'],
-    2: ['05', '06', '07', '08'],
-    3: ['09', '10', '11', '12'],
-    4: ['13', '14', '15', '16'],
-    5: ['17', '18', '19', '20'],
-    6: ['21', '22', '23', '24'],
-    7: ['25', '26', '27', '28'],
-    8: ['29', '30', '31', '32'],
-    9: ['33', '34', '35', '36'],
-    10: ['37', '38', '39', '40'],
-    11: ['41', '42', '43', '44'],
-    12: ['45', '46', '47', '48'],
-    13: ['49', '50', '51', '52'],
-    14: ['53', '54', '55', '56'],
-    15: ['57', '58', '59', '60'],
-    16: ['61', '62', '63', '64'],
-    17: ['65', '66', '67', '68'],
-    18: ['69', '70', '71', '72'],
-    19: ['73', '74', '75', '76'],
-    20: ['77', '78', '79', '80'],
-    21: ['81', '82', '83', '84'],
-    22: ['85', '86', '87', '88'],
-    23: ['89', '90', '91', '92'],
-    24: ['93', '94', '95', '96'],
-    25: ['97', '98', '99', '00']
-}
-
 if 'dados' not in st.session_state or st.session_state.dados is None:
     st.warning("⚠️ Nenhuma base de dados carregada. Acesse **✨ Processador** para inserir resultados.")
     st.stop()
 
+from modules import atrasos, presenca, sequencias
+from modules.indices import get_indice
+
 df = st.session_state.dados
 
 # Sidebar - Filtro por Loteria (OBRIGATÓRIO)
@@ -156,6 +121,20 @@ st.info("💡 **Importante:** As cores indicam EXCLUSIVAMENTE em quais dias o bi
 
 st.divider()
 
+# Índice de atrasos (mantido incrementalmente a cada inserção)
+indice_atrasos = get_indice('atrasos', df, atrasos.build_atrasos, atrasos.atualizar_atrasos)
+
+# Máscaras de presença dos 5 dias (regra de prêmio já aplicada)
+datas_ciclo = get_last_5_unique_dates(df, loteria_selecionada)
+indice_presenca = get_indice('presenca', df, presenca.build_presenca, presenca.atualizar_presenca)
+mascaras_ciclo = presenca.get_mascaras_ciclo(indice_presenca, loteria_selecionada, datas_ciclo)
+
+# Aparições de cada grupo por dia do ciclo (um ponto por aparição)
+contagens_ciclo = presenca.get_contagens_ciclo(df, loteria_selecionada, datas_ciclo)
+
+# Sequências de dias com/sem cada grupo (mantidas incrementalmente a cada inserção)
+indice_sequencias = get_indice('sequencias', df, sequencias.build_sequencias, sequencias.atualizar_sequencias)
+
 # Exibir tabela de bichos
 st.subheader(f"📋 Bichos - {loteria_selecionada}")
 
@@ -168,8 +147,17 @@ for linha in range(5):
         emoji = EMOJIS.get(grupo, '🐾')
         dezenas = ', '.join(DEZENAS.get(grupo, []))
         
-        # Obter dias em que o grupo apareceu (cores automáticas)
-        dias_apareceu = get_grupo_days(df, loteria_selecionada, grupo)
+        # Obter dias em que o grupo apareceu, repetidos a cada aparição (cores automáticas)
+        dias_apareceu = [
+            dia_num
+            for dia_num in presenca.get_dias_grupo(mascaras_ciclo, grupo)
+            for _ in range(contagens_ciclo[dia_num - 1, grupo])
+        ]
+        atraso = atrasos.get_atraso(indice_atrasos, loteria_selecionada, 'grupo', grupo)
+        atraso_txt = f"⏳ {atraso} sorteios" if atraso is not None else "⏳ nunca saiu"
+        selo_sequencia = sequencias.get_selo_sequencia(
+            sequencias.get_sequencia(indice_sequencias, loteria_selecionada, grupo)
+        )
         
         with cols[col_idx]:
             # Gerar HTML dos círculos de cores
@@ -189,11 +177,64 @@ for linha in range(5):
                 <div class="bicho-nome">{animal}</div>
                 <div style="font-size: 0.7rem; color: #888; margin-top: 3px;">{dezenas}</div>
                 <div class="day-dots">{dots_html}</div>
+                <div style="font-size: 0.7rem; color: #888; margin-top: 5px;">{atraso_txt}</div>
+                <div style="font-size: 0.7rem; color: #ccc; margin-top: 2px; min-height: 1em;">{selo_sequencia}</div>
             </div>
             """, unsafe_allow_html=True)
 
 st.divider()
 
+# Maiores atrasos (histórico completo da loteria)
+st.subheader("⏳ Maiores Atrasos")
+st.caption("Quantidade de sorteios desde a última aparição, considerando todos os prêmios do histórico da loteria.")
+
+tabs_atraso = st.tabs(["🐾 Grupos", "🔟 Dezenas", "💯 Centenas", "🔢 Milhares"])
+for tab, tipo in zip(tabs_atraso, ['grupo', 'dezena', 'centena', 'milhar']):
+    with tab:
+        maiores = atrasos.get_maiores_atrasos(indice_atrasos, loteria_selecionada, tipo, top_n=15)
+        if len(maiores) > 0:
+            maiores['ultima_data'] = maiores['ultima_data'].dt.strftime('%d/%m/%Y').fillna('Nunca saiu')
+            colunas = [f'{tipo}_fmt'] + (['animal'] if tipo == 'grupo' else []) + ['atraso', 'ultima_data']
+            st.dataframe(
+                maiores[colunas].rename(columns={
+                    f'{tipo}_fmt': tipo.capitalize(),
+                    'animal': 'Animal',
+                    'atraso': 'Atraso (sorteios)',
+                    'ultima_data': 'Última Aparição'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("Nenhum dado encontrado para esta loteria.")
+
+# Sequências de dias (histórico completo da loteria)
+st.subheader("🔁 Sequências de Dias")
+st.caption(
+    f"Dias seguidos (com resultados da loteria) em que o grupo saiu ou não saiu, em qualquer prêmio. "
+    f"🔥/🧊 nos cards a partir de {sequencias.SEQUENCIA_MINIMA} dias; 🏆 = igual ao recorde do histórico."
+)
+tabela_sequencias = sequencias.get_tabela_sequencias(indice_sequencias, loteria_selecionada)
+if len(tabela_sequencias) > 0:
+    st.dataframe(
+        tabela_sequencias.sort_values(['presenca', 'ausencia'], ascending=False).assign(
+            grupo=lambda t: t['grupo'].map(lambda g: f"{g:02d}")
+        ).rename(columns={
+            'grupo': 'Grupo',
+            'animal': 'Animal',
+            'presenca': 'Dias seguidos saindo',
+            'ausencia': 'Dias seguidos sem sair',
+            'max_presenca': 'Recorde saindo',
+            'max_ausencia': 'Recorde sem sair',
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+else:
+    st.info("Nenhum dado encontrado para esta loteria.")
+
+st.divider()
+
 # Resumo estatístico
 st.subheader("📊 Resumo dos Últimos 5 Dias")
 
@@ -41,3 +41,30 @@ CREATE POLICY "Allow public update" ON resultados
 -- Política para permitir exclusão pública
 CREATE POLICY "Allow public delete" ON resultados
     FOR DELETE USING (true);
+
+-- Alertas disparados pelas regras (modules/alertas.py)
+CREATE TABLE IF NOT EXISTS alertas (
+    id SERIAL PRIMARY KEY,
+    data DATE NOT NULL,
+    loteria TEXT NOT NULL,
+    horario TEXT NOT NULL,
+    regra TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    valor INTEGER NOT NULL,
+    metrica INTEGER NOT NULL,
+    descricao TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT TIMEZONE('utc', NOW()),
+    
+    -- O mesmo alerta só é gravado uma vez por dia
+    UNIQUE(data, loteria, regra, valor)
+);
+
+CREATE INDEX IF NOT EXISTS idx_alertas_data ON alertas(data);
+
+ALTER TABLE alertas ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Allow public read" ON alertas
+    FOR SELECT USING (true);
+
+CREATE POLICY "Allow public insert" ON alertas
+    FOR INSERT WITH CHECK (true);